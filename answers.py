@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+"""Accepted-answer sets for grammar fill-in drills.
+
+A drill's ``answer`` is one surface form, but learners legitimately type
+others: different spacing, the whole word including the stem printed in the
+prompt, the form actually used in ``full_sentence`` when the ending merges
+into the stem (울 + ㄴ들 → 운들), common contractions (것을 → 걸, 반면에 →
+반면), and 해요체/합니다체 instead of a plain sentence-final -다.
+
+expand() turns one drill into the set of normalized forms it accepts. The
+sets for all of grammar.json are computed once and cached in .cache/, keyed
+by a hash of the data, so checking an answer is a set lookup.
+
+    python answers.py build               # precompute the cache
+    python answers.py regrade log.jsonl   # re-grade logged fill-in answers
+"""
+
+import argparse
+import json
+import re
+import sys
+from collections import defaultdict
+
+import bundle
+import grammar
+
+CACHE_FILE = bundle.CACHE_DIR / "answer_forms.json"
+RULES_VERSION = 3  # bump when expand() changes, to invalidate the cache
+
+# Hangul syllables are composed as 0xAC00 + (initial * 21 + medial) * 28 + final
+_SYLLABLE_BASE = 0xAC00
+_SYLLABLE_LAST = 0xD7A3
+_FINALS = " ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ"
+_NO_FINAL, _N, _D, _L, _B, _S, _SS, _H = 0, 4, 7, 8, 17, 19, 20, 27
+# Medial vowel indices
+_A, _AE, _EO, _E, _YEO, _O, _WA, _OE, _WAE, _U, _WO, _EU, _I = 0, 1, 4, 5, 6, 8, 9, 11, 10, 13, 14, 18, 20
+_BRIGHT = {_A, 2, _O}  # ㅏ ㅑ ㅗ take -아, everything else -어
+# Stem vowel + 아/어 → contracted vowel
+_CONTRACT = {_A: _A, _EO: _EO, _YEO: _YEO, _AE: _AE, _E: _E, _O: _WA, _U: _WO, _I: _YEO, _OE: _WAE}
+
+# Irregular stems need a lexicon to tell apart; these lists cover the common ones
+_D_IRREGULAR = {"듣", "걷", "싣", "깨닫", "일컫", "붇", "긷"}   # ㄷ → ㄹ before a vowel: 들어요
+_B_REGULAR = {"잡", "입", "씹", "업", "뽑", "좁", "접", "집", "수줍"}  # other ㅂ → 우: 어려워요
+_S_IRREGULAR = {"짓", "낫", "붓", "긋", "잇", "젓"}  # ㅅ drops before a vowel: 지어요
+_S_REGULAR = {"씻", "웃", "벗", "빼앗", "솟", "빗"}
+_H_REGULAR = {"좋", "놓", "넣", "낳", "닿", "쌓", "많", "싫", "괜찮", "않"}  # other ㅎ adjectives drop it
+_REU_REGULAR = {"따르", "치르", "들르"}  # other 르 stems double the ㄹ: 몰라요
+# Nouns that take the copula at the end of a pattern (셈이다); X이다 is otherwise
+# as likely a causative or passive verb (먹이다, 보이다)
+COPULA_NOUNS = ("셈", "법", "마련", "탓", "뿐", "따름", "터", "것", "때문", "모양", "지경",
+                "노릇", "나름", "십상", "일쑤", "판", "참", "편", "예정", "생각")
+
+# Contractions a learner may use instead of the full form (long → short)
+CONTRACTIONS = [
+    ("것을", "걸"), ("것이", "게"), ("것은", "건"),
+    ("터인데", "텐데"), ("터이니", "테니"),
+    ("하여", "해"), ("되어", "돼"), ("데다가", "데다"),
+]
+# Nouns after which the particle 에 is optional (반면에 = 반면)
+OPTIONAL_E = ("반면", "대신", "데")
+
+_BLANK = re.compile(r"_{2,}")
+_HINT = re.compile(r"\s*\([^)]*\)\s*$")
+_TRAILING_PUNCT = ".!?,~…"
+
+
+def _split(ch: str) -> tuple[int, int, int] | None:
+    code = ord(ch)
+    if not _SYLLABLE_BASE <= code <= _SYLLABLE_LAST:
+        return None
+    code -= _SYLLABLE_BASE
+    return code // 588, (code // 28) % 21, code % 28
+
+
+def _join(initial: int, medial: int, final: int) -> str:
+    return chr(_SYLLABLE_BASE + (initial * 21 + medial) * 28 + final)
+
+
+def _with_final(ch: str, final: int) -> str:
+    parts = _split(ch)
+    return _join(parts[0], parts[1], final) if parts else ch
+
+
+def normalize(text: str) -> str:
+    """Canonical form for comparison: no whitespace, no pattern marks or end punctuation."""
+    text = "".join(text.split())
+    text = text.lstrip("-~")
+    return text.rstrip(_TRAILING_PUNCT)
+
+
+def _infinitive(stem: str) -> str | None:
+    """Stem + -아/어 with the usual vowel contractions (하 → 해, 지 → 져, 쓰 → 써)
+    and the ㄷ, ㅂ, ㅅ and 르 irregulars; None for a ㅅ or ㅎ stem it can't place."""
+    last = _split(stem[-1])
+    if last is None:
+        return stem + "어"
+    initial, medial, final = last
+    if stem.endswith("하") and final == _NO_FINAL:
+        return stem[:-1] + "해"
+    if final == _D and (stem[-1] in _D_IRREGULAR or stem[-2:] in _D_IRREGULAR):
+        return stem[:-1] + _with_final(stem[-1], _L) + ("아" if medial in _BRIGHT else "어")
+    if final == _B and not any(stem.endswith(regular) for regular in _B_REGULAR):
+        # 돕다 and 곱다 keep the bright vowel (도와요); the rest contract to 워
+        opened = stem[:-1] + _with_final(stem[-1], _NO_FINAL)
+        return opened + ("와" if stem[-1] in "돕곱" else "워")
+    if final == _S and stem[-1] in _S_IRREGULAR:
+        return stem[:-1] + _with_final(stem[-1], _NO_FINAL) + ("아" if medial in _BRIGHT else "어")
+    if final == _S and not any(stem.endswith(regular) for regular in _S_REGULAR):
+        return None
+    if final == _H and not any(stem.endswith(regular) for regular in _H_REGULAR):
+        return None
+    if final != _NO_FINAL:
+        return stem + ("아" if medial in _BRIGHT else "어")
+    if stem.endswith("르") and len(stem) > 1 and not any(stem.endswith(r) for r in _REU_REGULAR):
+        prev = _split(stem[-2])
+        if prev is not None and prev[2] == _NO_FINAL:
+            return stem[:-2] + _with_final(stem[-2], _L) + ("라" if prev[1] in _BRIGHT else "러")
+    if medial == _EU:
+        prev = _split(stem[-2]) if len(stem) > 1 else None
+        medial = _A if prev and prev[1] in _BRIGHT else _EO
+        return stem[:-1] + _join(initial, medial, _NO_FINAL)
+    if medial in _CONTRACT:
+        return stem[:-1] + _join(initial, _CONTRACT[medial], _NO_FINAL)
+    return stem + "어"
+
+
+def _formal(stem: str) -> str:
+    """Stem + -ㅂ니다/-습니다 (ㄹ stems drop the ㄹ: 알 → 압니다)."""
+    last = _split(stem[-1])
+    if last is None:
+        return stem + "습니다"
+    if last[2] in (_NO_FINAL, _L):
+        return stem[:-1] + _with_final(stem[-1], _B) + "니다"
+    return stem + "습니다"
+
+
+def polite_forms(plain: str) -> set[str]:
+    """해요체 and 합니다체 forms of a plain declarative ending in -다.
+
+    Empty when the stem can't be told from the plain form without a lexicon:
+    산다 is 사다 or 살다, X이다 is a noun + 이다 or a verb like 보이다, and
+    의사다 is a noun + 이다 like 자다 is a verb.
+    """
+    if not plain.endswith("다") or len(plain) < 2:
+        return set()
+    body = plain[:-1]
+    last = _split(body[-1])
+    if last is None:
+        return set()
+    if last[2] == _SS or body.endswith("겠"):
+        # Past -았/었- and future -겠- take -어요/-습니다 directly
+        return {body + "어요", body + "습니다"}
+    if body == "이" or body.endswith(COPULA_NOUNS + tuple(noun + "이" for noun in COPULA_NOUNS)):
+        # Copula: 셈이다 → 셈이에요; after a vowel 예요, and 의사다 drops 이 altogether
+        noun = body[:-1] if body.endswith("이") else body
+        if noun and _split(noun[-1]) and _split(noun[-1])[2] == _NO_FINAL:
+            return {noun + "예요", noun + "입니다"}
+        return {noun + "이에요", noun + "입니다"}
+    if body.endswith("이"):
+        return set()
+    if body.endswith("는") and len(body) > 1:
+        stem = body[:-1]  # 먹는다
+    elif last[2] == _N:
+        # 전해진다 → 전해지, 한다 → 하, 모른다 → 모르; any other vowel stem
+        # could also be an ㄹ stem that dropped its ㄹ (만든다, 산다)
+        stem = body[:-1] + _with_final(body[-1], _NO_FINAL)
+        if not stem.endswith(("지", "하", "르")):
+            return set()
+    elif last[2] == _NO_FINAL and last[1] != _EU and not body.endswith("하"):
+        return set()  # 의사다 (copula) and 자다 (verb) look alike; adjectives here end in 으/르
+    else:
+        stem = body  # adjective or dictionary form
+    infinitive = _infinitive(stem)
+    if infinitive is None:
+        return set()
+    return {infinitive + "요", _formal(stem)}
+
+
+def _contractions(form: str) -> set[str]:
+    out = {form}
+    for long, short in CONTRACTIONS:
+        for text in list(out):
+            if long in text:
+                out.add(text.replace(long, short))
+    for noun in OPTIONAL_E:
+        if form == noun:
+            out.add(noun + "에")
+        elif form == noun + "에":
+            out.add(noun)
+    return out
+
+
+def _prompt_parts(drill: dict) -> tuple[str, str]:
+    """The prompt sentence split around its blank."""
+    prompt = drill["prompt"].split(":", 1)[-1].strip()
+    prompt = _HINT.sub("", prompt)
+    pieces = _BLANK.split(prompt, maxsplit=1)
+    if len(pieces) == 1:
+        return prompt, ""
+    return pieces[0], pieces[1]
+
+
+def _sentence_fill(before: str, after: str, sentence: str, answer: str) -> tuple[str, str] | None:
+    """(text filling the blank, whole word around it) as written in full_sentence.
+
+    The fill can swallow part of the stem when the ending merges into it
+    (울___들 + ㄴ → 운들), so it is whatever differs between the prompt and
+    the sentence.
+    """
+    start = 0
+    while start < min(len(before), len(sentence)) and before[start] == sentence[start]:
+        start += 1
+    end = 0
+    limit = min(len(after), len(sentence) - start)
+    while end < limit and after[-1 - end] == sentence[-1 - end]:
+        end += 1
+    stop = len(sentence) - end
+    middle = sentence[start:stop]
+    # Only trust short alignments; a rewritten sentence would yield a long middle
+    if not middle.strip() or len(middle) > len(answer) + 2:
+        return None
+    while start > 0 and not sentence[start - 1].isspace():
+        start -= 1
+    while stop < len(sentence) and not sentence[stop].isspace():
+        stop += 1
+    return middle, sentence[start:stop]
+
+
+def expand(drill: dict) -> set[str]:
+    """All normalized forms accepted for one fill-in drill."""
+    answer = drill["answer"].strip()
+    before, after = _prompt_parts(drill)
+    stem = re.search(r"(\S*)$", before).group(1)  # word piece glued to the blank
+    tail = re.match(r"(\S*)", after).group(1)
+    sentence_final = after.strip(" " + _TRAILING_PUNCT) == ""
+
+    fills = {answer}  # what goes in the blank
+    words = set()     # the learner may type the whole word instead
+    if answer[:1] not in "ㄴㄹㅂ":
+        joined = stem + answer + tail
+    elif stem:
+        # Pattern-style answer (ㄹ라): merge it onto the stem's last syllable
+        final = _FINALS.index(answer[0])
+        joined = stem[:-1] + _with_final(stem[-1], final) + answer[1:] + tail
+    else:
+        joined = ""
+    actual = _sentence_fill(before, after, drill.get("full_sentence", ""), answer)
+    if actual:
+        fills.add(actual[0])
+        words.add(actual[1])
+        # The sentence shows how the word is really written: 울 + 은 + 들 is 운들, not 울은들
+        if normalize(joined) != normalize(actual[1]):
+            joined = ""
+    words.add(joined)
+
+    forms = {normalize(f) for f in fills | words}
+    if sentence_final:
+        for form in list(forms):
+            forms |= polite_forms(form)
+    accepted: set[str] = set()
+    for form in forms:
+        accepted |= _contractions(form)
+    accepted.discard("")
+    return accepted
+
+
+def _data_key() -> str:
+    return f"v{RULES_VERSION}:{bundle.digest(grammar.DATA_FILE)}"
+
+
+_index: tuple[int, dict[str, set[str]]] | None = None  # (grammar.json mtime_ns, forms)
+
+
+def _build() -> dict[str, set[str]]:
+    forms = {}
+    for entries in grammar.load_grammar().values():
+        for entry in entries:
+            drill = entry.get("drill")
+            if drill:
+                forms[drill["prompt"]] = expand(drill)
+    return forms
+
+
+def index() -> dict[str, set[str]]:
+    """Accepted forms for every drill in grammar.json, keyed by drill prompt."""
+    global _index
+    mtime = bundle.mtime_ns(grammar.DATA_FILE)
+    if _index is not None and _index[0] == mtime:
+        return _index[1]
+    key = _data_key()
+    forms = None
+    cached = bundle.read_cache(CACHE_FILE)
+    if cached is not None:
+        if cached.get("key") == key:
+            forms = {prompt: set(values) for prompt, values in cached["forms"].items()}
+    if forms is None:
+        forms = _build()
+        payload = {"key": key, "forms": {p: sorted(v) for p, v in forms.items()}}
+        bundle.write_cache(CACHE_FILE, payload, indent=1)
+    _index = (mtime, forms)
+    return forms
+
+
+def is_correct(drill: dict, user_answer: str) -> bool:
+    """Check a fill-in answer against every accepted form of the drill."""
+    forms = index().get(drill["prompt"])
+    if forms is None:  # a drill not in grammar.json (e.g. unmerged extras)
+        forms = expand(drill)
+    return normalize(user_answer) in forms
+
+
+def regrade(log_lines, data: dict[str, list[dict]]) -> dict[str, dict[str, int]]:
+    """Re-grade logged fill-in answers; returns per-pattern counts.
+
+    Each log line is JSON with ``card_id`` and ``fill_answer`` (as written by
+    headless.py), plus ``fill_correct`` if the original grade is known.
+    """
+    stats: dict[str, dict[str, int]] = defaultdict(lambda: {"answers": 0, "was": 0, "now": 0})
+    for line in log_lines:
+        line = line.strip()
+        if not line:
+            continue
+        record = json.loads(line)
+        if "fill_answer" not in record or not record["card_id"].startswith("grammar:"):
+            continue
+        _, category, idx = record["card_id"].split(":", 2)
+        entries = data.get(category, [])
+        if not idx.isdigit() or int(idx) >= len(entries) or "drill" not in entries[int(idx)]:
+            continue
+        entry = entries[int(idx)]
+        counts = stats[entry["pattern"]]
+        counts["answers"] += 1
+        was = record.get("fill_correct")
+        if was is None:
+            was = record["fill_answer"].strip() == entry["drill"]["answer"]
+        counts["was"] += bool(was)
+        counts["now"] += is_correct(entry["drill"], record["fill_answer"])
+    return dict(stats)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Accepted answers for grammar fill-in drills.")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="precompute the accepted-form cache")
+    regrade_cmd = sub.add_parser("regrade", help="re-grade a JSONL log of fill-in answers")
+    regrade_cmd.add_argument("log", help="JSONL file, or - for stdin")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        forms = index()
+        total = sum(len(v) for v in forms.values())
+        print(f"{len(forms)} drills, {total} accepted forms -> {CACHE_FILE}")
+        return
+
+    source = sys.stdin if args.log == "-" else open(args.log, encoding="utf-8")
+    with source:
+        stats = regrade(source, grammar.load_grammar())
+    answers = sum(s["answers"] for s in stats.values())
+    was = sum(s["was"] for s in stats.values())
+    now = sum(s["now"] for s in stats.values())
+    for pattern, s in sorted(stats.items(), key=lambda kv: kv[1]["was"] - kv[1]["now"]):
+        if s["now"] != s["was"]:
+            print(f"  {pattern}: {s['was']}/{s['answers']} -> {s['now']}/{s['answers']}")
+    print(f"{len(stats)} patterns, {answers} answers: {was} correct before, {now} after")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+"""Throughput of importer.py on a synthetic review log.
+
+    python benchmarks/bulk_import.py [--rows 1000000] [--format csv|jsonl]
+
+The log cycles through every vocab and grammar card by headword, one
+review per card per simulated day, with mixed ratings.
+"""
+
+import argparse
+import csv
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import grammar
+import importer
+import vocab
+from srs import SRSEngine, DAY
+
+START = 1_600_000_000
+
+
+def write_log(path: Path, rows: int, fmt: str, seed: int = 0) -> None:
+    rng = random.Random(seed)
+    words = [e["korean"] for entries in vocab.load_vocab().values() for e in entries]
+    words += [e["pattern"] for entries in grammar.load_grammar().values() for e in entries]
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f) if fmt == "csv" else None
+        if writer:
+            writer.writerow(["korean", "rating", "reviewed_at"])
+        for n in range(rows):
+            day, k = divmod(n, len(words))
+            row = (words[k], rng.choice("1233334"), START + day * DAY + k)
+            if writer:
+                writer.writerow(row)
+            else:
+                f.write(json.dumps(dict(zip(("korean", "rating", "reviewed_at"), row)),
+                                   ensure_ascii=False) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--format", choices=["csv", "jsonl"], default="csv")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        log = Path(tmp) / f"revlog.{args.format}"
+        write_log(log, args.rows, args.format)
+        engine = SRSEngine(Path(tmp) / "progress.json", autosave=False)
+        matcher = importer.CardMatcher(vocab.load_vocab(), grammar.load_grammar())
+
+        report = importer.import_history(engine, importer.read_rows(log), matcher)
+        began = time.perf_counter()
+        engine.save()
+        saved = time.perf_counter() - began
+
+    print(f"{report.rows:,} rows, {report.applied:,} applied, "
+          f"{sum(report.unmatched.values()):,} unmatched, {len(engine.cards):,} cards")
+    print(f"import {report.seconds:.2f}s ({report.rate:,.0f} rows/s), save {saved:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Cold start from the source tree vs from the zipapp (python build.py first).
+
+    python benchmarks/cold_start.py [--archive dist/korean-coach.pyz] [--repeat 10]
+
+Runs alternate between the two, and the best of --repeat is reported. Each
+run is a fresh interpreter that imports the app and loads everything a
+first drill needs: vocab, grammar, and the answer-form and xref indexes.
+Both sides use their prebuilt indexes (.cache/ in the tree, the archive's own).
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+START = """
+import sys, time
+sys.path.insert(0, {path!r})
+start = time.perf_counter()
+import main, vocab, grammar, answers, xref
+vocab.load_vocab(); grammar.load_grammar(); answers.index(); xref.index()
+print(time.perf_counter() - start)
+"""
+
+
+def cold_start(path: Path) -> float:
+    code = START.format(path=str(path))
+    result = subprocess.run([sys.executable, "-c", code], cwd=path.parent, check=True,
+                            capture_output=True, text=True)
+    return float(result.stdout)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare cold start: source tree vs zipapp.")
+    parser.add_argument("--archive", type=Path, default=ROOT / "dist" / "korean-coach.pyz")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    cold_start(ROOT)  # make sure the tree's bytecode and .cache/ are current
+    paths = {"source": ROOT, "zipapp": args.archive.resolve()}
+    best = dict.fromkeys(paths, float("inf"))
+    for _ in range(args.repeat):
+        for label, path in paths.items():
+            best[label] = min(best[label], cold_start(path))
+    for label, seconds in best.items():
+        print(f"{label:<8} {seconds * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
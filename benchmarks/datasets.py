@@ -0,0 +1,76 @@
+"""Synthetic datasets at multiples of the real content size, for benchmarks."""
+
+import json
+import random
+from dataclasses import asdict
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from srs import Card, DAY
+
+DATA = Path(__file__).parent.parent / "data"
+
+
+def _scaled(data: dict[str, list[dict]], scale: int) -> dict[str, list[dict]]:
+    """Copy every category *scale* times; copies get a suffixed name."""
+    out = {}
+    for k in range(scale):
+        suffix = "" if k == 0 else f" #{k}"
+        for cat, entries in data.items():
+            out[cat + suffix] = entries
+    return out
+
+
+def _progress(card_ids: list[str], rng: random.Random, now: float) -> dict[str, dict]:
+    """Review state for roughly 60% of *card_ids*, spread over the next month."""
+    progress = {}
+    for cid in card_ids:
+        if rng.random() > 0.6:
+            continue
+        reviews = rng.randint(1, 30)
+        card = Card(
+            card_id=cid,
+            ease_factor=round(rng.uniform(1.3, 3.0), 2),
+            interval_days=round(rng.uniform(0.007, 60), 3),
+            repetitions=rng.randint(0, 8),
+            next_review=now + rng.uniform(-5, 30) * DAY,
+            last_review=now - rng.uniform(0, 30) * DAY,
+            total_reviews=reviews,
+            correct_count=rng.randint(0, reviews),
+        )
+        progress[cid] = asdict(card)
+    return progress
+
+
+def build(scale: int, out_dir: Path, seed: int = 0, now: float = 1_800_000_000.0) -> dict[str, Path]:
+    """Write vocab/grammar/vocab_extra/progress files at *scale* into *out_dir*."""
+    rng = random.Random(seed)
+    vocab = _scaled(json.loads((DATA / "vocab.json").read_text(encoding="utf-8")), scale)
+    grammar = _scaled(json.loads((DATA / "grammar.json").read_text(encoding="utf-8")), scale)
+
+    # An extra file like vocab_extra.json: half repeats, half new headwords
+    extra: dict[str, list[dict]] = {}
+    for cat, entries in vocab.items():
+        picked = entries[: max(1, len(entries) // 10)]
+        extra[cat] = [
+            e if i % 2 else {**e, "korean": e["korean"] + f" ({i})"} for i, e in enumerate(picked)
+        ]
+
+    card_ids = [f"vocab:{cat}:{i}" for cat, entries in vocab.items() for i in range(len(entries))]
+    card_ids += [f"grammar:{cat}:{i}" for cat, entries in grammar.items() for i in range(len(entries))]
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    files = {
+        "vocab": out_dir / "vocab.json",
+        "grammar": out_dir / "grammar.json",
+        "vocab_extra": out_dir / "vocab_extra.json",
+        "progress": out_dir / "progress.json",
+    }
+    for name, data in (("vocab", vocab), ("grammar", grammar), ("vocab_extra", extra)):
+        files[name].write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    files["progress"].write_text(
+        json.dumps(_progress(card_ids, rng, now), indent=2, ensure_ascii=False), encoding="utf-8"
+    )
+    return files
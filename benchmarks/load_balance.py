@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""Simulate a deck with and without load balancing and compare daily review load.
+
+Balancing can only move reviews, but moving them later also stretches
+intervals and so lowers the total; a raw peak then drops for the wrong
+reason. Load is compared as peak/mean and stdev/mean, which hold the total
+fixed, and the mean shift of moved reviews shows any drift later. A single
+deck's daily load is noisy, so the comparison is repeated over several
+seeds; the balancer should lower stdev/mean on every one of them without
+lowering the number of reviews.
+
+    python benchmarks/load_balance.py [--cards 1500] [--per-day 30] [--days 120] [--seeds 10]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from srs import SRSEngine, AGAIN, HARD, GOOD, EASY, DAY
+
+QUALITIES = [AGAIN, HARD, GOOD, EASY]
+WEIGHTS = [0.08, 0.12, 0.6, 0.2]
+
+
+def simulate(load_balance: bool, cards: int, per_day: int, days: int, seed: int) -> tuple[list[int], list[float]]:
+    """Return the number of reviews done on each simulated day, and the shift
+    in days of every review the balancer moved.
+
+    New cards arrive in bursts averaging *per_day* per day.
+    """
+    # Arrivals and each card's ratings come from their own streams, so both
+    # runs see the same learner and differ only in scheduling
+    arrivals = random.Random(seed)
+    tmp = Path(tempfile.mkdtemp())
+    engine = SRSEngine(progress_file=tmp / "progress.json", load_balance=load_balance, autosave=False)
+    start = 20_000 * DAY  # arbitrary fixed epoch day, so runs are reproducible
+    introduced = 0
+    daily = []
+    shifts = []
+    for day in range(days):
+        now = start + day * DAY + 12 * 3600
+        due = [c.card_id for c in engine.cards.values() if c.next_review <= now]
+        for cid in due:
+            card = engine.cards[cid]
+            rating = random.Random(f"{seed}:{cid}:{card.total_reviews}").choices(QUALITIES, WEIGHTS)[0]
+            engine.record_review(cid, rating, now)
+            shift = (card.next_review - now) / DAY - card.interval_days
+            if abs(shift) > 1e-6:
+                shifts.append(shift)
+        # Learners add new cards in bursts, which is what creates review spikes
+        batch = per_day * 3 if arrivals.random() < 1 / 3 else 0
+        for _ in range(min(batch, cards - introduced)):
+            engine.record_review(f"sim:{introduced}", GOOD, now)
+            introduced += 1
+        daily.append(len(due))
+    return daily, shifts
+
+
+def measure(load_balance: bool, args, seed: int) -> tuple[int, float, float, list[float]]:
+    """(reviews, peak/mean, stdev/mean, shifts) for one run, after the ramp-up."""
+    daily, shifts = simulate(load_balance, args.cards, args.per_day, args.days, seed)
+    # Skip the ramp-up: only compare days after the first cards reach long intervals
+    daily = daily[args.days // 4:]
+    mean = statistics.mean(daily)
+    return sum(daily), max(daily) / mean, statistics.pstdev(daily) / mean, shifts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=1500)
+    parser.add_argument("--per-day", type=int, default=30)
+    parser.add_argument("--days", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=7, help="first seed")
+    parser.add_argument("--seeds", type=int, default=10, help="number of seeds to run")
+    args = parser.parse_args()
+
+    changes = []
+    for seed in range(args.seed, args.seed + args.seeds):
+        reviews, peak, spread, _ = measure(False, args, seed)
+        reviews_b, peak_b, spread_b, shifts = measure(True, args, seed)
+        change = (reviews_b / reviews - 1, peak_b / peak - 1, spread_b / spread - 1)
+        changes.append(change)
+        later = sum(1 for s in shifts if s > 0) / len(shifts) if shifts else 0.0
+        mean_shift = statistics.mean(shifts) if shifts else 0.0
+        print(f"seed {seed:3d}: reviews {reviews:6d} -> {reviews_b:6d} ({change[0]:+.1%})  "
+              f"peak/mean {peak:.2f} -> {peak_b:.2f}  stdev/mean {spread:.3f} -> {spread_b:.3f}  "
+              f"moved {len(shifts)} ({later:.0%} later, mean {mean_shift:+.2f}d)")
+
+    reviews, peak, spread = zip(*changes)
+    print(f"With balancing over {len(changes)} seeds: "
+          f"reviews {statistics.mean(reviews):+.1%} (least {min(reviews):+.1%}), "
+          f"peak/mean {statistics.mean(peak):+.1%} (worst {max(peak):+.1%}), "
+          f"stdev/mean {statistics.mean(spread):+.1%} (worst {max(spread):+.1%})")
+
+
+if __name__ == "__main__":
+    main()
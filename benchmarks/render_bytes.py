@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""Bytes written to the terminal per card: full clear-and-redraw vs screen.py.
+
+    python benchmarks/render_bytes.py [--mode vocab|grammar|mixed] [--cards 15]
+"""
+
+import argparse
+import io
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from rich.console import Console
+
+import grammar
+import main as app
+import rich_ui
+import screen
+import ui
+import vocab
+from srs import SRSEngine
+
+RUNNERS = {"vocab": vocab.run_drill, "grammar": grammar.run_drill, "mixed": app.mixed_review}
+
+
+def _drill(mode: str, cards: int, seed: int):
+    """The session runner plus scripted stdin: menu choice 1, then '3' for every prompt."""
+    random.seed(seed)
+    engine = SRSEngine(Path(tempfile.mkdtemp()) / "progress.json", autosave=False)
+    stdin = io.StringIO("1\n" + "3\n" * (cards * 3 + 10))
+    runner = RUNNERS[mode]
+    if mode == "mixed":
+        return (lambda: runner(engine)), engine, stdin
+    return (lambda: runner(engine, session_size=cards)), engine, stdin
+
+
+def measure_redraw(mode: str, cards: int, seed: int, width: int, height: int) -> tuple[int, int]:
+    run, engine, stdin = _drill(mode, cards, seed)
+    out = io.StringIO()
+    saved_console, saved_stdin = rich_ui.console, sys.stdin
+    rich_ui.console = Console(file=out, width=width, height=height, force_terminal=True,
+                         color_system="256")
+    sys.stdin = stdin
+    try:
+        run()
+    finally:
+        rich_ui.console, sys.stdin = saved_console, saved_stdin
+    return len(out.getvalue().encode("utf-8")), sum(c.total_reviews for c in engine.cards.values())
+
+
+def measure_screen(mode: str, cards: int, seed: int, width: int, height: int) -> tuple[int, int]:
+    run, engine, stdin = _drill(mode, cards, seed)
+    out = io.StringIO()
+    frontend = screen.Screen(file=out, input_file=stdin, width=width, height=height)
+    frontend.renderer = Console(width=width, force_terminal=True, color_system="256", highlight=False)
+    ui.use(frontend)
+    try:
+        run()
+    finally:
+        ui.use(None)
+    return len(out.getvalue().encode("utf-8")), sum(c.total_reviews for c in engine.cards.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--mode", choices=sorted(RUNNERS), default="mixed")
+    parser.add_argument("--cards", type=int, default=15)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--width", type=int, default=100)
+    parser.add_argument("--height", type=int, default=60)
+    args = parser.parse_args()
+
+    results = {}
+    for label, measure in (("redraw", measure_redraw), ("screen", measure_screen)):
+        total, reviewed = measure(args.mode, args.cards, args.seed, args.width, args.height)
+        results[label] = total / max(reviewed, 1)
+        print(f"{label:>7}: {total:8d} bytes for {reviewed} cards  ({results[label]:,.0f} bytes/card)")
+    print(f"Output per card reduced by {1 - results['screen'] / results['redraw']:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""Microbenchmarks for the SRS and content paths, with regression thresholds.
+
+    python benchmarks/run.py                      # compare against baseline.json
+    python benchmarks/run.py --update-baseline    # record new baseline
+    python benchmarks/run.py --scales 1,10 --threshold 0.5
+
+Each metric is the best of --repeat runs (a single run at 100x), in seconds.
+The run fails (exit 1) when a metric is slower than its baseline by more
+than --threshold (a fraction) and by more than --min-delta seconds, which
+keeps sub-millisecond noise from tripping it.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import decks
+import grammar
+import headless
+import merge_data
+import ui
+import vocab
+from srs import SRSEngine, GOOD
+
+from datasets import build
+
+BASELINE_FILE = Path(__file__).parent / "baseline.json"
+NOW = 1_800_000_000.0
+
+
+def best_of(repeat: int, fn, setup=None) -> float:
+    """Fastest of *repeat* timed calls to fn(); setup() runs untimed before each."""
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@contextlib.contextmanager
+def _data_files(files: dict[str, Path]):
+    """Point the content loaders at the synthetic files."""
+    saved = (vocab.DATA_FILE, grammar.DATA_FILE)
+    vocab.DATA_FILE, grammar.DATA_FILE = files["vocab"], files["grammar"]
+    vocab._cache = grammar._cache = None
+    try:
+        yield
+    finally:
+        vocab.DATA_FILE, grammar.DATA_FILE = saved
+        vocab._cache = grammar._cache = None
+
+
+def run_scale(scale: int, repeat: int, work: Path) -> dict[str, float]:
+    files = build(scale, work / f"x{scale}")
+    scratch = work / f"x{scale}" / "scratch.json"
+    shutil.copy(files["progress"], scratch)
+    results: dict[str, float] = {}
+
+    engine = SRSEngine(scratch, clock=lambda: NOW)
+    ids = list(engine.cards)
+    rng = random.Random(0)
+
+    results["srs.load"] = best_of(repeat, lambda: SRSEngine(files["progress"], clock=lambda: NOW))
+    results["srs.save"] = best_of(repeat, engine.save)
+    results["srs.record_review"] = best_of(repeat, lambda: engine.record_review(rng.choice(ids), GOOD))
+    results["srs.get_due_cards"] = best_of(repeat, lambda: engine.get_due_cards(ids))
+    results["srs.get_stats"] = best_of(repeat, engine.get_stats)
+    results["srs.weakest"] = best_of(repeat, lambda: engine.weakest(ids, 15))
+
+    with _data_files(files):
+        def uncache():
+            vocab._cache = grammar._cache = None
+
+        results["content.load_vocab"] = best_of(repeat, vocab.load_vocab, uncache)
+        results["content.load_grammar"] = best_of(repeat, grammar.load_grammar, uncache)
+
+        # A filtered deck mixing content and state terms, indexes already built
+        query = decks.Query('category:"*" text:"다" -grammar reviews>0 ease<2.6')
+        query.select(engine)
+        results["decks.query"] = best_of(repeat, lambda: query.select(engine))
+
+        # One vocab session up to its first card: menu, pool, due lookup, selection
+        vocab.load_vocab()
+        engine.autosave = False
+        frontend = headless.ScriptedUI([], headless.ScriptClock(NOW))
+        ui.use(frontend)
+        try:
+            results["vocab.session_selection"] = best_of(repeat, lambda: vocab.run_drill(engine))
+        finally:
+            ui.use(None)
+
+    merge_target = work / f"x{scale}" / "merge_target.json"
+    with contextlib.redirect_stdout(io.StringIO()):
+        results["merge_data.merge_json"] = best_of(
+            repeat,
+            lambda: merge_data.merge_json(merge_target, files["vocab_extra"]),
+            lambda: shutil.copy(files["vocab"], merge_target),
+        )
+    return results
+
+
+def compare(results: dict, baseline: dict, threshold: float, min_delta: float) -> list[str]:
+    """Return a line per metric that regressed past the threshold."""
+    failures = []
+    for scale, metrics in results.items():
+        for name, seconds in metrics.items():
+            base = baseline.get(scale, {}).get(name)
+            if base is None:
+                continue
+            if seconds > base * (1 + threshold) and seconds - base > min_delta:
+                failures.append(f"x{scale} {name}: {seconds * 1000:.2f}ms vs baseline {base * 1000:.2f}ms")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run SRS/content microbenchmarks.")
+    parser.add_argument("--scales", default="1,10,100", help="comma-separated size multipliers")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, e.g. 0.25 = 25%%")
+    parser.add_argument("--min-delta", type=float, default=0.002, help="ignore slowdowns below this (s)")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--out", type=Path, help="also write results to this JSON file")
+    args = parser.parse_args()
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in (int(s) for s in args.scales.split(",")):
+            repeat = 1 if scale >= 100 else args.repeat
+            results[str(scale)] = run_scale(scale, repeat, Path(tmp))
+            for name, seconds in results[str(scale)].items():
+                print(f"x{scale:<4} {name:<26} {seconds * 1000:10.2f} ms")
+
+    if args.out is not None:
+        args.out.write_text(json.dumps(results, indent=2), encoding="utf-8")
+
+    if args.update_baseline:
+        baseline = json.loads(args.baseline.read_text()) if args.baseline.exists() else {}
+        baseline.update(results)
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n", encoding="utf-8")
+        print(f"Baseline written to {args.baseline}")
+        return
+
+    if not args.baseline.exists():
+        print("No baseline yet; run with --update-baseline.")
+        return
+    failures = compare(results, json.loads(args.baseline.read_text()), args.threshold, args.min_delta)
+    if failures:
+        print(f"\n{len(failures)} regression(s) over {args.threshold:.0%}:")
+        for line in failures:
+            print(f"  {line}")
+        sys.exit(1)
+    print(f"\nNo regressions over {args.threshold:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Startup and per-card render cost of the Rich and plain UI backends.
+
+    python benchmarks/ui_backends.py [--cards 500] [--repeat 5]
+
+Startup is measured in a fresh interpreter: importing the app plus drawing
+the banner and a first card. Render cost is the in-process time to draw a
+card, its answer, an example and the rating bar, written to a buffer.
+"""
+
+import argparse
+import io
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT))
+
+import ui
+import vocab
+
+SETUP = {
+    "rich": "import rich_ui, io; rich_ui.console.file = io.StringIO()",
+    "plain": "import plain_ui, io; ui.set_default(plain_ui.PlainUI(out=io.StringIO()))",
+}
+
+STARTUP = """
+import time
+start = time.perf_counter()
+import main, ui
+{setup}
+ui.banner()
+ui.show_card_prompt("서운하다", "feeling")
+print(time.perf_counter() - start)
+"""
+
+
+def startup(backend: str, repeat: int) -> float:
+    code = STARTUP.format(setup=SETUP[backend])
+    runs = [
+        float(subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True,
+                             capture_output=True, text=True).stdout)
+        for _ in range(repeat)
+    ]
+    return min(runs)
+
+
+def render(backend: str, entries: list[dict], repeat: int) -> float:
+    """Best seconds per card over *repeat* passes through *entries*."""
+    out = io.StringIO()
+    if backend == "rich":
+        import rich_ui
+        saved = rich_ui.console.file
+        rich_ui.console.file = out
+        ui.set_default(None)
+    else:
+        import plain_ui
+        ui.set_default(plain_ui.PlainUI(out=out, color=True))
+    best = float("inf")
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for entry in entries:
+                ui.show_header("감정", 1, len(entries))
+                ui.show_card_prompt(entry["korean"], entry.get("hanja"))
+                ui.show_answer(entry["english"], entry.get("notes"))
+                if entry.get("example"):
+                    ui.show_example(entry["example"], entry.get("example_en"))
+                out.seek(0)
+                out.truncate()
+            best = min(best, (time.perf_counter() - start) / len(entries))
+    finally:
+        if backend == "rich":
+            rich_ui.console.file = saved
+        ui.set_default(None)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare UI backend startup and render cost.")
+    parser.add_argument("--cards", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    entries = [e for cat in vocab.load_vocab().values() for e in cat][:args.cards]
+    print(f"{'backend':<8} {'startup':>10} {'per card':>12}")
+    for backend in SETUP:
+        boot = startup(backend, args.repeat)
+        card = render(backend, entries, args.repeat)
+        print(f"{backend:<8} {boot * 1000:8.1f}ms {card * 1e6:10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
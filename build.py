@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Build a single-file zipapp: code, compressed content and prebuilt indexes.
+
+    python build.py                     # -> dist/korean-coach.pyz
+    python build.py --out coach.pyz --no-rich
+    python dist/korean-coach.pyz [--plain]
+
+The archive holds the app modules as bytecode (so it runs on the Python
+version that built it), the runtime content from data/ pre-parsed and
+deflated, and the answer-form and cross-reference indexes already computed
+for that content, so the first drill doesn't build them. Members over
+STORE_OVER (vocab) are left uncompressed unless --compress-all: inflating
+them would cost more at start-up than reading JSON from a checkout.
+Rich is bundled unless --no-rich; without it, run with --plain or install
+Rich. Progress and caches are written next to the archive (see bundle.py).
+"""
+
+import argparse
+import hashlib
+import json
+import pickle
+import shutil
+import subprocess
+import sys
+import tempfile
+import zipfile
+from pathlib import Path
+
+import bundle
+import xref
+
+ROOT = Path(__file__).parent
+DATA = ROOT / "data"
+DIST = ROOT / "dist"
+
+# Modules the app imports at runtime, including lazily (ui loads rich_ui by name)
+APP_MODULES = (
+    "main", "bundle", "perf", "srs", "history", "ui", "rich_ui", "plain_ui", "screen",
+    "vocab", "grammar", "answers", "xref", "decks", "distractors", "timebox",
+)
+CONTENT = ("vocab.json", "grammar.json", *xref.SOURCES)
+
+STORE_OVER = 1_000_000  # bytes
+
+ENTRY_POINT = "import main\n\nmain.main()\n"
+PREBUILD = "import answers, distractors, xref; answers.index(); distractors.index(); xref.index()"
+
+
+def _stage(stage: Path) -> None:
+    """Copy the modules and content into *stage* and build the indexes there."""
+    for name in APP_MODULES:
+        shutil.copy(ROOT / f"{name}.py", stage)
+    (stage / "data").mkdir()
+    for name in CONTENT:
+        shutil.copy(DATA / name, stage / "data")
+    subprocess.run([sys.executable, "-c", PREBUILD], cwd=stage, check=True)
+
+
+def _add_json(zf: zipfile.ZipFile, stage: Path, path: Path, store_over: int | None) -> str:
+    """Store a staged JSON file pre-parsed (see bundle.py); returns its sha256."""
+    data = path.read_bytes()
+    parsed = pickle.dumps(json.loads(data), pickle.HIGHEST_PROTOCOL)
+    stored = store_over is not None and len(parsed) > store_over
+    zf.writestr(bundle.member(path.relative_to(stage).as_posix()), parsed,
+                compress_type=zipfile.ZIP_STORED if stored else None)
+    return hashlib.sha256(data).hexdigest()
+
+
+def build(out: Path, with_rich: bool = True, store_over: int | None = STORE_OVER) -> Path:
+    with tempfile.TemporaryDirectory() as tmp:
+        stage = Path(tmp)
+        _stage(stage)
+        out.parent.mkdir(parents=True, exist_ok=True)
+        with open(out, "wb") as f:
+            f.write(b"#!/usr/bin/env python3\n")
+            with zipfile.PyZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                zf.compresslevel = 9
+                zf.writestr("__main__.py", ENTRY_POINT)
+                for name in APP_MODULES:
+                    zf.writepy(stage / f"{name}.py")
+                if with_rich:
+                    import rich
+                    zf.writepy(Path(rich.__file__).parent)
+                digests = {
+                    path.relative_to(stage).as_posix(): _add_json(zf, stage, path, store_over)
+                    for path in sorted(stage.glob("data/*.json")) + sorted(stage.glob(".cache/*.json"))
+                }
+                zf.writestr(bundle.DIGESTS, json.dumps(digests, indent=1))
+    out.chmod(0o755)
+    return out
+
+
+def _size(paths) -> int:
+    return sum(p.stat().st_size for p in paths if p.is_file())
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the Korean Coach zipapp.")
+    parser.add_argument("--out", type=Path, default=DIST / "korean-coach.pyz")
+    parser.add_argument("--no-rich", action="store_true", help="don't bundle Rich")
+    parser.add_argument("--compress-all", action="store_true",
+                        help="deflate large content too: smaller archive, slower first drill")
+    args = parser.parse_args()
+
+    out = build(args.out, with_rich=not args.no_rich,
+                store_over=None if args.compress_all else STORE_OVER)
+    tree = _size([ROOT / f"{name}.py" for name in APP_MODULES]) + _size(DATA.iterdir())
+    tree += _size((ROOT / "docs" / "data").iterdir())
+    print(f"{out}: {out.stat().st_size / 1e6:.2f} MB (source code + data/ + docs/data/: {tree / 1e6:.2f} MB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Where the app's files live: a source checkout, or a zipapp built by build.py.
+
+From a checkout everything is under the directory holding the code, as it
+always was. Inside a zipapp __file__ points into the archive, and content
+and the prebuilt .cache/ indexes are read straight out of it, without
+extracting, through the zipimporter that loaded this module. build.py
+stores each JSON file there already parsed (pickled, as <name>.pickle), so
+a load is one read and one unpickle, and lists every one with its sha256 in
+digests.json, so cache keys need no hashing at run time. What the app
+writes (progress, caches, traces) goes in the directory holding the archive.
+"""
+
+import json
+from pathlib import Path
+
+ROOT = Path(__file__).parent                   # the checkout, or the .pyz itself
+ARCHIVE = ROOT if ROOT.is_file() else None
+STATE_DIR = ROOT.parent if ARCHIVE else ROOT   # where the app writes
+CACHE_DIR = STATE_DIR / ".cache"
+DIGESTS = "digests.json"                       # archive member: content path -> sha256
+
+_digests: dict[str, str] | None = None
+
+
+def _relative(path: Path) -> str | None:
+    """*path* relative to the archive, or None if it isn't inside the archive."""
+    if ARCHIVE is None:
+        return None
+    try:
+        return Path(path).relative_to(ARCHIVE).as_posix()
+    except ValueError:
+        return None
+
+
+def member(relative: str) -> str:
+    """The archive member holding the JSON file at *relative*."""
+    return Path(relative).with_suffix(".pickle").as_posix()
+
+
+def _read(name: str) -> bytes:
+    # zipimport is already loaded and reads members itself; zipfile is slow to import
+    return __loader__.get_data(str(ARCHIVE / name))
+
+
+def _manifest() -> dict[str, str]:
+    global _digests
+    if _digests is None:
+        _digests = json.loads(_read(DIGESTS))
+    return _digests
+
+
+def exists(path: Path) -> bool:
+    relative = _relative(path)
+    if relative is None:
+        return Path(path).exists()
+    return relative in _manifest()
+
+
+def load_json(path: Path):
+    relative = _relative(path)
+    if relative is None:
+        return json.loads(Path(path).read_bytes())
+    if relative not in _manifest():
+        raise FileNotFoundError(path)
+    import pickle
+    return pickle.loads(_read(member(relative)))
+
+
+def mtime_ns(path: Path) -> int:
+    """Modification time for reload checks; archive members change only with the archive."""
+    if _relative(path) is None:
+        return Path(path).stat().st_mtime_ns
+    if not exists(path):
+        raise FileNotFoundError(path)
+    return ARCHIVE.stat().st_mtime_ns
+
+
+def digest(path: Path) -> str:
+    """sha256 of a content file, for keying caches on it."""
+    relative = _relative(path)
+    if relative is None:
+        import hashlib
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    try:
+        return _manifest()[relative]
+    except KeyError:
+        raise FileNotFoundError(path) from None
+
+
+def read_cache(path: Path):
+    """A JSON cache file, else the copy prebuilt into the archive; None if neither."""
+    if path.exists():
+        return json.loads(path.read_text(encoding="utf-8"))
+    prebuilt = ROOT / ".cache" / path.name
+    if ARCHIVE is not None and exists(prebuilt):
+        return load_json(prebuilt)
+    return None
+
+
+def write_cache(path: Path, data, indent: int | None = None) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=indent), encoding="utf-8")
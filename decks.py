@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+"""Filtered decks: card sets defined by a query over content and progress.
+
+A query is a list of terms, all of which must hold. Prefix a term with - to
+negate it.
+
+    vocab, grammar          card kind
+    category:연어*          category name, glob (*, ?); without one, a prefix
+    hanja:學                vocab cards whose hanja has every given character
+    text:"더니"             substring of any field; also korean:, english:
+    due:yes  new:no         due now (new cards are due) / never reviewed
+    ease<2.0  reviews>5     also interval (days) and accuracy (0-1), with
+                            < <= > >= = ; unreviewed cards have the defaults
+                            (ease 2.5, 0 days, 0 reviews, no accuracy)
+    other words             text:<word>
+
+    hanja:學 due:yes ease<2.0
+    category:"연어*" reviews>5
+    grammar text:"더니"
+
+Each term compiles to a lookup in an index built once per content load
+(kind, category and hanja postings, and a lowercased text column per field,
+scanned with map/compress so the loop runs in C) or once per change to
+progress (card state as sorted columns, sliced with bisect), so a query is
+a few set operations over card positions rather than a pass over entries.
+
+Saved decks are kept in decks.json, next to progress.json.
+
+    python decks.py 'hanja:學 due:yes'          # count and a sample of matches
+    python decks.py 'grammar text:더니' --save 더니
+    python decks.py --list
+"""
+
+import argparse
+import json
+import operator
+import re
+import time
+from bisect import bisect_left, bisect_right
+from fnmatch import fnmatchcase
+from itertools import compress, repeat
+from pathlib import Path
+
+import bundle
+import grammar
+import perf
+import vocab
+
+DECKS_FILE = bundle.STATE_DIR / "decks.json"
+
+# field -> (Card attribute, value for a card never reviewed; None: never matches)
+STATE_FIELDS = {
+    "ease": ("ease_factor", 2.5),
+    "interval": ("interval_days", 0.0),
+    "reviews": ("total_reviews", 0),
+    "accuracy": ("accuracy", None),
+    "due": ("next_review", 0.0),
+}
+TEXT_FIELDS = ("text", "korean", "english")
+CONTENT_FIELDS = ("category", "hanja", *TEXT_FIELDS)
+FLAGS = {"due", "new"}
+KINDS = ("vocab", "grammar")
+COMPARE = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge, "=": operator.eq}
+YES, NO = {"yes", "true", "y", "1"}, {"no", "false", "n", "0"}
+
+_TERM = re.compile(r'\s*(-?)(?:(\w+)\s*(<=|>=|<|>|=|:)\s*)?(?:"([^"]*)"|([^\s"]+))')
+
+
+def _vocab_fields(entry: dict) -> dict[str, list[str]]:
+    return {
+        "korean": [entry["korean"]],
+        "english": [entry["english"]],
+        "text": [entry.get(k, "") for k in
+                 ("korean", "english", "hanja", "breakdown", "example", "example_en", "notes")],
+    }
+
+
+def _grammar_fields(entry: dict) -> dict[str, list[str]]:
+    examples = [s for ex in entry.get("examples", []) for s in (ex.get("korean", ""), ex.get("english", ""))]
+    drill = entry.get("drill", {})
+    return {
+        "korean": [entry["pattern"]],
+        "english": [entry.get("meaning", "")],
+        "text": [entry["pattern"], entry.get("meaning", ""), entry.get("explanation", ""), *examples,
+                 *(drill.get(k, "") for k in ("prompt", "answer", "full_sentence"))],
+    }
+
+
+class ContentIndex:
+    """Field indexes over every vocab and grammar card, by position in card_ids."""
+
+    @perf.timed("decks.content_index")
+    def __init__(self, vocab_data: dict, grammar_data: dict):
+        self.sources = (vocab_data, grammar_data)
+        self.card_ids: list[str] = []
+        self.entries: list[tuple[str, str, dict]] = []  # (kind, category, entry)
+        self.kinds: dict[str, set[int]] = {kind: set() for kind in KINDS}
+        self.categories: dict[str, set[int]] = {}
+        self.hanja: dict[str, set[int]] = {}
+        texts: dict[str, list[str]] = {name: [] for name in TEXT_FIELDS}
+
+        for kind, data, module, fields in (("vocab", vocab_data, vocab, _vocab_fields),
+                                           ("grammar", grammar_data, grammar, _grammar_fields)):
+            for cat, entries in data.items():
+                members = self.categories.setdefault(cat, set())
+                for i, entry in enumerate(entries):
+                    pos = len(self.card_ids)
+                    self.card_ids.append(module.card_id(cat, i))
+                    self.entries.append((kind, cat, entry))
+                    self.kinds[kind].add(pos)
+                    members.add(pos)
+                    for ch in entry.get("hanja", ""):
+                        self.hanja.setdefault(ch, set()).add(pos)
+                    for name, values in fields(entry).items():
+                        texts[name].append(" ".join(values).lower())
+        self.universe = set(range(len(self.card_ids)))
+        self.positions = {cid: pos for pos, cid in enumerate(self.card_ids)}
+        self.text = texts  # field -> one lowercased string per card
+
+    def category(self, pattern: str) -> set[int]:
+        pattern = pattern.lower()
+        if not any(ch in pattern for ch in "*?["):
+            pattern += "*"
+        found = set()
+        for name, members in self.categories.items():
+            if fnmatchcase(name.lower(), pattern):
+                found |= members
+        return found
+
+    def search(self, field: str, needle: str) -> set[int]:
+        """Cards whose *field* text contains *needle*, case-insensitively."""
+        texts = self.text[field]
+        return set(compress(range(len(texts)), map(operator.contains, texts, repeat(needle.lower()))))
+
+    def hanja_chars(self, chars: str) -> set[int]:
+        sets = sorted((self.hanja.get(ch, set()) for ch in chars if not ch.isspace()), key=len)
+        return set.intersection(*sets) if sets else set()
+
+
+class StateIndex:
+    """Card state for the cards in *content* as sorted (value, position) columns."""
+
+    @perf.timed("decks.state_index")
+    def __init__(self, engine, content: ContentIndex):
+        self.revision = engine.revision
+        positions = content.positions
+        cards = [(pos, card) for cid, card in engine.cards.items()
+                 if (pos := positions.get(cid)) is not None]
+        self.tracked = {pos for pos, _ in cards}
+        self.untracked = content.universe - self.tracked
+        self.columns: dict[str, tuple[list, list[int]]] = {}
+        for field, (attr, _) in STATE_FIELDS.items():
+            pairs = sorted((getattr(card, attr), pos) for pos, card in cards)
+            self.columns[field] = ([value for value, _ in pairs], [pos for _, pos in pairs])
+
+    def range(self, field: str, op: str, value: float) -> set[int]:
+        values, positions = self.columns[field]
+        if op == "<":
+            found = positions[:bisect_left(values, value)]
+        elif op == "<=":
+            found = positions[:bisect_right(values, value)]
+        elif op == ">":
+            found = positions[bisect_right(values, value):]
+        elif op == ">=":
+            found = positions[bisect_left(values, value):]
+        else:
+            found = positions[bisect_left(values, value):bisect_right(values, value)]
+        found = set(found)
+        default = STATE_FIELDS[field][1]
+        if default is not None and COMPARE[op](default, value):
+            found |= self.untracked  # cards never reviewed sit at the default
+        return found
+
+
+_content: ContentIndex | None = None
+_state: tuple[object, ContentIndex, StateIndex] | None = None  # (engine, content, index)
+
+
+def content_index() -> ContentIndex:
+    """The content index, rebuilt when vocab.json or grammar.json is reloaded."""
+    global _content
+    vocab_data, grammar_data = vocab.load_vocab(), grammar.load_grammar()
+    if _content is None or _content.sources[0] is not vocab_data or _content.sources[1] is not grammar_data:
+        _content = ContentIndex(vocab_data, grammar_data)
+    return _content
+
+
+def state_index(engine, content: ContentIndex) -> StateIndex:
+    """The state index for *engine*, rebuilt after it records reviews."""
+    global _state
+    if _state is None or _state[0] is not engine or _state[1] is not content \
+            or _state[2].revision != engine.revision:
+        _state = (engine, content, StateIndex(engine, content))
+    return _state[2]
+
+
+def _flag(field: str, value: str) -> bool:
+    value = value.lower()
+    if value in YES:
+        return True
+    if value in NO:
+        return False
+    raise ValueError(f"{field}: expects yes or no, not {value!r}")
+
+
+def _compile_term(field: str | None, op: str | None, value: str):
+    """One term -> (needs card state, fn(content, state, now) -> set of positions)."""
+    if field is None:
+        if value.lower() in KINDS:
+            kind = value.lower()
+            return False, lambda content, state, now: content.kinds[kind]
+        field, op = "text", ":"
+    field = field.lower()
+    if field in CONTENT_FIELDS:
+        if op != ":":
+            raise ValueError(f"{field}: use {field}:<value>")
+        if field == "category":
+            return False, lambda content, state, now: content.category(value)
+        if field == "hanja":
+            return False, lambda content, state, now: content.hanja_chars(value)
+        return False, lambda content, state, now: content.search(field, value)
+    if field in FLAGS:
+        if op not in (":", "="):
+            raise ValueError(f"{field}: use {field}:yes or {field}:no")
+        wanted = _flag(field, value)
+        if field == "due":
+            def due(content, state, now):
+                found = state.range("due", "<=", now)
+                return found if wanted else content.universe - found
+            return True, due
+
+        def new(content, state, now):
+            found = state.range("reviews", "=", 0)
+            return found if wanted else content.universe - found
+        return True, new
+    if field in STATE_FIELDS:
+        try:
+            number = float(value)
+        except ValueError:
+            raise ValueError(f"{field}: {value!r} is not a number") from None
+        op = "=" if op == ":" else op
+        return True, lambda content, state, now: state.range(field, op, number)
+    known = ", ".join((*KINDS, *CONTENT_FIELDS, *FLAGS, *(f for f in STATE_FIELDS if f != "due")))
+    raise ValueError(f"unknown field {field!r} (try {known})")
+
+
+class Query:
+    """A compiled query; raises ValueError on a malformed one."""
+
+    def __init__(self, text: str):
+        self.text = text.strip()
+        self.terms: list[tuple[bool, bool, object]] = []  # (negated, needs state, fn)
+        pos = 0
+        while pos < len(self.text):
+            match = _TERM.match(self.text, pos)
+            if match is None or match.end() == pos:
+                raise ValueError(f"can't read the query from {self.text[pos:].strip()!r}")
+            negate, field, op, quoted, bare = match.groups()
+            value = quoted if quoted is not None else bare
+            self.terms.append((bool(negate), *_compile_term(field, op, value)))
+            pos = match.end()
+        self.needs_state = any(state for _, state, _ in self.terms)
+
+    @perf.timed("decks.query")
+    def _positions(self, engine, now: float | None) -> set[int]:
+        content = content_index()
+        state = state_index(engine, content) if self.needs_state else None
+        if now is None:
+            now = engine.clock()
+        include = [fn(content, state, now) for negate, _, fn in self.terms if not negate]
+        exclude = [fn(content, state, now) for negate, _, fn in self.terms if negate]
+        include.sort(key=len)
+        found = set(include[0]) if include else set(content.universe)
+        for positions in include[1:]:
+            found &= positions
+        for positions in exclude:
+            found -= positions
+        return found
+
+    def select(self, engine, now: float | None = None) -> list[str]:
+        """Card ids matching the query, in content order."""
+        card_ids = content_index().card_ids
+        return [card_ids[pos] for pos in sorted(self._positions(engine, now))]
+
+    def counts(self, engine, now: float | None = None) -> tuple[int, int]:
+        """(due, new) among the matching cards, as the category menus show them."""
+        if now is None:
+            now = engine.clock()
+        found = self._positions(engine, now)
+        state = state_index(engine, content_index())
+        new = found & state.range("reviews", "=", 0)
+        due = (found & state.range("due", "<=", now)) - new
+        return len(due), len(new)
+
+
+def entries(card_ids: list[str]) -> dict[str, tuple[str, str, dict]]:
+    """card id -> (kind, category, entry) for cards from select()."""
+    content = content_index()
+    return {cid: content.entries[content.positions[cid]] for cid in card_ids}
+
+
+def load_decks(path: Path = DECKS_FILE) -> dict[str, str]:
+    """Saved decks: name -> query."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_decks(decks: dict[str, str], path: Path = DECKS_FILE) -> None:
+    path.write_text(json.dumps(decks, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+def main():
+    from srs import SRSEngine
+
+    parser = argparse.ArgumentParser(description="Query cards / manage saved filtered decks.")
+    parser.add_argument("query", nargs="?", help="e.g. 'hanja:學 due:yes ease<2.0'")
+    parser.add_argument("--save", metavar="NAME", help="save the query as a deck")
+    parser.add_argument("--delete", metavar="NAME", help="delete a saved deck")
+    parser.add_argument("--list", action="store_true", help="list saved decks")
+    args = parser.parse_args()
+
+    decks = load_decks()
+    if args.delete:
+        decks.pop(args.delete, None)
+        save_decks(decks)
+    if args.query:
+        try:
+            query = Query(args.query)
+        except ValueError as e:
+            parser.error(str(e))
+        engine = SRSEngine(autosave=False)
+        query.select(engine)  # builds the indexes
+        start = time.perf_counter()
+        found = query.select(engine)
+        elapsed = time.perf_counter() - start
+        for cid, (kind, cat, entry) in list(entries(found).items())[:10]:
+            print(f"  {entry.get('korean') or entry.get('pattern')}  [{cat}]")
+        print(f"{len(found)} cards ({elapsed * 1000:.2f} ms)")
+        if args.save:
+            decks[args.save] = query.text
+            save_decks(decks)
+    if args.list or not (args.query or args.delete):
+        for name, text in decks.items():
+            print(f"  {name}: {text}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""Near-duplicate detection for vocab entries across categories and extra files.
+
+merge_json() only skips an extra entry whose ``korean`` is already in the
+same category. This finds the rest: the same word filed under two
+categories, "A vs B" cards written as "B vs A", spacing variants, and
+entries whose Korean and glosses mostly overlap.
+
+Each entry gets a normalized key (whitespace removed, "A vs B" sides
+sorted, pattern marks and parentheticals dropped) and a shingle set
+(Korean character bigrams plus the words of its ``;``-separated glosses).
+Entries with equal keys are duplicates outright. For the rest, a MinHash
+signature per entry is cut into LSH bands; only entries sharing a band
+bucket are compared, so the whole corpus is checked in near-linear time
+rather than pair by pair.
+
+    python dedupe.py                       # report on vocab.json + vocab_extra*.json
+    python dedupe.py --json report.json
+"""
+
+import argparse
+import json
+import random
+import re
+import zlib
+from collections import defaultdict
+from pathlib import Path
+
+DATA = Path(__file__).parent / "data"
+
+NUM_PERM = 32
+BANDS = 16         # 16 bands of 2 rows: a pair at 0.6 similarity shares a bucket 99.9% of the time
+THRESHOLD = 0.6    # shingle-set Jaccard at which a candidate pair is reported
+_PRIME = (1 << 61) - 1
+_rng = random.Random(1)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(_PRIME)) for _ in range(NUM_PERM)]
+
+_PARENS = re.compile(r"\([^)]*\)|\[[^]]*\]")
+_WORDS = re.compile(r"[a-z]+")
+STOPWORDS = {"a", "an", "the", "to", "of", "be", "or", "and", "in", "on", "for", "as", "lit", "sth", "sb"}
+
+
+def korean_key(korean: str) -> str:
+    """Spacing-, mark- and order-insensitive form of a headword: 'B vs A' == 'A vs B'."""
+    sides = []
+    for side in korean.split(" vs "):
+        side = "".join(_PARENS.sub("", side).split()).strip("~-")
+        if side:
+            sides.append(side)
+    return " vs ".join(sorted(sides))
+
+
+def glosses(english: str) -> list[str]:
+    """The ``;``/``,``-separated meanings of an English gloss, normalized and sorted."""
+    out = set()
+    for gloss in re.split(r"[;,/]", _PARENS.sub("", english.lower())):
+        words = [w for w in _WORDS.findall(gloss) if w not in STOPWORDS]
+        if words:
+            out.add(" ".join(words))
+    return sorted(out)
+
+
+def shingles(entry: dict) -> set[str]:
+    """Korean character bigrams (with word-edge marks) plus English gloss words."""
+    out = set()
+    for side in korean_key(entry["korean"]).split(" vs "):
+        padded = f"^{side}$"
+        out.update(padded[i:i + 2] for i in range(len(padded) - 1))
+    for gloss in glosses(entry.get("english", "")):
+        out.update(f"e:{w}" for w in gloss.split())
+    return out
+
+
+def minhash(items: set[str]) -> tuple[int, ...]:
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in items] or [0]
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMS)
+
+
+def jaccard(a: set, b: set) -> float:
+    return len(a & b) / len(a | b) if a or b else 1.0
+
+
+def load_corpus(files: list[Path]) -> list[tuple[str, str, int, dict]]:
+    """(file name, category, index, entry) for every entry in *files*."""
+    corpus = []
+    for path in files:
+        for cat, entries in json.loads(path.read_text(encoding="utf-8")).items():
+            for i, entry in enumerate(entries):
+                corpus.append((path.name, cat, i, entry))
+    return corpus
+
+
+def _gloss_words(entry: dict) -> set[str]:
+    # Parentheticals count here: "talchum (Korean mask dance)" and "mask dance" share a meaning
+    return set(_WORDS.findall(entry.get("english", "").lower())) - STOPWORDS
+
+
+def find_duplicates(corpus: list[tuple[str, str, int, dict]],
+                    threshold: float = THRESHOLD) -> list[dict]:
+    """Likely duplicate pairs, most similar first.
+
+    Each pair is {"a", "b", "similarity", "reason", "mergeable"}, where a and
+    b are (file, category, index) and a comes first in corpus order. Equal
+    headwords whose glosses share no word are reported as homonyms and are
+    not mergeable.
+    """
+    sets = [shingles(entry) for _, _, _, entry in corpus]
+    candidates: set[tuple[int, int]] = set()
+
+    by_key: dict[str, list[int]] = defaultdict(list)
+    for n, (_, _, _, entry) in enumerate(corpus):
+        by_key[korean_key(entry["korean"])].append(n)
+    for members in by_key.values():
+        candidates.update((i, j) for x, i in enumerate(members) for j in members[x + 1:])
+
+    rows = NUM_PERM // BANDS
+    buckets: dict[tuple, list[int]] = defaultdict(list)
+    for n, items in enumerate(sets):
+        signature = minhash(items)
+        for band in range(BANDS):
+            buckets[(band, signature[band * rows:(band + 1) * rows])].append(n)
+    for members in buckets.values():
+        candidates.update((i, j) for x, i in enumerate(members) for j in members[x + 1:])
+
+    report = []
+    for i, j in candidates:
+        a, b = corpus[i][3], corpus[j][3]
+        similarity = jaccard(sets[i], sets[j])
+        if korean_key(a["korean"]) == korean_key(b["korean"]):
+            shared = bool(_gloss_words(a) & _gloss_words(b))
+            reason = "same headword" if shared else "same headword, different meaning"
+        elif similarity < threshold or (" vs " in a["korean"]) != (" vs " in b["korean"]):
+            continue  # a comparison card isn't a duplicate of the word it compares
+        else:
+            shared, reason = True, "similar headword and glosses"
+        report.append({
+            "a": corpus[i][:3],
+            "b": corpus[j][:3],
+            "similarity": round(similarity, 3),
+            "reason": reason,
+            "mergeable": shared,
+        })
+    report.sort(key=lambda p: (not p["mergeable"], -p["similarity"], p["a"], p["b"]))
+    return report
+
+
+def auto_merge(main: dict[str, list[dict]], extra: dict[str, list[dict]]) -> tuple[dict, int]:
+    """Drop extra entries that duplicate a main entry or an earlier extra one.
+
+    Fields the kept main entry lacks (hanja, notes, an example) are copied
+    over from its duplicate. Main entries are never removed or reordered, so
+    card ids and review progress stay valid. Returns (extra, dropped count).
+    """
+    corpus = [("main", cat, i, e) for cat, entries in main.items() for i, e in enumerate(entries)]
+    corpus += [("extra", cat, i, e) for cat, entries in extra.items() for i, e in enumerate(entries)]
+    entries = {c[:3]: c[3] for c in corpus}
+    dropped = set()
+    for pair in find_duplicates(corpus):
+        a, b = tuple(pair["a"]), tuple(pair["b"])
+        if not pair["mergeable"] or b[0] != "extra":
+            continue
+        dropped.add(b)
+        if a[0] == "main":
+            for field, value in entries[b].items():
+                entries[a].setdefault(field, value)
+    kept = {
+        cat: [e for i, e in enumerate(items) if ("extra", cat, i) not in dropped]
+        for cat, items in extra.items()
+    }
+    return kept, len(dropped)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Report likely duplicate vocab entries.")
+    parser.add_argument("files", nargs="*", type=Path,
+                        help="vocab JSON files (default: vocab.json and vocab_extra*.json)")
+    parser.add_argument("--threshold", type=float, default=THRESHOLD)
+    parser.add_argument("--json", type=Path, help="write the full report here")
+    args = parser.parse_args()
+
+    files = args.files or [DATA / "vocab.json"] + sorted(DATA.glob("vocab_extra*.json"))
+    corpus = load_corpus(files)
+    report = find_duplicates(corpus, args.threshold)
+    entries = {c[:3]: c[3] for c in corpus}
+    for pair in report:
+        a, b = entries[tuple(pair["a"])], entries[tuple(pair["b"])]
+        print(f"{pair['similarity']:.2f}  {a['korean']} — {a['english']}")
+        print(f"      {b['korean']} — {b['english']}")
+        print(f"      {pair['a'][0]}:{pair['a'][1]} #{pair['a'][2]}  /  {pair['b'][0]}:{pair['b'][1]} #{pair['b'][2]}")
+    print(f"{len(report)} likely duplicates among {len(corpus)} entries")
+    if args.json is not None:
+        args.json.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
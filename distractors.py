@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""Nearest-neighbour distractors for multiple-choice vocab cards.
+
+Every vocab entry becomes a sparse TF-IDF vector of character n-grams:
+trigrams of its English words (so "decide" is near "decision"), bigrams of
+its Korean words and its hanja characters. n-grams in more than MAX_DF of
+entries (하다, "the", ...) carry little signal and are dropped. Cosine
+similarity is the sparse product of the matrix with its transpose, computed
+row by row through the postings of each n-gram. The NEIGHBOURS best matches
+per entry (with a different answer, and preferring the same word shape:
+verb/adjective vs. noun) are cached in .cache/ keyed by a hash of
+vocab.json, so choosing distractors for a card is a list lookup.
+
+    python distractors.py           # precompute the cache
+    python distractors.py 모순      # show an entry's neighbours
+"""
+
+import argparse
+import heapq
+import math
+import random
+import re
+from collections import Counter
+
+import bundle
+import perf
+import vocab
+
+CACHE_FILE = bundle.CACHE_DIR / "distractors.json"
+RULES_VERSION = 1  # bump when features or ranking change, to invalidate the cache
+NEIGHBOURS = 8     # kept per entry; a card's distractors are drawn from these
+MAX_DF = 0.02      # n-grams in a larger share of entries are ignored
+
+_WORD = re.compile(r"[a-z]+")
+_STOPWORDS = {"a", "an", "the", "to", "of", "or", "and", "in", "on", "for", "be", "is", "as", "at",
+              "by", "with", "one", "s", "sb", "sth", "something", "someone", "oneself"}
+
+
+def features(entry: dict) -> Counter:
+    """Character n-gram counts for one entry, tagged by field."""
+    feats: Counter = Counter()
+    for word in _WORD.findall(entry["english"].lower()):
+        if word not in _STOPWORDS:
+            padded = f" {word} "
+            feats.update("e" + padded[i:i + 3] for i in range(len(padded) - 2))
+    for word in entry["korean"].split():
+        feats.update("k" + word[i:i + 2] for i in range(max(1, len(word) - 1)))
+    feats.update("h" + ch for ch in entry.get("hanja", "") if "一" <= ch <= "鿿")
+    return feats
+
+
+def _shape(entry: dict) -> bool:
+    """True for predicates (ending in -다), which make poor distractors for nouns and vice versa."""
+    return entry["korean"].rstrip().endswith("다")
+
+
+def _answer_key(text: str) -> str:
+    return re.sub(r"\W+", "", text.lower())
+
+
+def _option_keys(entry: dict) -> tuple[tuple[str, str], tuple[str, str]]:
+    return ("english", _answer_key(entry["english"])), ("korean", _answer_key(entry["korean"]))
+
+
+def _flatten(data: dict[str, list[dict]]) -> list[tuple[str, int, dict]]:
+    return [(cat, i, entry) for cat, entries in data.items() for i, entry in enumerate(entries)]
+
+
+@perf.timed("content.distractors_build")
+def build(data: dict[str, list[dict]], k: int = NEIGHBOURS) -> list[list[int]]:
+    """The *k* nearest entries to each entry, by position in category order."""
+    entries = [entry for _, _, entry in _flatten(data)]
+    counts = [features(entry) for entry in entries]
+    df = Counter(f for feats in counts for f in feats)
+    n = len(entries)
+    max_df = max(2, MAX_DF * n)
+    idf = {f: math.log(n / d) for f, d in df.items() if 1 < d <= max_df}
+
+    # Rows of the L2-normalized TF-IDF matrix, and its columns as postings
+    rows: list[list[tuple[str, float]]] = []
+    postings: dict[str, list[tuple[int, float]]] = {f: [] for f in idf}
+    for i, feats in enumerate(counts):
+        row = [(f, (1 + math.log(c)) * idf[f]) for f, c in feats.items() if f in idf]
+        norm = math.sqrt(sum(w * w for _, w in row)) or 1.0
+        row = [(f, w / norm) for f, w in row]
+        rows.append(row)
+        for f, w in row:
+            postings[f].append((i, w))
+
+    answers = [(_answer_key(e["english"]), _answer_key(e["korean"])) for e in entries]
+    shapes = [_shape(e) for e in entries]
+    neighbours = []
+    for i, row in enumerate(rows):
+        scores: dict[int, float] = {}
+        get = scores.get
+        for f, w in row:
+            for j, wj in postings[f]:
+                scores[j] = get(j, 0.0) + w * wj
+        english, korean = answers[i]
+        ranked = heapq.nlargest(k * 3, scores.items(), key=lambda item: item[1])
+        ranked = [j for j, _ in ranked
+                  if answers[j][0] != english and answers[j][1] != korean and j != i]
+        same = [j for j in ranked if shapes[j] == shapes[i]]
+        neighbours.append((same + [j for j in ranked if shapes[j] != shapes[i]])[:k])
+    return neighbours
+
+
+_index: tuple[int, list[tuple[str, int, dict]], dict[str, int], list[list[int]]] | None = None
+
+
+def _load():
+    """(mtime, flattened entries, category -> first position, neighbours), cached like answers.index()."""
+    global _index
+    mtime = bundle.mtime_ns(vocab.DATA_FILE)
+    if _index is not None and _index[0] == mtime:
+        return _index
+    data = vocab.load_vocab()
+    key = f"v{RULES_VERSION}:{bundle.digest(vocab.DATA_FILE)}"
+    cached = bundle.read_cache(CACHE_FILE)
+    if cached is not None and cached.get("key") == key:
+        neighbours = cached["neighbours"]
+    else:
+        neighbours = build(data)
+        bundle.write_cache(CACHE_FILE, {"key": key, "neighbours": neighbours})
+    flat = _flatten(data)
+    offsets = {}
+    for pos, (cat, i, _) in enumerate(flat):
+        offsets.setdefault(cat, pos)
+    _index = (mtime, flat, offsets, neighbours)
+    return _index
+
+
+def index() -> list[list[int]]:
+    """Neighbour positions for every vocab entry, in category order."""
+    return _load()[3]
+
+
+def choices(category: str, idx: int, k: int = 3) -> list[dict]:
+    """*k* distractor entries for vocab card (category, idx), nearest first.
+
+    Drawn from the precomputed neighbours; topped up from the same category
+    when an entry has too few. No two options, the card included, share an
+    English or a Korean answer, so the quiz is unambiguous either way round.
+    """
+    _, flat, offsets, neighbours = _load()
+    pos = offsets[category] + idx
+    entry = flat[pos][2]
+    taken = set(_option_keys(entry))
+    picked: list[int] = []
+
+    def pick(candidates):
+        for j in candidates:
+            if len(picked) == k:
+                return
+            keys = _option_keys(flat[j][2])
+            if j != pos and not taken.intersection(keys):
+                picked.append(j)
+                taken.update(keys)
+
+    near = neighbours[pos]
+    head = near[:k + 2]
+    pick(random.sample(head, len(head)) + near[k + 2:])
+    picked.sort(key=near.index)
+    if len(picked) < k:
+        start = offsets[category]
+        same_category = range(start, start + len(vocab.load_vocab()[category]))
+        pick(random.sample(same_category, len(same_category)))
+    return [flat[j][2] for j in picked]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multiple-choice distractor index for vocab.")
+    parser.add_argument("word", nargs="?", help="headword to show neighbours for; omit to just build")
+    args = parser.parse_args()
+
+    neighbours = index()
+    if args.word is None:
+        print(f"{len(neighbours)} entries, {NEIGHBOURS} neighbours each -> {CACHE_FILE}")
+        return
+    _, flat, _, _ = _load()
+    for pos, (cat, _, entry) in enumerate(flat):
+        if entry["korean"] == args.word:
+            print(f"{entry['korean']}  {entry['english']}  [{cat}]")
+            for j in neighbours[pos]:
+                print(f"  {flat[j][2]['korean']}  {flat[j][2]['english']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""Apply notes and other annotations from data/notes/ to vocab and grammar entries.
+
+Each file in data/notes/ maps category -> {headword: annotation}. The
+headword is an entry's ``korean`` (``pattern`` for grammar, as in
+merge_data.py), and the annotation is either a note string or a dict of
+fields to set on the entry. Any category in vocab.json or grammar.json can
+have annotations, spread over as many files as is convenient; files are
+read in name order and later ones win.
+
+Annotations are matched to entries through a per-category index of
+headwords, one category per worker process. For every headword the sha1
+of its annotation together with its entries, as enriched, is recorded in
+.cache/enrich.json. Only headwords whose hash no longer matches are
+re-applied: the annotation was edited, or the entry changed since (after a
+merge, say). A data file is written only if some entry in it changed.
+Entries without an annotation are left alone, and headwords that match no
+entry are reported.
+
+    python enrich.py
+    python enrich.py --dry-run --jobs 1
+"""
+
+import argparse
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import bundle
+
+DATA = Path(__file__).parent / "data"
+NOTES_DIR = DATA / "notes"
+TARGETS = (DATA / "vocab.json", DATA / "grammar.json")
+STATE_FILE = bundle.CACHE_DIR / "enrich.json"
+
+
+def _key(entry: dict) -> str:
+    return entry.get("korean") or entry.get("pattern") or ""
+
+
+def load_annotations(notes_dir: Path = NOTES_DIR) -> dict[str, dict[str, dict]]:
+    """category -> {headword: {field: value}} from every file in *notes_dir*."""
+    annotations: dict[str, dict[str, dict]] = {}
+    for path in sorted(notes_dir.glob("*.json")):
+        for cat, notes in json.loads(path.read_text(encoding="utf-8")).items():
+            for key, annotation in notes.items():
+                fields = {"notes": annotation} if isinstance(annotation, str) else annotation
+                annotations.setdefault(cat, {})[key] = fields
+    return annotations
+
+
+def key_index(entries: list[dict]) -> dict[str, list[int]]:
+    """headword -> positions of the entries with it."""
+    index: dict[str, list[int]] = {}
+    for i, entry in enumerate(entries):
+        index.setdefault(_key(entry), []).append(i)
+    return index
+
+
+def fingerprint(annotation: dict, entries: list[dict]) -> str:
+    """Hash of an annotation together with the entries it annotates."""
+    blob = json.dumps([annotation, entries], sort_keys=True, ensure_ascii=False)
+    return hashlib.sha1(blob.encode()).hexdigest()
+
+
+def enrich_category(entries: list[dict], annotations: dict[str, dict],
+                    applied: dict[str, str]) -> tuple[dict[int, dict], dict[str, str], list[str]]:
+    """Annotate one category, given the hashes *applied* by the last run.
+
+    Returns the changed entries by position, the new hashes by headword, and
+    the headwords that matched no entry.
+    """
+    index = key_index(entries)
+    changed: dict[int, dict] = {}
+    hashes: dict[str, str] = {}
+    missing: list[str] = []
+    for key, annotation in annotations.items():
+        positions = index.get(key)
+        if not positions:
+            missing.append(key)
+            continue
+        current = [entries[i] for i in positions]
+        digest = fingerprint(annotation, current)
+        if applied.get(key) != digest:
+            # New or edited annotation, or the entry changed since it was applied
+            updated = [{**entry, **annotation} for entry in current]
+            for i, entry, new in zip(positions, current, updated):
+                if new != entry:
+                    changed[i] = new
+            digest = fingerprint(annotation, updated)
+        hashes[key] = digest
+    return changed, hashes, missing
+
+
+def _enrich_task(task: tuple[list[dict], dict[str, dict], dict[str, str]]):
+    return enrich_category(*task)
+
+
+def enrich(targets=TARGETS, notes_dir: Path = NOTES_DIR, jobs: int | None = None,
+           dry_run: bool = False, state_file: Path = STATE_FILE) -> dict[str, int]:
+    """Apply every annotation to *targets*; returns counts of entries changed and headwords missing."""
+    annotations = load_annotations(notes_dir)
+    state = {}
+    if state_file.exists():
+        state = json.loads(state_file.read_text(encoding="utf-8"))
+
+    files = {path: json.loads(path.read_text(encoding="utf-8")) for path in targets if path.exists()}
+    tasks = [(path, cat) for path, data in files.items() for cat in data if cat in annotations]
+    args = [(files[path][cat], annotations[cat], state.get(path.name, {}).get(cat, {}))
+            for path, cat in tasks]
+    jobs = jobs or os.cpu_count() or 1
+    if jobs > 1 and len(tasks) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            results = list(pool.map(_enrich_task, args))
+    else:
+        results = list(map(_enrich_task, args))
+
+    unknown = set(annotations) - {cat for data in files.values() for cat in data}
+    for cat in sorted(unknown):
+        print(f"  no such category: {cat}")
+    summary = {"changed": 0, "missing": sum(len(annotations[cat]) for cat in unknown)}
+    dirty = set()
+    new_state: dict[str, dict[str, dict[str, str]]] = {}
+    for (path, cat), (changed, hashes, missing) in zip(tasks, results):
+        for i, entry in changed.items():
+            files[path][cat][i] = entry
+        if changed:
+            dirty.add(path)
+            print(f"  {cat}: {len(changed)} entries updated")
+        for key in missing:
+            print(f"  {cat}: no entry for {key}")
+        new_state.setdefault(path.name, {})[cat] = hashes
+        summary["changed"] += len(changed)
+        summary["missing"] += len(missing)
+
+    if not dry_run:
+        for path in dirty:
+            path.write_text(json.dumps(files[path], indent=2, ensure_ascii=False), encoding="utf-8")
+            print(f"Enriched {path.name}")
+        state_file.parent.mkdir(parents=True, exist_ok=True)
+        state_file.write_text(json.dumps(new_state, ensure_ascii=False), encoding="utf-8")
+    return summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Apply data/notes/ annotations to vocab and grammar.")
+    parser.add_argument("--jobs", type=int, help="worker processes (default: one per CPU)")
+    parser.add_argument("--dry-run", action="store_true", help="report changes without writing")
+    args = parser.parse_args()
+    summary = enrich(jobs=args.jobs, dry_run=args.dry_run)
+    print(f"{summary['changed']} entries enriched, {summary['missing']} headwords unmatched")
@@ -1,17 +1,26 @@
 """Grammar drill module."""
 
-import json
 import random
-from pathlib import Path
 
+import answers
+import bundle
+import perf
 import ui
 from srs import SRSEngine, GOOD
 
-DATA_FILE = Path(__file__).parent / "data" / "grammar.json"
+DATA_FILE = bundle.ROOT / "data" / "grammar.json"
 
+_cache: tuple[int, dict] | None = None  # (mtime_ns, parsed data)
 
+
+@perf.timed("content.load_grammar")
 def load_grammar() -> dict[str, list[dict]]:
-    return json.loads(DATA_FILE.read_text(encoding="utf-8"))
+    """Parsed grammar.json, re-read only when the file changes. Treat as read-only."""
+    global _cache
+    mtime = bundle.mtime_ns(DATA_FILE)
+    if _cache is None or _cache[0] != mtime:
+        _cache = (mtime, bundle.load_json(DATA_FILE))
+    return _cache[1]
 
 
 def card_id(category: str, idx: int) -> str:
@@ -25,10 +34,15 @@ def run_drill(srs: SRSEngine, session_size: int = 10):
 
     ui.clear()
     ui.banner()
-    ui.console.print("[bold]Grammar Practice[/bold]\n")
+    ui.show_title("Grammar Practice")
 
     options = ["All Patterns"] + categories
-    choice = ui.menu(options)
+    now = srs.clock()
+    counts = []
+    for cat in categories:
+        deck = srs.partition_counts(f"grammar:{cat}", now)
+        counts.append((deck["due"], max(0, len(data[cat]) - deck["seen"])))
+    choice = ui.menu(options, ui.deck_notes(counts))
 
     if choice == 0:
         selected_categories = categories
@@ -36,25 +50,26 @@ def run_drill(srs: SRSEngine, session_size: int = 10):
         selected_categories = [categories[choice - 1]]
 
     # Build pool
-    pool = []
-    for cat in selected_categories:
-        for i, entry in enumerate(data[cat]):
-            pool.append((card_id(cat, i), cat, entry))
+    with perf.span("grammar.pool"):
+        pool = []
+        for cat in selected_categories:
+            for i, entry in enumerate(data[cat]):
+                pool.append((card_id(cat, i), cat, entry))
 
-    all_ids = [cid for cid, _, _ in pool]
-    due_ids = set(srs.get_due_cards(all_ids))
+        all_ids = [cid for cid, _, _ in pool]
+        due_ids = set(srs.get_due_cards(all_ids))
 
-    due_pool = [item for item in pool if item[0] in due_ids]
-    random.shuffle(due_pool)
-    session_cards = due_pool[:session_size]
+        due_pool = [item for item in pool if item[0] in due_ids]
+        random.shuffle(due_pool)
+        session_cards = due_pool[:session_size]
 
-    if len(session_cards) < session_size:
-        rest = [item for item in pool if item[0] not in due_ids]
-        random.shuffle(rest)
-        session_cards.extend(rest[:session_size - len(session_cards)])
+        if len(session_cards) < session_size:
+            rest = [item for item in pool if item[0] not in due_ids]
+            random.shuffle(rest)
+            session_cards.extend(rest[:session_size - len(session_cards)])
 
     if not session_cards:
-        ui.console.print("[dim]No patterns available.[/dim]")
+        ui.show_notice("No patterns available.")
         ui.pause()
         return
 
@@ -63,54 +78,62 @@ def run_drill(srs: SRSEngine, session_size: int = 10):
 
     for cid, cat, entry in session_cards:
         ui.clear()
-        ui.console.print(f"[dim]{cat}[/dim]  [dim]({reviewed + 1}/{len(session_cards)})[/dim]\n")
-
-        pattern = entry["pattern"]
-        meaning = entry["meaning"]
-        explanation = entry["explanation"]
-        examples = entry.get("examples", [])
-        drill = entry.get("drill")
-
-        # Phase 1: Show pattern, ask for meaning
-        ui.show_card_prompt(pattern)
-        ui.console.print("[dim]What does this pattern mean?[/dim]\n")
-        user_answer = ui.ask("Your answer")
-        if user_answer.strip().lower() == "q":
+        ui.show_header(cat, reviewed + 1, len(session_cards))
+        shown = srs.clock()
+
+        if not present_card(entry):
             break
-        ui.console.print()
-
-        # Reveal meaning + explanation
-        ui.show_answer(meaning, explanation=explanation)
-        ui.console.print()
-
-        # Show examples
-        for ex in examples:
-            ui.show_example(ex["korean"], ex.get("english"))
-
-        # Phase 2: Fill-in drill if available
-        if drill:
-            ui.console.print("[bold bright_cyan]Fill in the blank:[/bold bright_cyan]")
-            ui.console.print(f"  {drill['prompt']}\n")
-            user_drill = ui.ask("Answer")
-            if user_drill.strip().lower() == "q":
-                break
-            ui.console.print()
-
-            is_correct = user_drill.strip() == drill["answer"]
-            ui.show_result(is_correct, drill["answer"])
-            ui.show_example(drill["full_sentence"])
-            ui.console.print()
 
         # Self-rating
         rating = ui.rating_prompt()
         if rating is None:
             break
 
-        srs.record_review(cid, rating)
+        srs.record_review(cid, rating, latency=srs.clock() - shown)
         reviewed += 1
         if rating >= GOOD:
             correct += 1
 
-    ui.console.print()
+    ui.newline()
     ui.show_session_summary(reviewed, correct)
     ui.pause()
+
+
+def present_card(entry: dict) -> bool:
+    """Quiz one grammar pattern plus its fill-in drill. Returns False if the user quit."""
+    pattern = entry["pattern"]
+    meaning = entry["meaning"]
+    explanation = entry["explanation"]
+    examples = entry.get("examples", [])
+    drill = entry.get("drill")
+
+    # Phase 1: Show pattern, ask for meaning
+    ui.show_card_prompt(pattern)
+    ui.show_instruction("What does this pattern mean?")
+    user_answer = ui.ask("Your answer")
+    if user_answer.strip().lower() == "q":
+        return False
+    ui.newline()
+
+    # Reveal meaning + explanation
+    ui.show_answer(meaning, explanation=explanation)
+    ui.newline()
+
+    # Show examples
+    for ex in examples:
+        ui.show_example(ex["korean"], ex.get("english"))
+
+    # Phase 2: Fill-in drill if available
+    if drill:
+        ui.show_fill_in(drill["prompt"])
+        user_drill = ui.ask("Answer")
+        if user_drill.strip().lower() == "q":
+            return False
+        ui.newline()
+
+        is_correct = answers.is_correct(drill, user_drill)
+        ui.show_result(is_correct, drill["answer"])
+        ui.show_example(drill["full_sentence"])
+        ui.newline()
+
+    return True
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Headless drill runner: replay scripted answers through the real drill code.
+
+Each line of the script is one card's worth of input, as JSON:
+
+    {"answer": "contradiction", "fill": "는 셈이다", "rating": 3, "elapsed": 12}
+
+``answer`` goes to the first prompt, ``fill`` to a grammar fill-in (if the
+card has one), ``rating`` is the 1-4 key from the rating bar (or "q" to end
+the session) and ``elapsed`` is how many seconds the simulated clock moves
+forward for that card. Every resulting review is written out as JSONL.
+
+    python headless.py vocab --script answers.jsonl
+    python headless.py mixed --script - --sessions 200 --cycle < answers.jsonl
+"""
+
+import argparse
+import itertools
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import ui
+from srs import SRSEngine, AGAIN, HARD, GOOD, EASY
+
+RATINGS = {"1": AGAIN, "2": HARD, "3": GOOD, "4": EASY}
+
+
+class ScriptClock:
+    """A clock that only moves when told to."""
+
+    def __init__(self, start: float):
+        self.now = start
+
+    def __call__(self) -> float:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += seconds
+
+
+class ScriptedUI:
+    """Stands in for ui.py: reads input from script steps and renders nothing."""
+
+    def __init__(self, steps: Iterable[dict], clock: ScriptClock,
+                 menu_choice: int = 0, step_seconds: float = 10.0):
+        self.steps: Iterator[dict] = iter(steps)
+        self.clock = clock
+        self.menu_choice = menu_choice
+        self.step_seconds = step_seconds
+        self.exhausted = False
+        self.last_fill_correct: bool | None = None
+        self.last_fill_answer: str | None = None
+        self._step: dict | None = None
+        self._filling = False
+
+    def _current(self) -> dict | None:
+        if self._step is None and not self.exhausted:
+            self._step = next(self.steps, None)
+            self.exhausted = self._step is None
+            self.last_fill_correct = None
+            self.last_fill_answer = None
+        return self._step
+
+    # Input
+    def menu(self, options: list[str], notes: list[str] | None = None) -> int:
+        return min(self.menu_choice, len(options) - 1)
+
+    def ask(self, prompt_text: str, default: str | None = None) -> str:
+        step = self._current()
+        if step is None:
+            return "q"
+        if self._filling:
+            self._filling = False
+            self.last_fill_answer = str(step.get("fill", ""))
+            return self.last_fill_answer
+        return str(step.get("answer", ""))
+
+    def rating_prompt(self) -> int | None:
+        step = self._current()
+        self._step = None
+        if step is None:
+            return None
+        rating = str(step.get("rating", "3"))
+        if rating.lower() == "q":
+            return None
+        self.clock.advance(float(step.get("elapsed", self.step_seconds)))
+        return RATINGS[rating]
+
+    def pause(self):
+        pass
+
+    # Output
+    def show_fill_in(self, prompt: str):
+        self._filling = True
+
+    def show_result(self, correct: bool, answer: str, explanation: str | None = None):
+        self.last_fill_correct = correct
+
+    def _noop(self, *args, **kwargs):
+        pass
+
+    clear = banner = newline = show_title = show_notice = show_header = _noop
+    show_instruction = show_card_prompt = show_answer = show_breakdown = _noop
+    show_example = show_seen_in = show_session_summary = _noop
+    show_stats = show_forecast = show_retention = show_hourly_accuracy = _noop
+    show_leeches = show_weakest = _noop
+
+
+class RecordingEngine(SRSEngine):
+    """SRSEngine that keeps a log of every review it records."""
+
+    def __init__(self, *args, frontend: ScriptedUI | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.frontend = frontend
+        self.reviews: list[dict] = []
+
+    def record_review(self, card_id: str, quality: int, now: float | None = None,
+                      latency: float | None = None) -> None:
+        super().record_review(card_id, quality, now, latency)
+        card = self.cards[card_id]
+        review = {
+            "card_id": card_id,
+            "quality": quality,
+            "reviewed_at": card.last_review,
+            "interval_days": card.interval_days,
+            "ease_factor": card.ease_factor,
+            "next_review": card.next_review,
+        }
+        if self.frontend is not None and self.frontend.last_fill_correct is not None:
+            review["fill_answer"] = self.frontend.last_fill_answer
+            review["fill_correct"] = self.frontend.last_fill_correct
+        self.reviews.append(review)
+
+
+def _session_runner(mode: str):
+    if mode == "vocab":
+        import vocab
+        return vocab.run_drill
+    if mode == "grammar":
+        import grammar
+        return grammar.run_drill
+    import main
+    return main.mixed_review
+
+
+def read_script(lines: Iterable[str]) -> Iterator[dict]:
+    for line in lines:
+        line = line.strip()
+        if line:
+            yield json.loads(line)
+
+
+def run(mode: str, steps: Iterable[dict], sessions: int | None = None, menu_choice: int = 0,
+        seed: int | None = 0, start: float | None = None, step_seconds: float = 10.0,
+        progress_file: Path | None = None) -> RecordingEngine:
+    """Run scripted sessions of *mode* ("vocab", "grammar" or "mixed").
+
+    Stops after *sessions* sessions or when the script runs out. Progress is
+    kept in memory and only written if *progress_file* is given.
+    """
+    rng_state = random.getstate()
+    random.seed(seed)
+    clock = ScriptClock(time.time() if start is None else start)
+    frontend = ScriptedUI(steps, clock, menu_choice, step_seconds)
+    if progress_file is None:
+        progress_file = Path(tempfile.mkdtemp()) / "progress.json"
+    engine = RecordingEngine(progress_file, autosave=False, clock=clock, frontend=frontend)
+    runner = _session_runner(mode)
+
+    ui.use(frontend)
+    try:
+        for _ in itertools.count() if sessions is None else range(sessions):
+            if frontend.exhausted:
+                break
+            runner(engine)
+    finally:
+        ui.use(None)
+        random.setstate(rng_state)  # the seed is for this run, not the caller's RNG
+    return engine
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay scripted answers through the drills.")
+    parser.add_argument("mode", choices=["vocab", "grammar", "mixed"])
+    parser.add_argument("--script", default="-", help="JSONL script path, or - for stdin")
+    parser.add_argument("--sessions", type=int, help="stop after this many sessions")
+    parser.add_argument("--cycle", action="store_true", help="loop the script (needs --sessions)")
+    parser.add_argument("--category", type=int, default=0, help="menu index; 0 = all categories")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start", type=float, help="simulated start time (unix seconds)")
+    parser.add_argument("--step", type=float, default=10.0, help="default seconds per card")
+    parser.add_argument("--progress", type=Path, help="load and save progress at this path")
+    parser.add_argument("--out", type=Path, help="write reviews here instead of stdout")
+    args = parser.parse_args()
+
+    if args.cycle and args.sessions is None:
+        parser.error("--cycle needs --sessions")
+
+    source = sys.stdin if args.script == "-" else open(args.script, encoding="utf-8")
+    with source:
+        steps = list(read_script(source))
+    if args.cycle:
+        steps = itertools.cycle(steps)
+
+    began = time.perf_counter()
+    engine = run(args.mode, steps, args.sessions, args.category, args.seed,
+                 args.start, args.step, args.progress)
+    elapsed = time.perf_counter() - began
+    if args.progress is not None:
+        engine.save()
+
+    lines = [json.dumps(review, ensure_ascii=False) + "\n" for review in engine.reviews]
+    if args.out is not None:
+        args.out.write_text("".join(lines), encoding="utf-8")
+    else:
+        sys.stdout.writelines(lines)
+
+    n = len(engine.reviews)
+    rate = n / elapsed if elapsed > 0 else 0.0
+    print(f"{n} reviews in {elapsed:.3f}s ({rate:,.0f} reviews/s)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""Per-review history log and analytics over it.
+
+Card keeps only running totals, so an SRSEngine given a HistoryLog also
+appends every review to it; the app keeps the log next to the progress file
+(progress.history/). The log is columnar and append-only: one binary file
+per column, written with the array module, plus cards.txt mapping the
+integer card column to card ids. Loading a column is one read straight into
+an array, and the analytics below are C-level scans over those arrays.
+
+    card           uint32   index into cards.txt
+    ts             float64  unix time of the review
+    rating         uint8    SM-2 quality (0, 2, 3, 5)
+    prev_interval  float32  interval in days before this review
+    latency        float32  seconds from card shown to rating; NaN if unknown
+"""
+
+import math
+import operator
+import time
+from array import array
+from bisect import bisect_right
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import compress, repeat
+from pathlib import Path
+from typing import Iterable
+
+import perf
+
+GOOD = 3  # srs.GOOD; SM-2 qualities at or above it count as recalled
+
+COLUMNS = (("card", "I"), ("ts", "d"), ("rating", "B"), ("prev_interval", "f"), ("latency", "f"))
+
+# Retention curve buckets, by the interval (days) a card was reviewed at
+INTERVAL_EDGES = (1, 3, 7, 21, 60)
+INTERVAL_LABELS = ("<1d", "1-3d", "3-7d", "1-3w", "3w-2m", "2m+")
+
+LEECH_LAPSES = 4  # lapses (failures of a card already on a 1d+ interval) that make a leech
+
+
+@dataclass
+class Reviews:
+    """The history as parallel column arrays, plus the card-id dictionary."""
+    card: array
+    ts: array
+    rating: array
+    prev_interval: array
+    latency: array
+    card_ids: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ts)
+
+
+class HistoryLog:
+    """Append-only columnar review log in *directory*."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self._ids: dict[str, int] | None = None
+        self._repaired = False
+
+    def _path(self, name: str) -> Path:
+        return self.directory / f"{name}.bin"
+
+    def _card_index(self) -> dict[str, int]:
+        if self._ids is None:
+            path = self.directory / "cards.txt"
+            text = path.read_text(encoding="utf-8") if path.exists() else ""
+            lines = text.split("\n")[:-1]  # a last line without its newline was torn
+            self._ids = {cid: i for i, cid in enumerate(lines)}
+        return self._ids
+
+    def _repair(self) -> None:
+        """Cut every file back to the last complete row, so appends after a crash stay aligned."""
+        self._repaired = True
+        sizes = []
+        for name, code in COLUMNS:
+            path = self._path(name)
+            size = path.stat().st_size if path.exists() else 0
+            sizes.append((path, size, array(code).itemsize))
+        rows = min(size // itemsize for _, size, itemsize in sizes)
+        for path, size, itemsize in sizes:
+            if size != rows * itemsize:
+                with open(path, "r+b") as f:
+                    f.truncate(rows * itemsize)
+        cards = self.directory / "cards.txt"
+        if cards.exists():
+            data = cards.read_bytes()
+            if data and not data.endswith(b"\n"):
+                with open(cards, "r+b") as f:
+                    f.truncate(data.rfind(b"\n") + 1)
+                self._ids = None
+
+    def append(self, card_id: str, ts: float, rating: int, prev_interval: float,
+               latency: float | None = None) -> None:
+        self.append_many([(card_id, ts, rating, prev_interval, latency)])
+
+    @perf.timed("history.append")
+    def append_many(self, rows: Iterable[tuple[str, float, int, float, float | None]]) -> None:
+        """Append (card_id, ts, rating, prev_interval, latency) rows."""
+        if not self._repaired:
+            self._repair()
+        ids = self._card_index()
+        new_ids = []
+        columns = [array(code) for _, code in COLUMNS]
+        card, ts, rating, prev, latency = columns
+        for cid, when, quality, interval, seconds in rows:
+            index = ids.get(cid)
+            if index is None:
+                index = ids[cid] = len(ids)
+                new_ids.append(cid)
+            card.append(index)
+            ts.append(when)
+            rating.append(quality)
+            prev.append(interval)
+            latency.append(math.nan if seconds is None else seconds)
+        if not ts:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Card ids first, so every index on disk resolves even after a crash
+        if new_ids:
+            with open(self.directory / "cards.txt", "a", encoding="utf-8") as f:
+                f.write("".join(cid + "\n" for cid in new_ids))
+        for (name, _), values in zip(COLUMNS, columns):
+            with open(self._path(name), "ab") as f:
+                values.tofile(f)
+
+    @perf.timed("history.read")
+    def read(self) -> Reviews:
+        """Load every column. A partly written last row (after a crash) is dropped."""
+        columns = []
+        for name, code in COLUMNS:
+            values = array(code)
+            path = self._path(name)
+            if path.exists():
+                with open(path, "rb") as f:
+                    data = f.read()
+                values.frombytes(data[:len(data) - len(data) % values.itemsize])
+            columns.append(values)
+        rows = min(len(c) for c in columns)
+        columns = [c if len(c) == rows else c[:rows] for c in columns]
+        self._ids = None
+        ids = list(self._card_index())
+        return Reviews(*columns, card_ids=ids)
+
+
+def _category(card_id: str) -> str:
+    return card_id.rpartition(":")[0]
+
+
+# The scans below avoid per-row Python code: each column goes through map(),
+# compress() and Counter() with builtin callables, which run at C speed.
+
+def _recalled(reviews: Reviews):
+    return map(GOOD.__le__, reviews.rating)
+
+
+@perf.timed("history.retention")
+def retention(reviews: Reviews, by_category: bool = False) -> dict[str, list[tuple[str, int, float]]]:
+    """Share of reviews recalled, by the interval the card had been scheduled at.
+
+    Returns {deck: [(bucket label, reviews, recall rate), ...]}; the deck is
+    "all" unless *by_category*. First reviews (no interval yet) are left out.
+    """
+    buckets = map(partial(bisect_right, INTERVAL_EDGES), reviews.prev_interval)
+    if by_category:
+        deck_of = [_category(cid) for cid in reviews.card_ids]
+        keys = list(zip(map(deck_of.__getitem__, reviews.card), buckets))
+    else:
+        keys = list(zip(repeat("all"), buckets))
+    seen = map((0.0).__lt__, reviews.prev_interval)
+    totals = Counter(compress(keys, seen))
+    seen = map((0.0).__lt__, reviews.prev_interval)
+    recalled = Counter(compress(keys, map(operator.and_, seen, _recalled(reviews))))
+    curves: dict[str, list[tuple[str, int, float]]] = defaultdict(list)
+    for (deck, b), n in sorted(totals.items()):
+        curves[deck].append((INTERVAL_LABELS[b], n, recalled[deck, b] / n))
+    return dict(curves)
+
+
+@perf.timed("history.hourly_accuracy")
+def hourly_accuracy(reviews: Reviews, utc_offset: float | None = None) -> list[tuple[int, float]]:
+    """(reviews, accuracy) for each local hour 0-23.
+
+    Hours use one UTC offset for the whole log (the current one by default),
+    so reviews across a DST change can land an hour off.
+    """
+    if utc_offset is None:
+        utc_offset = time.localtime().tm_gmtoff
+    # Hours since the epoch, local; folded onto the clock after counting
+    hours = list(map(int, map((1 / 3600).__mul__, map(float(utc_offset).__add__, reviews.ts))))
+    totals = [0] * 24
+    correct = [0] * 24
+    for hour, n in Counter(hours).items():
+        totals[hour % 24] += n
+    for hour, n in Counter(compress(hours, _recalled(reviews))).items():
+        correct[hour % 24] += n
+    return [(n, correct[h] / n if n else 0.0) for h, n in enumerate(totals)]
+
+
+@perf.timed("history.leeches")
+def leeches(reviews: Reviews, min_lapses: int = LEECH_LAPSES) -> list[tuple[str, int, int]]:
+    """Cards that keep lapsing: [(card_id, lapses, current failure streak)], worst first."""
+    failed = map(GOOD.__gt__, reviews.rating)
+    lapsed = map(operator.and_, failed, map((1.0).__le__, reviews.prev_interval))
+    lapses = {c: n for c, n in Counter(compress(reviews.card, lapsed)).items() if n >= min_lapses}
+
+    # Trailing failures, walking back from the newest review until each leech has a success
+    streak = dict.fromkeys(lapses, 0)
+    open_cards = set(lapses)
+    for card, rating in zip(reversed(reviews.card), reversed(reviews.rating)):
+        if not open_cards:
+            break
+        if card in open_cards:
+            if rating >= GOOD:
+                open_cards.discard(card)
+            else:
+                streak[card] += 1
+
+    found = [(reviews.card_ids[c], n, streak[c]) for c, n in lapses.items()]
+    found.sort(key=lambda row: (-row[1], -row[2], row[0]))
+    return found
+
+
+def kind_latency(reviews: Reviews, recent: int = 50) -> dict[str, float]:
+    """Median seconds from card shown to rating for each card kind ("vocab", "grammar"),
+    over that kind's last *recent* measured reviews."""
+    kind_of = [cid.partition(":")[0] for cid in reviews.card_ids]
+    kinds = list(map(kind_of.__getitem__, reviews.card))
+    medians = {}
+    for kind in set(kind_of):
+        mine = array("f", compress(reviews.latency, map(kind.__eq__, kinds)))
+        known = sorted(list(compress(mine, map(operator.eq, mine, mine)))[-recent:])  # NaN != NaN
+        if known:
+            medians[kind] = known[len(known) // 2]
+    return medians
+
+
+def median_latency(reviews: Reviews) -> float | None:
+    """Median seconds from card shown to rating, over reviews where it was measured."""
+    known = sorted(compress(reviews.latency, map(operator.eq, reviews.latency, reviews.latency)))  # NaN != NaN
+    return known[len(known) // 2] if known else None
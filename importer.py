@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""Bulk import of review history from other flashcard tools.
+
+Reads a CSV/TSV (with a header row) or JSONL review log one row at a time,
+so memory stays flat however long the log is. Each row needs a rating and a
+time, plus something to identify the card:
+
+    card_id                vocab:<category>:<idx> / grammar:<category>:<idx>
+    korean                 matched against vocab headwords and grammar patterns
+    english                used when korean is missing or unknown, if unambiguous
+
+Ratings are the usual 1-4 buttons (Again/Hard/Good/Easy, names accepted
+too), or raw SM-2 qualities 0-5 with --scale sm2. Times are unix seconds,
+milliseconds (as in an Anki revlog) or ISO 8601. Rows are resolved and
+replayed through SM-2 in batches, and progress is saved once at the end.
+
+    python importer.py revlog.csv
+    python importer.py history.jsonl --progress other.json --dry-run
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator
+
+import grammar
+import history
+import vocab
+from srs import SRSEngine, AGAIN, HARD, GOOD, EASY, PROGRESS_FILE
+
+BATCH_SIZE = 50_000
+
+BUTTONS = {"1": AGAIN, "2": HARD, "3": GOOD, "4": EASY,
+           "again": AGAIN, "hard": HARD, "good": GOOD, "easy": EASY}
+SM2 = {str(q): q for q in range(6)}
+
+# Accepted spellings of each column
+RATING_COLUMNS = ("rating", "ease", "quality", "button")
+TIME_COLUMNS = ("reviewed_at", "timestamp", "time", "date", "id")
+
+
+def _key(text: str) -> str:
+    return "".join(text.split()).lower()
+
+
+class CardMatcher:
+    """Resolve korean/english text to card ids."""
+
+    def __init__(self, vocab_data: dict[str, list[dict]], grammar_data: dict[str, list[dict]]):
+        self.korean: dict[str, str] = {}
+        english: dict[str, str | None] = {}
+        for cat, entries in vocab_data.items():
+            for i, entry in enumerate(entries):
+                cid = vocab.card_id(cat, i)
+                self.korean.setdefault(_key(entry["korean"]), cid)
+                gloss = _key(entry.get("english", ""))
+                english[gloss] = None if english.get(gloss, cid) != cid else cid
+        for cat, entries in grammar_data.items():
+            for i, entry in enumerate(entries):
+                self.korean.setdefault(_key(entry["pattern"]), grammar.card_id(cat, i))
+        # A gloss shared by several cards identifies none of them
+        self.english = {gloss: cid for gloss, cid in english.items() if cid is not None}
+        self._seen: dict[tuple, str | None] = {}  # raw (korean, english) -> card id
+
+    def match(self, korean: str | None, english: str | None) -> str | None:
+        try:
+            return self._seen[korean, english]
+        except KeyError:
+            pass
+        cid = self.korean.get(_key(korean)) if korean else None
+        if cid is None and english:
+            cid = self.english.get(_key(english))
+        self._seen[korean, english] = cid
+        return cid
+
+
+def parse_time(value) -> float:
+    """Unix seconds from seconds, milliseconds or an ISO 8601 string."""
+    try:
+        seconds = float(value)
+    except ValueError:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+    return seconds / 1000 if seconds > 1e11 else seconds
+
+
+def _column(row: dict, names: tuple[str, ...]):
+    for name in names:
+        value = row.get(name)
+        if value not in (None, ""):
+            return value
+    return None
+
+
+Row = tuple  # (card_id, korean, english, rating, time); missing fields are None
+
+
+def _csv_rows(f, delimiter: str) -> Iterator[Row]:
+    reader = csv.reader(f, delimiter=delimiter)
+    header = [name.strip().lower() for name in next(reader, [])]
+
+    def index(*names):
+        return next((header.index(n) for n in names if n in header), None)
+
+    columns = (index("card_id"), index("korean"), index("english"),
+               index(*RATING_COLUMNS), index(*TIME_COLUMNS))
+    width = len(header)
+    for record in reader:
+        if len(record) < width:
+            record += [""] * (width - len(record))
+        yield tuple(record[i] or None if i is not None else None for i in columns)
+
+
+def _jsonl_rows(lines) -> Iterator[Row]:
+    for line in lines:
+        if line.strip():
+            row = json.loads(line)
+            yield (row.get("card_id"), row.get("korean"), row.get("english"),
+                   _column(row, RATING_COLUMNS), _column(row, TIME_COLUMNS))
+
+
+def read_rows(path: Path) -> Iterator[Row]:
+    """Stream rows from a CSV, TSV or JSONL file ("-" reads JSONL from stdin)."""
+    if str(path) == "-":
+        yield from _jsonl_rows(sys.stdin)
+        return
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.suffix in (".csv", ".tsv"):
+            yield from _csv_rows(f, "\t" if path.suffix == ".tsv" else ",")
+        else:
+            yield from _jsonl_rows(f)
+
+
+class ImportReport:
+    def __init__(self):
+        self.rows = 0
+        self.applied = 0
+        self.skipped = 0      # at or before the card's last review: already imported
+        self.invalid = 0      # missing or unreadable rating/time
+        self.unmatched: Counter[str] = Counter()
+        self.seconds = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.rows / self.seconds if self.seconds > 0 else 0.0
+
+
+def import_history(engine: SRSEngine, rows: Iterable[Row], matcher: CardMatcher,
+                   scale: dict[str, int] = BUTTONS, batch_size: int = BATCH_SIZE) -> ImportReport:
+    """Replay *rows* (as from read_rows) into *engine* in batches. The caller saves the engine."""
+    report = ImportReport()
+    began = time.perf_counter()
+    rows = iter(rows)
+    match = matcher.match
+    while True:
+        batch = list(itertools.islice(rows, batch_size))
+        if not batch:
+            break
+        report.rows += len(batch)
+        reviews = []
+        for cid, korean, english, rating, when in batch:
+            if cid is None:
+                cid = match(korean, english)
+                if cid is None:
+                    report.unmatched[korean or english or "?"] += 1
+                    continue
+            quality = scale.get(rating)
+            if quality is None and rating is not None:
+                quality = scale.get(str(rating).strip().lower())
+            if quality is None or when is None:
+                report.invalid += 1
+                continue
+            try:
+                reviews.append((cid, quality, parse_time(when)))
+            except ValueError:
+                report.invalid += 1
+        applied, skipped = engine.replay(reviews)
+        report.applied += applied
+        report.skipped += skipped
+    report.seconds = time.perf_counter() - began
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import review history into progress.json.")
+    parser.add_argument("log", type=Path, help="CSV/TSV with a header row, or JSONL (- for stdin)")
+    parser.add_argument("--scale", choices=["buttons", "sm2"], default="buttons",
+                        help="ratings are 1-4 buttons (default) or SM-2 qualities 0-5")
+    parser.add_argument("--progress", type=Path, help="progress file (default: progress.json)")
+    parser.add_argument("--batch", type=int, default=BATCH_SIZE)
+    parser.add_argument("--dry-run", action="store_true", help="report without saving")
+    args = parser.parse_args()
+
+    progress = args.progress or PROGRESS_FILE
+    # Imported reviews go into the review log too, unless nothing is to be saved
+    log = None if args.dry_run else history.HistoryLog(progress.with_suffix(".history"))
+    engine = SRSEngine(progress, autosave=False, history=log)
+    matcher = CardMatcher(vocab.load_vocab(), grammar.load_grammar())
+    report = import_history(engine, read_rows(args.log), matcher,
+                            BUTTONS if args.scale == "buttons" else SM2, args.batch)
+    if not args.dry_run:
+        engine.save()
+
+    print(f"{report.rows:,} rows in {report.seconds:.2f}s ({report.rate:,.0f} rows/s)")
+    print(f"  applied {report.applied:,}, already imported {report.skipped:,}, "
+          f"invalid {report.invalid:,}, unmatched {sum(report.unmatched.values()):,}")
+    for text, n in report.unmatched.most_common(10):
+        print(f"    {n:>6}  {text}")
+    if args.dry_run:
+        print("Dry run: nothing saved.")
+
+
+if __name__ == "__main__":
+    main()
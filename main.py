@@ -1,167 +1,227 @@
 #!/usr/bin/env python3
 """Korean Coach — Advanced Fluency Trainer."""
 
-import random
+import contextlib
+import os
 import sys
 
+import decks
+import history
+import perf
+import timebox
 import ui
-from srs import SRSEngine, GOOD
+from srs import SRSEngine, GOOD, PROGRESS_FILE
 import vocab
 import grammar
 
+DEFAULT_MINUTES = 10
+
+
+def _pool(kinds: tuple[str, ...] = ("vocab", "grammar")) -> dict[str, tuple[str, str, dict]]:
+    """Every card of the given kinds: card_id -> (kind, category, entry)."""
+    pool = {}
+    if "vocab" in kinds:
+        for cat, entries in vocab.load_vocab().items():
+            for i, entry in enumerate(entries):
+                pool[vocab.card_id(cat, i)] = ("vocab", cat, entry)
+    if "grammar" in kinds:
+        for cat, entries in grammar.load_grammar().items():
+            for i, entry in enumerate(entries):
+                pool[grammar.card_id(cat, i)] = ("grammar", cat, entry)
+    return pool
+
 
 def mixed_review(srs: SRSEngine):
     """Mixed review pulling from both vocab and grammar, prioritizing weak cards."""
-    vocab_data = vocab.load_vocab()
-    grammar_data = grammar.load_grammar()
-
-    # Build full pool
-    pool = []
-    for cat, entries in vocab_data.items():
-        for i, entry in enumerate(entries):
-            pool.append((vocab.card_id(cat, i), "vocab", cat, entry))
-    for cat, entries in grammar_data.items():
-        for i, entry in enumerate(entries):
-            pool.append((grammar.card_id(cat, i), "grammar", cat, entry))
-
-    all_ids = [cid for cid, _, _, _ in pool]
-    due_ids = set(srs.get_due_cards(all_ids))
-
-    due_pool = [item for item in pool if item[0] in due_ids]
-    random.shuffle(due_pool)
-    session_cards = due_pool[:15]
-
-    if len(session_cards) < 15:
-        rest = [item for item in pool if item[0] not in due_ids]
-        random.shuffle(rest)
-        session_cards.extend(rest[:15 - len(session_cards)])
+    with perf.span("mixed.pool"):
+        pool = _pool()
+        # Lowest estimated recall first; unseen cards fill in after the weak ones
+        session_cards = [(cid, *pool[cid]) for cid in srs.weakest(list(pool), 15)]
+    _review(srs, session_cards)
+
+
+def deck_review(srs: SRSEngine, query: decks.Query):
+    """A session over a filtered deck, weakest cards first like mixed review."""
+    pool = decks.entries(query.select(srs))
+    session_cards = [(cid, *pool[cid]) for cid in srs.weakest(list(pool), 15)]
+    _review(srs, session_cards, empty="No cards match this deck right now.")
 
+
+def timed_review(srs: SRSEngine, minutes: float, kinds: tuple[str, ...] = ("vocab", "grammar")):
+    """Weakest cards first, for as many as fit in *minutes* (see timebox.py)."""
+    box = timebox.Timebox.for_engine(srs, minutes)
+    with perf.span("timed.pool"):
+        pool = _pool(kinds)
+        session_cards = [(cid, *pool[cid]) for cid in srs.weakest(list(pool), len(pool))]
+    _review(srs, session_cards, box=box)
+
+
+def _review(srs: SRSEngine, session_cards: list[tuple[str, str, str, dict]],
+            empty: str = "No cards available.", box: timebox.Timebox | None = None):
+    """Drill (card_id, kind, category, entry) cards of either kind.
+
+    With a timebox, *session_cards* is the ranked queue to draw from: cards
+    are taken in order while their kind fits the time left, and the session
+    ends when no kind does.
+    """
     if not session_cards:
-        ui.console.print("[dim]No cards available.[/dim]")
+        ui.show_notice(empty)
         ui.pause()
         return
 
     reviewed = 0
     correct = 0
 
-    for cid, kind, cat, entry in session_cards:
+    for position, (cid, kind, cat, entry) in enumerate(session_cards):
+        if box is None:
+            total = len(session_cards)
+        elif box.expired():
+            break
+        elif not box.fits(kind):
+            continue
+        else:
+            # Re-planned every card, as the estimates move and the clock runs
+            total = reviewed + box.plan(kind for _, kind, _, _ in session_cards[position:])
         ui.clear()
-        ui.console.print(f"[dim]{cat}[/dim]  [dim]({reviewed + 1}/{len(session_cards)})[/dim]\n")
-
-        if kind == "vocab":
-            korean = entry["korean"]
-            english = entry["english"]
-
-            is_comparison = " vs " in korean
-
-            if is_comparison or random.random() < 0.5:
-                ui.show_card_prompt(korean, hint=entry.get("hanja"))
-                ui.console.print("[dim]What does this mean?[/dim]\n")
-                user_answer = ui.ask("Your answer")
-                if user_answer.strip().lower() == "q":
-                    break
-                ui.console.print()
-                ui.show_answer(english, explanation=entry.get("notes"))
-            else:
-                ui.show_card_prompt(english)
-                ui.console.print("[dim]What is this in Korean?[/dim]\n")
-                user_answer = ui.ask("Your answer")
-                if user_answer.strip().lower() == "q":
-                    break
-                ui.console.print()
-                ui.show_answer(korean, explanation=entry.get("notes"))
-
-            if "breakdown" in entry:
-                ui.show_breakdown(entry["breakdown"])
-
-            if "example" in entry:
-                ui.show_example(entry["example"], entry.get("example_en"))
-
-        elif kind == "grammar":
-            pattern = entry["pattern"]
-            meaning = entry["meaning"]
-            explanation = entry["explanation"]
-            examples = entry.get("examples", [])
-            drill = entry.get("drill")
-
-            ui.show_card_prompt(pattern)
-            ui.console.print("[dim]What does this pattern mean?[/dim]\n")
-            user_answer = ui.ask("Your answer")
-            if user_answer.strip().lower() == "q":
-                break
-            ui.console.print()
-            ui.show_answer(meaning, explanation=explanation)
-            ui.console.print()
-
-            for ex in examples:
-                ui.show_example(ex["korean"], ex.get("english"))
-
-            if drill:
-                ui.console.print("[bold bright_cyan]Fill in the blank:[/bold bright_cyan]")
-                ui.console.print(f"  {drill['prompt']}\n")
-                user_drill = ui.ask("Answer")
-                if user_drill.strip().lower() == "q":
-                    break
-                ui.console.print()
-                is_correct = user_drill.strip() == drill["answer"]
-                ui.show_result(is_correct, drill["answer"])
-                ui.show_example(drill["full_sentence"])
-                ui.console.print()
+        ui.show_header(cat, reviewed + 1, total)
+        shown = srs.clock()
+
+        presented = vocab.present_card(entry, cid) if kind == "vocab" else grammar.present_card(entry)
+        if not presented:
+            break
 
         rating = ui.rating_prompt()
         if rating is None:
             break
 
-        srs.record_review(cid, rating)
+        latency = srs.clock() - shown
+        srs.record_review(cid, rating, latency=latency)
+        if box is not None:
+            box.observe(kind, latency)
         reviewed += 1
         if rating >= GOOD:
             correct += 1
 
-    ui.console.print()
+    ui.newline()
     ui.show_session_summary(reviewed, correct)
     ui.pause()
 
 
+def timed_session(srs: SRSEngine):
+    """Ask how long to study and what, then run a timed review."""
+    ui.clear()
+    ui.banner()
+    ui.show_title("Timed Session")
+    choice = ui.menu(["Everything (weakest first)", "Vocabulary", "Grammar", "Back"])
+    if choice == 3:
+        return
+    kinds = [("vocab", "grammar"), ("vocab",), ("grammar",)][choice]
+    text = ui.ask("Minutes", default=str(DEFAULT_MINUTES)).strip()
+    try:
+        minutes = float(text)
+    except ValueError:
+        return
+    if minutes <= 0:
+        return
+    with _drill_screen():
+        timed_review(srs, minutes, kinds)
+
+
+def custom_decks(srs: SRSEngine):
+    """Pick a saved filtered deck (see decks.py), or study and save a new query."""
+    ui.clear()
+    ui.banner()
+    ui.show_title("Custom Decks")
+    saved = decks.load_decks()
+    queries = {}
+    for name, text in saved.items():
+        try:
+            queries[name] = decks.Query(text)
+        except ValueError:
+            pass
+    counts = [queries[name].counts(srs) if name in queries else (0, 0) for name in saved]
+    notes = ui.deck_notes(counts)[1:] + ["", ""]
+    choice = ui.menu([*saved, "New query...", "Back"], notes)
+
+    if choice == len(saved) + 1:
+        return
+    if choice == len(saved):
+        ui.show_instruction("e.g.  hanja:心 due:yes   category:\"연어*\" reviews>5   grammar text:\"더니\"")
+        text = ui.ask("Query")
+        if text.lower() == "q" or not text.strip():
+            return
+        try:
+            query = decks.Query(text)
+        except ValueError as e:
+            ui.show_notice(f"Invalid query: {e}")
+            ui.pause()
+            return
+        name = ui.ask("Save as (Enter to study without saving)").strip()
+        if name and name.lower() != "q":
+            saved[name] = query.text
+            decks.save_decks(saved)
+    else:
+        name = list(saved)[choice]
+        if name not in queries:
+            ui.show_notice(f"Invalid query: {saved[name]}")
+            ui.pause()
+            return
+        query = queries[name]
+
+    with _drill_screen():
+        deck_review(srs, query)
+
+
 def view_progress(srs: SRSEngine):
     ui.clear()
     ui.banner()
     stats = srs.get_stats()
     ui.show_stats(stats)
+    if srs.cards:
+        ui.show_forecast(srs.forecast(14))
+    if srs.history is not None:
+        _show_history(srs.history.read())
 
     # Show weakest cards
     if srs.cards:
         weak = sorted(srs.cards.values(), key=lambda c: c.ease_factor)[:10]
-        ui.console.print("[bold]Weakest Cards[/bold]\n")
-        from rich.table import Table
-        from rich import box
-        table = Table(box=box.SIMPLE, border_style="dim")
-        table.add_column("Card", style="white")
-        table.add_column("Accuracy", justify="right", style="bright_yellow")
-        table.add_column("Reviews", justify="right", style="dim")
-        table.add_column("Ease", justify="right", style="dim")
-        for card in weak:
-            # Extract readable name from card_id
-            parts = card.card_id.split(":", 2)
-            name = parts[2] if len(parts) > 2 else card.card_id
-            # Try to resolve to actual content
-            label = _resolve_card_label(card.card_id)
-            table.add_row(
-                label,
-                f"{card.accuracy:.0%}",
-                str(card.total_reviews),
-                f"{card.ease_factor:.1f}",
-            )
-        ui.console.print(table)
-    ui.console.print()
+        ui.show_weakest([
+            (_resolve_card_label(card.card_id), card.accuracy, card.total_reviews, card.ease_factor)
+            for card in weak
+        ])
     ui.pause()
 
 
+def _show_history(reviews: history.Reviews):
+    """Retention, time-of-day accuracy and leeches from the review log."""
+    if not len(reviews):
+        return
+    hardest = []
+    for deck, curve in history.retention(reviews, by_category=True).items():
+        n = sum(count for _, count, _ in curve)
+        if n >= 20:
+            recalled = sum(count * rate for _, count, rate in curve)
+            hardest.append((deck.partition(":")[2], n, recalled / n))
+    hardest.sort(key=lambda row: row[2])
+    curve = history.retention(reviews).get("all", [])
+    if curve:  # empty while every review so far is a card's first
+        ui.show_retention(curve, hardest[:5])
+    ui.show_hourly_accuracy(history.hourly_accuracy(reviews))
+    latency = history.median_latency(reviews)
+    if latency is not None:
+        ui.show_notice(f"Median time from card to rating: {latency:.1f}s\n")
+    leeches = history.leeches(reviews)[:10]
+    if leeches:
+        ui.show_leeches([(_resolve_card_label(cid), lapses, streak) for cid, lapses, streak in leeches])
+
+
 def _resolve_card_label(card_id: str) -> str:
     """Try to get a human-readable label for a card ID."""
-    parts = card_id.split(":")
-    if len(parts) < 3:
+    # Category names can contain ":" themselves ("... (Topic: Education)")
+    kind, _, rest = card_id.partition(":")
+    category, _, idx_str = rest.rpartition(":")
+    if not category:
         return card_id
-    kind, category, idx_str = parts[0], parts[1], parts[2]
     try:
         idx = int(idx_str)
     except ValueError:
@@ -177,8 +237,30 @@ def _resolve_card_label(card_id: str) -> str:
     return card_id
 
 
+def _plain_requested() -> bool:
+    return "--plain" in sys.argv[1:] or os.environ.get("KOREAN_COACH_UI") == "plain"
+
+
+def _drill_screen():
+    """Differential rendering for drill sessions on a real terminal (--redraw turns it off)."""
+    if _plain_requested():
+        return contextlib.nullcontext()
+    import screen
+    if ui.console.is_terminal and not ui.console.is_dumb_terminal and "--redraw" not in sys.argv[1:]:
+        return screen.session()
+    return contextlib.nullcontext()
+
+
 def main():
-    srs = SRSEngine()
+    if "--trace" in sys.argv[1:]:
+        perf.enable()
+    if _plain_requested():
+        import plain_ui
+        ui.set_default(plain_ui.PlainUI())
+    srs = SRSEngine(
+        load_balance="--balance" in sys.argv[1:],
+        history=history.HistoryLog(PROGRESS_FILE.with_suffix(".history")),
+    )
 
     while True:
         ui.clear()
@@ -186,31 +268,44 @@ def main():
 
         stats = srs.get_stats()
         if stats["total"] > 0:
-            ui.console.print(
-                f"[dim]Cards: {stats['total']}  |  "
+            ui.show_notice(
+                f"Cards: {stats['total']}  |  "
                 f"Due: {stats['due']}  |  "
-                f"Accuracy: {stats['accuracy']:.0%}[/dim]\n"
+                f"Accuracy: {stats['accuracy']:.0%}\n"
             )
 
         choice = ui.menu([
             "Vocabulary Drill",
+            "Vocabulary Quiz (multiple choice)",
             "Grammar Practice",
             "Mixed Review (weakest items first)",
+            "Timed Session (study for N minutes)",
+            "Custom Decks",
             "View Progress",
             "Quit",
         ])
 
         if choice == 0:
-            vocab.run_drill(srs)
+            with _drill_screen():
+                vocab.run_drill(srs)
         elif choice == 1:
-            grammar.run_drill(srs)
+            with _drill_screen():
+                vocab.run_drill(srs, multiple_choice=True)
         elif choice == 2:
-            mixed_review(srs)
+            with _drill_screen():
+                grammar.run_drill(srs)
         elif choice == 3:
-            view_progress(srs)
+            with _drill_screen():
+                mixed_review(srs)
         elif choice == 4:
+            timed_session(srs)
+        elif choice == 5:
+            custom_decks(srs)
+        elif choice == 6:
+            view_progress(srs)
+        elif choice == 7:
             ui.clear()
-            ui.console.print("[dim]수고하셨습니다! 다음에 또 만나요.[/dim]\n")
+            ui.show_notice("수고하셨습니다! 다음에 또 만나요.\n")
             sys.exit(0)
 
 
@@ -1,19 +1,31 @@
 #!/usr/bin/env python3
-"""Merge extra vocab/grammar data into the main files and sync to docs/."""
+"""Merge extra vocab/grammar data into the main files, apply data/notes/ and sync to docs/."""
 
+import argparse
 import json
 import shutil
 from pathlib import Path
 
+import dedupe
+import enrich
+
 DATA = Path(__file__).parent / "data"
 DOCS_DATA = Path(__file__).parent / "docs" / "data"
 
 
-def merge_json(main_file: Path, extra_file: Path):
-    """Merge extra entries into main file by category."""
+def merge_json(main_file: Path, extra_file: Path, auto_merge: bool = False):
+    """Merge extra entries into main file by category.
+
+    With auto_merge, extra vocab entries that near-duplicate an entry in any
+    category are folded into it instead of being appended (see dedupe.py).
+    """
     main = json.loads(main_file.read_text(encoding="utf-8"))
     extra = json.loads(extra_file.read_text(encoding="utf-8"))
 
+    if auto_merge:
+        extra, dropped = dedupe.auto_merge(main, extra)
+        print(f"Folded {dropped} near-duplicate entries from {extra_file.name}")
+
     for cat, entries in extra.items():
         if cat in main:
             # Deduplicate by korean field (or pattern for grammar)
@@ -50,13 +62,31 @@ def sync_docs():
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--auto-merge", action="store_true",
+                        help="fold near-duplicate vocab extras into existing entries")
+    parser.add_argument("--report", action="store_true",
+                        help="list likely duplicates left in vocab.json after merging")
+    args = parser.parse_args()
+
     vocab_extra = DATA / "vocab_extra.json"
     grammar_extra = DATA / "grammar_extra.json"
 
     if vocab_extra.exists():
-        merge_json(DATA / "vocab.json", vocab_extra)
+        merge_json(DATA / "vocab.json", vocab_extra, auto_merge=args.auto_merge)
     if grammar_extra.exists():
         merge_json(DATA / "grammar.json", grammar_extra)
 
+    # Annotate after merging, so merged-in entries pick up their notes too
+    summary = enrich.enrich(targets=(DATA / "vocab.json", DATA / "grammar.json"))
+    print(f"Enriched {summary['changed']} entries ({summary['missing']} notes matched no entry)")
+
+    if args.report:
+        corpus = dedupe.load_corpus([DATA / "vocab.json"])
+        report = dedupe.find_duplicates(corpus)
+        for pair in report:
+            print(f"  {pair['similarity']:.2f} {pair['reason']}: {pair['a'][1:]} / {pair['b'][1:]}")
+        print(f"{len(report)} likely duplicates in vocab.json")
+
     sync_docs()
     print("Done!")
@@ -0,0 +1,171 @@
+"""Lightweight hot-path instrumentation (timers, counters, latency histograms).
+
+Tracing is off by default. Turn it on with ``KOREAN_COACH_TRACE=1`` or
+``main.py --trace``; at exit a per-session JSON report is written to
+``traces/``. When disabled, a timed call costs one flag check.
+"""
+
+import atexit
+import json
+import math
+import os
+import time
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+
+import bundle
+
+TRACE_DIR = bundle.STATE_DIR / "traces"
+ENV_VAR = "KOREAN_COACH_TRACE"
+
+# Histogram buckets are powers of two in milliseconds: <0.125ms, <0.25ms, ... <8s
+_BUCKET_MIN_EXP = -3
+_BUCKET_MAX_EXP = 13
+
+
+class _State:
+    enabled = False
+    started = 0.0
+    timers: dict[str, list[float]] = {}  # name -> durations in ms
+    counters: dict[str, int] = {}
+    marks: dict[str, float] = {}
+    report_registered = False
+
+
+_state = _State()
+
+
+def enable(report: bool = True) -> None:
+    """Start collecting. If *report*, write the session report at exit."""
+    _state.enabled = True
+    _state.started = time.time()
+    if report and not _state.report_registered:
+        atexit.register(write_report)
+        _state.report_registered = True
+
+
+def disable() -> None:
+    _state.enabled = False
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def reset() -> None:
+    _state.timers = {}
+    _state.counters = {}
+    _state.marks = {}
+
+
+def record(name: str, ms: float) -> None:
+    """Add one latency sample (milliseconds) under *name*."""
+    if _state.enabled:
+        _state.timers.setdefault(name, []).append(ms)
+
+
+def count(name: str, n: int = 1) -> None:
+    if _state.enabled:
+        _state.counters[name] = _state.counters.get(name, 0) + n
+
+
+def mark(name: str) -> None:
+    """Remember the current time, to be closed later with ``since``."""
+    if _state.enabled:
+        _state.marks[name] = time.perf_counter()
+
+
+def since(mark_name: str, timer_name: str) -> None:
+    """Record the time elapsed since ``mark(mark_name)`` and clear the mark."""
+    if _state.enabled:
+        start = _state.marks.pop(mark_name, None)
+        if start is not None:
+            record(timer_name, (time.perf_counter() - start) * 1000)
+
+
+def discard(mark_name: str) -> None:
+    """Drop an open mark without recording it."""
+    _state.marks.pop(mark_name, None)
+
+
+@contextmanager
+def span(name: str):
+    """Time a block: ``with perf.span("vocab.pool"): ...``."""
+    if not _state.enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, (time.perf_counter() - start) * 1000)
+
+
+def timed(name: str):
+    """Decorator form of ``span``."""
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                record(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
+
+
+def _histogram(samples: list[float]) -> dict[str, int]:
+    buckets: dict[str, int] = {}
+    for ms in samples:
+        exp = math.ceil(math.log2(ms)) if ms > 0 else _BUCKET_MIN_EXP
+        exp = min(max(exp, _BUCKET_MIN_EXP), _BUCKET_MAX_EXP)
+        label = f"<{2.0 ** exp:g}ms"
+        buckets[label] = buckets.get(label, 0) + 1
+    return buckets
+
+
+def _percentile(ordered: list[float], p: float) -> float:
+    idx = min(len(ordered) - 1, int(round(p * (len(ordered) - 1))))
+    return ordered[idx]
+
+
+def summary() -> dict:
+    """Return the collected timers and counters as a JSON-ready dict."""
+    timers = {}
+    for name, samples in sorted(_state.timers.items()):
+        ordered = sorted(samples)
+        timers[name] = {
+            "count": len(ordered),
+            "total_ms": round(sum(ordered), 3),
+            "min_ms": round(ordered[0], 3),
+            "p50_ms": round(_percentile(ordered, 0.5), 3),
+            "p95_ms": round(_percentile(ordered, 0.95), 3),
+            "max_ms": round(ordered[-1], 3),
+            "histogram": _histogram(ordered),
+        }
+    return {
+        "started": _state.started,
+        "duration_s": round(time.time() - _state.started, 3) if _state.started else 0.0,
+        "timers": timers,
+        "counters": dict(sorted(_state.counters.items())),
+    }
+
+
+def write_report(path: Path | None = None) -> Path | None:
+    """Write the session report; returns its path (None if nothing was traced)."""
+    if not _state.timers and not _state.counters:
+        return None
+    if path is None:
+        stamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(_state.started or time.time()))
+        path = TRACE_DIR / f"session-{stamp}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(summary(), indent=2), encoding="utf-8")
+    return path
+
+
+if os.environ.get(ENV_VAR, "") not in ("", "0"):
+    enable()
@@ -0,0 +1,308 @@
+"""Lightweight UI backend: plain text with ANSI colour, no Rich.
+
+For slow terminals, SSH sessions and quick starts (python main.py --plain).
+Everything a drill prints is a template built once in PlainUI.__init__ and
+filled with str.format, and each call ends in a single write, so a card
+costs a few string operations instead of a Rich layout pass. Importing this
+module does not import Rich.
+"""
+
+import os
+import sys
+import unicodedata
+
+import perf
+from ui import GRADES, rating_from_choice, session_grade
+
+# SGR codes for the styles the Rich backend uses
+STYLES = {
+    "reset": "0", "bold": "1", "dim": "2", "italic": "3",
+    "red": "91", "green": "92", "yellow": "93", "blue": "94",
+    "magenta": "95", "cyan": "96", "white": "97",
+}
+
+GRADE_COLORS = ("green", "yellow", "yellow", "red")
+
+
+def display_width(text: str) -> int:
+    """Terminal columns *text* takes up; Hangul and other wide characters count two."""
+    if text.isascii():
+        return len(text)
+    return sum(2 if unicodedata.east_asian_width(ch) in "WF" else 1 for ch in text)
+
+
+def _pad(text: str, width: int, right: bool) -> str:
+    fill = " " * (width - display_width(text))
+    return fill + text if right else text + fill
+
+
+class PlainUI:
+    """A FRONTEND_API backend writing pre-formatted text to *out*."""
+
+    def __init__(self, out=None, input_file=None, color: bool | None = None):
+        self.out = out or sys.stdout
+        self.input = input_file or sys.stdin
+        if color is None:
+            isatty = getattr(self.out, "isatty", None)
+            color = bool(isatty and isatty()) and "NO_COLOR" not in os.environ
+        self.color = color
+        self._build_templates()
+
+    def _sgr(self, *styles: str) -> str:
+        if not self.color:
+            return ""
+        return "\x1b[" + ";".join(STYLES[s] for s in styles) + "m"
+
+    def _build_templates(self) -> None:
+        c, r = self._sgr, self._sgr("reset")
+        dim, bar = c("dim"), f"{c('blue')}┃{r} "
+        self._bar = bar
+        self._banner = (
+            f"\n  {c('bold', 'white')}한국어 코치{r}\n"
+            f"  {dim}Korean Coach — Advanced Fluency Trainer{r}\n\n"
+        )
+        self._menu_row = f"  {c('bold', 'cyan')}[{{number}}]{r}  {{option}}"
+        self._menu_note = f"  {dim}{{note}}{r}"
+        self._invalid_choice = f"{c('red')}Invalid choice.{r}\n"
+        self._invalid_rating = f"{c('red')}Enter 1-4 or q to quit.{r}\n"
+        self._title = f"{c('bold')}{{title}}{r}\n\n"
+        self._dim_line = f"{dim}{{text}}{r}\n"
+        self._header = f"{dim}{{category}}  ({{position}}/{{total}}){r}\n\n"
+        self._fill_in = f"{c('bold', 'cyan')}Fill in the blank:{r}\n  {{prompt}}\n\n"
+        self._card = f"\n{bar}{c('bold', 'white')}{{korean}}{r}\n"
+        self._detail = f"{bar}{dim}{{line}}{r}\n"
+        self._hint = f"{bar}{c('dim', 'italic')}{{line}}{r}\n"
+        self._answer = f"{bar}{c('bold', 'white')}{{answer}}{r}\n"
+        self._marks = (
+            f"{c('red')}┃{r} {c('bold', 'red')}✗ Incorrect{r}\n{c('red')}┃{r} {{answer}}\n",
+            f"{c('green')}┃{r} {c('bold', 'green')}✓ Correct!{r}\n{c('green')}┃{r} {{answer}}\n",
+        )
+        self._result_detail = (
+            f"{c('red')}┃{r} {dim}{{line}}{r}\n",
+            f"{c('green')}┃{r} {dim}{{line}}{r}\n",
+        )
+        self._breakdown = f"  {c('magenta')}한자 breakdown:{r} {{breakdown}}\n"
+        self._example = f"  {c('italic', 'yellow')}{{sentence}}{r}\n"
+        self._translation = f"  {dim}{{translation}}{r}\n"
+        self._seen_in_title = f"  {c('magenta')}Seen in:{r}\n"
+        self._seen_in = f"  {{sentence}} {dim}— {{where}}{r}\n"
+        self._summary = (
+            f"{c('bold')}Session Complete{r}\n"
+            f"  {c('cyan')}Reviewed{r}  {{reviewed}}\n"
+            f"  {c('cyan')}Correct{r}   {{correct}}\n"
+            f"  {c('cyan')}Accuracy{r}  {{grade}}{{accuracy:.0%}}{r}\n"
+            f"  {c('dim', 'italic')}{{comment}}{r}\n\n"
+        )
+        self._grades = tuple(c("bold", color) for color in GRADE_COLORS)
+        self._rating_bar = (
+            f"  {c('red')}[1] Again{r} {dim}didn't know{r}  "
+            f"{c('yellow')}[2] Hard{r} {dim}struggled{r}  "
+            f"{c('green')}[3] Good{r} {dim}knew it{r}  "
+            f"{c('cyan')}[4] Easy{r} {dim}effortless{r}\n"
+        )
+        self._choose = f"{c('cyan')}Choose{r} {c('bold', 'cyan')}(1){r}: "
+        self._table_title = f"{c('bold')}{{title}}{r}\n"
+        self._table_header = f"  {dim}{{row}}{r}\n"
+        self._table_row = "  {row}\n"
+        self._table_bar = f"  {c('blue')}{{bar}}{r}"
+        self._ask = f"{c('cyan')}{{prompt}}{r} {dim}(q to quit){r}: "
+        self._rate = f"{dim}Rate{r} {c('bold', 'cyan')}(3){r}: "
+        self._pause = f"{dim}Press Enter to continue{r} "
+        self._clear = "\x1b[H\x1b[2J" if self.color else "\n"
+
+    def _write(self, text: str) -> None:
+        self.out.write(text)
+
+    def _read(self, prompt: str, default: str) -> str:
+        self.out.write(prompt)
+        self.out.flush()
+        line = self.input.readline()
+        if not line:
+            raise EOFError
+        return line.strip() or default
+
+    def _lines(self, template: str, text: str) -> str:
+        return "".join(template.format(line=line) for line in text.split("\n"))
+
+    def _table(self, title: str, header: tuple[str, ...], rows: list[tuple[str, ...]],
+               bars: list[int] | None = None) -> str:
+        """*rows* in aligned columns, the first left-aligned and the rest right; *bars* adds a bar to each row."""
+        widths = [max(map(display_width, column)) for column in zip(header, *rows)]
+
+        def line(cells):
+            return "  ".join(_pad(cell, w, i > 0) for i, (cell, w) in enumerate(zip(cells, widths)))
+
+        text = self._table_title.format(title=title) + self._table_header.format(row=line(header))
+        for row, bar in zip(rows, bars or [0] * len(rows)):
+            cells = line(row) + (self._table_bar.format(bar="█" * bar) if bar else "")
+            text += self._table_row.format(row=cells)
+        return text + "\n"
+
+    # Printing
+
+    def clear(self):
+        self._write(self._clear)
+
+    def banner(self):
+        self._write(self._banner)
+
+    def menu(self, options: list[str], notes: list[str] | None = None) -> int:
+        """Display a numbered menu and return the selected index (0-based)."""
+        width = max(map(display_width, options), default=0)
+        rows = []
+        for i, option in enumerate(options):
+            row = self._menu_row.format(number=i + 1, option=option)
+            if notes and notes[i]:
+                row += " " * (width - display_width(option)) + self._menu_note.format(note=notes[i])
+            rows.append(row + "\n")
+        self._write("\n" + "".join(rows) + "\n")
+
+        while True:
+            choice = self._read(self._choose, "1")
+            try:
+                idx = int(choice) - 1
+                if 0 <= idx < len(options):
+                    return idx
+            except ValueError:
+                pass
+            self._write(self._invalid_choice)
+
+    def ask(self, prompt_text: str, default: str | None = None) -> str:
+        """Ask for input. Returns 'q' if user wants to quit."""
+        return self._read(self._ask.format(prompt=prompt_text), default or "")
+
+    def newline(self):
+        self._write("\n")
+
+    def show_title(self, title: str):
+        self._write(self._title.format(title=title))
+
+    def show_notice(self, message: str):
+        self._write(self._dim_line.format(text=message))
+
+    def show_header(self, category: str, position: int, total: int):
+        self._write(self._header.format(category=category, position=position, total=total))
+
+    def show_instruction(self, text: str):
+        self._write(self._dim_line.format(text=text) + "\n")
+
+    def show_fill_in(self, prompt: str):
+        self._write(self._fill_in.format(prompt=prompt))
+
+    @perf.timed("ui.show_card_prompt")
+    def show_card_prompt(self, korean: str, hint: str | None = None):
+        """Display a card prompt — the thing being quizzed."""
+        text = self._card.format(korean=korean)
+        if hint:
+            text += self._lines(self._hint, hint)
+        self._write(text + "\n")
+        perf.since("rated", "latency.rating_to_next_card")
+
+    @perf.timed("ui.show_answer")
+    def show_answer(self, answer: str, explanation: str | None = None):
+        """Reveal the answer (self-rated, no correct/incorrect judgment)."""
+        text = self._answer.format(answer=answer)
+        if explanation:
+            text += self._lines(self._detail, explanation)
+        self._write(text + "\n")
+
+    @perf.timed("ui.show_result")
+    def show_result(self, correct: bool, answer: str, explanation: str | None = None):
+        text = self._marks[correct].format(answer=answer)
+        if explanation:
+            text += self._lines(self._result_detail[correct], explanation)
+        self._write(text + "\n")
+
+    @perf.timed("ui.show_breakdown")
+    def show_breakdown(self, breakdown: str):
+        """Show hanja syllable breakdown for Sino-Korean words."""
+        self._write(self._breakdown.format(breakdown=breakdown))
+
+    @perf.timed("ui.show_example")
+    def show_example(self, sentence: str, translation: str | None = None):
+        text = self._example.format(sentence=sentence)
+        if translation:
+            text += self._translation.format(translation=translation)
+        self._write(text + "\n")
+
+    @perf.timed("ui.show_seen_in")
+    def show_seen_in(self, examples: list[tuple[str, str]]):
+        """Sentences from the drill texts that use the word, with where they're from."""
+        rows = [self._seen_in.format(sentence=s, where=w) for s, w in examples]
+        self._write(self._seen_in_title + "".join(rows) + "\n")
+
+    @perf.timed("ui.show_session_summary")
+    def show_session_summary(self, reviewed: int, correct: int):
+        perf.discard("rated")  # the next card is in another session, after menus and idle time
+        acc, level = session_grade(reviewed, correct)
+        self._write(self._summary.format(
+            reviewed=reviewed, correct=correct, accuracy=acc,
+            grade=self._grades[level], comment=GRADES[level][1],
+        ))
+
+    @perf.timed("ui.show_stats")
+    def show_stats(self, stats: dict):
+        rows = [
+            ("Cards Seen", str(stats["total"])),
+            ("Due Now", str(stats["due"])),
+            ("Learning (<7d)", str(stats["learning"])),
+            ("Mature (≥7d)", str(stats["mature"])),
+            ("Accuracy", f"{stats['accuracy']:.0%}"),
+        ]
+        self._write(self._table("Progress", ("Metric", "Value"), rows))
+
+    @perf.timed("ui.show_forecast")
+    def show_forecast(self, counts: list[int]):
+        """Bar chart of reviews due per day, starting today."""
+        peak = max(counts, default=0) or 1
+        rows = [("Today" if day == 0 else f"+{day}d", str(n)) for day, n in enumerate(counts)]
+        bars = [round(n / peak * 30) for n in counts]
+        self._write(self._table("Upcoming Reviews", ("Day", "Due"), rows, bars))
+
+    @perf.timed("ui.show_retention")
+    def show_retention(self, curve: list[tuple[str, int, float]], decks: list[tuple[str, int, float]]):
+        """Recall rate by the interval the card was scheduled at, then the decks recalled worst."""
+        rows = [(label, str(n), f"{rate:.0%}") for label, n, rate in curve]
+        bars = [round(rate * 20) for _, _, rate in curve]
+        text = self._table("Retention", ("Scheduled interval", "Reviews", "Recalled"), rows, bars)
+        if decks:
+            rows = [(name, str(n), f"{rate:.0%}") for name, n, rate in decks]
+            text += self._table("Hardest Categories", ("Category", "Reviews", "Recalled"), rows)
+        self._write(text)
+
+    @perf.timed("ui.show_hourly_accuracy")
+    def show_hourly_accuracy(self, hours: list[tuple[int, float]]):
+        """Accuracy for each hour of the day that has reviews."""
+        active = [(hour, n, rate) for hour, (n, rate) in enumerate(hours) if n]
+        rows = [(f"{hour:02d}:00", str(n), f"{rate:.0%}") for hour, n, rate in active]
+        bars = [round(rate * 20) for _, _, rate in active]
+        self._write(self._table("Accuracy by Hour", ("Hour", "Reviews", "Accuracy"), rows, bars))
+
+    @perf.timed("ui.show_leeches")
+    def show_leeches(self, rows: list[tuple[str, int, int]]):
+        """Cards that keep lapsing: (label, lapses, current failure streak)."""
+        rows = [(label, str(lapses), str(streak)) for label, lapses, streak in rows]
+        self._write(self._table("Leeches", ("Card", "Lapses", "Failing streak"), rows))
+
+    @perf.timed("ui.show_weakest")
+    def show_weakest(self, rows: list[tuple[str, float, int, float]]):
+        """Cards with the lowest ease: (label, accuracy, reviews, ease)."""
+        rows = [(label, f"{accuracy:.0%}", str(reviews), f"{ease:.1f}")
+                for label, accuracy, reviews, ease in rows]
+        self._write(self._table("Weakest Cards", ("Card", "Accuracy", "Reviews", "Ease"), rows))
+
+    def rating_prompt(self) -> int | None:
+        """Ask the user to self-rate after seeing the answer. Returns SRS quality."""
+        self._write(self._rating_bar)
+        while True:
+            choice = self._read(self._rate, "3")
+            rating = rating_from_choice(choice)
+            if rating is not None:
+                perf.mark("rated")
+                return rating
+            if choice.lower() == "q":
+                return None
+            self._write(self._invalid_rating)
+
+    def pause(self):
+        self._read(self._pause, "")
@@ -0,0 +1,340 @@
+"""Rich UI backend for the Korean Coach — the default (see ui.py)."""
+
+from rich.console import Console, Group
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+from rich.prompt import Prompt
+from rich import box
+
+import perf
+from ui import GRADES, rating_from_choice, session_grade
+
+console = Console()
+
+RATING_BAR = (
+    "  [bright_red][1] Again[/] [dim]didn't know[/]  "
+    "[yellow][2] Hard[/] [dim]struggled[/]  "
+    "[bright_green][3] Good[/] [dim]knew it[/]  "
+    "[bright_cyan][4] Easy[/] [dim]effortless[/]"
+)
+
+
+# Renderables. The show_* functions print these; screen.py lays them out itself.
+
+def banner_panel() -> Panel:
+    title = Text("한국어 코치", style="bold bright_white")
+    subtitle = Text("Korean Coach — Advanced Fluency Trainer", style="dim")
+    content = Text.assemble(title, "\n", subtitle)
+    return Panel(content, box=box.DOUBLE, border_style="bright_blue", padding=(1, 4))
+
+
+def menu_table(options: list[str], notes: list[str] | None = None) -> Table:
+    table = Table(box=box.SIMPLE, show_header=False, padding=(0, 2))
+    table.add_column(style="bright_cyan bold", width=4)
+    table.add_column(style="white")
+    if notes:
+        table.add_column(style="dim", justify="right")
+    for i, option in enumerate(options, 1):
+        table.add_row(f"[{i}]", option, *([notes[i - 1]] if notes else []))
+    return table
+
+
+def card_panel(korean: str, hint: str | None = None) -> Panel:
+    parts = [Text(korean, style="bold bright_white on grey23")]
+    if hint:
+        parts.append(Text(f"\n{hint}", style="dim italic"))
+    content = Text.assemble(*parts)
+    return Panel(content, box=box.ROUNDED, border_style="bright_blue", padding=(1, 3))
+
+
+def answer_panel(answer: str, explanation: str | None = None) -> Panel:
+    parts = [Text(answer, style="bold white")]
+    if explanation:
+        parts.append(Text(f"\n{explanation}", style="dim"))
+    content = Text.assemble(*parts)
+    return Panel(content, box=box.ROUNDED, border_style="bright_blue", padding=(0, 2))
+
+
+def result_panel(correct: bool, answer: str, explanation: str | None = None) -> Panel:
+    if correct:
+        mark = Text("✓ Correct!", style="bold bright_green")
+    else:
+        mark = Text("✗ Incorrect", style="bold bright_red")
+
+    parts = [mark, Text(f"\n{answer}", style="white")]
+    if explanation:
+        parts.append(Text(f"\n{explanation}", style="dim"))
+    content = Text.assemble(*parts)
+    style = "bright_green" if correct else "bright_red"
+    return Panel(content, box=box.ROUNDED, border_style=style, padding=(0, 2))
+
+
+def example_text(sentence: str, translation: str | None = None) -> Text:
+    parts = [Text(f"  {sentence}", style="italic bright_yellow")]
+    if translation:
+        parts.append(Text(f"\n  {translation}", style="dim"))
+    return Text.assemble(*parts)
+
+
+GRADE_STYLES = ("bold bright_green", "bold bright_yellow", "bold yellow", "bold bright_red")
+
+
+def summary_group(reviewed: int, correct: int) -> Group:
+    acc, level = session_grade(reviewed, correct)
+    grade_style = GRADE_STYLES[level]
+    comment = GRADES[level][1]
+
+    table = Table(box=box.ROUNDED, border_style="bright_blue", title="Session Complete")
+    table.add_column("", style="bright_cyan")
+    table.add_column("", justify="right")
+    table.add_row("Reviewed", str(reviewed))
+    table.add_row("Correct", str(correct))
+    table.add_row("Accuracy", Text(f"{acc:.0%}", style=grade_style))
+    return Group(table, Text(f"  {comment}", style="dim italic"))
+
+
+def stats_table(stats: dict) -> Table:
+    table = Table(title="Progress", box=box.ROUNDED, border_style="bright_blue")
+    table.add_column("Metric", style="bright_cyan")
+    table.add_column("Value", style="white", justify="right")
+    table.add_row("Cards Seen", str(stats["total"]))
+    table.add_row("Due Now", str(stats["due"]))
+    table.add_row("Learning (<7d)", str(stats["learning"]))
+    table.add_row("Mature (≥7d)", str(stats["mature"]))
+    table.add_row("Accuracy", f"{stats['accuracy']:.0%}")
+    return table
+
+
+def forecast_table(counts: list[int]) -> Table:
+    table = Table(title="Upcoming Reviews", box=box.ROUNDED, border_style="bright_blue")
+    table.add_column("Day", style="bright_cyan")
+    table.add_column("Due", justify="right", style="white")
+    table.add_column("")
+    peak = max(counts, default=0) or 1
+    for day, n in enumerate(counts):
+        label = "Today" if day == 0 else f"+{day}d"
+        table.add_row(label, str(n), Text("█" * round(n / peak * 30), style="bright_blue"))
+    return table
+
+
+def retention_group(curve: list[tuple[str, int, float]], decks: list[tuple[str, int, float]]) -> Group:
+    table = Table(title="Retention", box=box.ROUNDED, border_style="bright_blue")
+    table.add_column("Scheduled interval", style="bright_cyan")
+    table.add_column("Reviews", justify="right", style="dim")
+    table.add_column("Recalled", justify="right", style="white")
+    table.add_column("")
+    for label, n, rate in curve:
+        table.add_row(label, str(n), f"{rate:.0%}", Text("█" * round(rate * 20), style="bright_blue"))
+    if not decks:
+        return Group(table)
+    worst = Table(box=box.SIMPLE, border_style="dim", title="Hardest Categories")
+    worst.add_column("Category", style="white")
+    worst.add_column("Reviews", justify="right", style="dim")
+    worst.add_column("Recalled", justify="right", style="bright_yellow")
+    for name, n, rate in decks:
+        worst.add_row(name, str(n), f"{rate:.0%}")
+    return Group(table, worst)
+
+
+def hourly_table(hours: list[tuple[int, float]]) -> Table:
+    table = Table(title="Accuracy by Hour", box=box.ROUNDED, border_style="bright_blue")
+    table.add_column("Hour", style="bright_cyan")
+    table.add_column("Reviews", justify="right", style="dim")
+    table.add_column("Accuracy", justify="right", style="white")
+    table.add_column("")
+    for hour, (n, rate) in enumerate(hours):
+        if n:
+            table.add_row(f"{hour:02d}:00", str(n), f"{rate:.0%}",
+                          Text("█" * round(rate * 20), style="bright_blue"))
+    return table
+
+
+def leech_table(rows: list[tuple[str, int, int]]) -> Table:
+    table = Table(title="Leeches", box=box.SIMPLE, border_style="dim")
+    table.add_column("Card", style="white")
+    table.add_column("Lapses", justify="right", style="bright_red")
+    table.add_column("Failing streak", justify="right", style="dim")
+    for label, lapses, streak in rows:
+        table.add_row(label, str(lapses), str(streak))
+    return table
+
+
+def weakest_table(rows: list[tuple[str, float, int, float]]) -> Table:
+    table = Table(title="Weakest Cards", box=box.SIMPLE, border_style="dim")
+    table.add_column("Card", style="white")
+    table.add_column("Accuracy", justify="right", style="bright_yellow")
+    table.add_column("Reviews", justify="right", style="dim")
+    table.add_column("Ease", justify="right", style="dim")
+    for label, accuracy, reviews, ease in rows:
+        table.add_row(label, f"{accuracy:.0%}", str(reviews), f"{ease:.1f}")
+    return table
+
+
+# Printing
+
+def clear():
+    console.clear()
+
+
+def banner():
+    console.print(banner_panel())
+    console.print()
+
+
+def menu(options: list[str], notes: list[str] | None = None) -> int:
+    """Display a numbered menu and return the selected index (0-based).
+
+    *notes*, one per option, are shown dimmed to the right (e.g. due counts).
+    """
+    console.print(menu_table(options, notes))
+    console.print()
+
+    while True:
+        choice = Prompt.ask("[bright_cyan]Choose[/]", default="1", console=console)
+        try:
+            idx = int(choice) - 1
+            if 0 <= idx < len(options):
+                return idx
+        except ValueError:
+            pass
+        console.print("[red]Invalid choice.[/]")
+
+
+def ask(prompt_text: str, default: str | None = None) -> str:
+    """Ask for input. Returns 'q' if user wants to quit."""
+    result = Prompt.ask(
+        f"[bright_cyan]{prompt_text}[/] [dim](q to quit)[/]", default=default or "", console=console
+    )
+    return result
+
+
+def newline():
+    console.print()
+
+
+def show_title(title: str):
+    console.print(f"[bold]{title}[/bold]\n")
+
+
+def show_notice(message: str):
+    console.print(f"[dim]{message}[/dim]")
+
+
+def show_header(category: str, position: int, total: int):
+    """The dim 'category  (n/total)' line at the top of each card."""
+    console.print(f"[dim]{category}[/dim]  [dim]({position}/{total})[/dim]\n")
+
+
+def show_instruction(text: str):
+    console.print(f"[dim]{text}[/dim]\n")
+
+
+def show_fill_in(prompt: str):
+    console.print("[bold bright_cyan]Fill in the blank:[/bold bright_cyan]")
+    console.print(f"  {prompt}\n")
+
+
+@perf.timed("ui.show_card_prompt")
+def show_card_prompt(korean: str, hint: str | None = None):
+    """Display a card prompt — the thing being quizzed."""
+    console.print(card_panel(korean, hint))
+    perf.since("rated", "latency.rating_to_next_card")
+
+
+@perf.timed("ui.show_answer")
+def show_answer(answer: str, explanation: str | None = None):
+    """Reveal the answer (self-rated, no correct/incorrect judgment)."""
+    console.print(answer_panel(answer, explanation))
+
+
+@perf.timed("ui.show_result")
+def show_result(correct: bool, answer: str, explanation: str | None = None):
+    console.print(result_panel(correct, answer, explanation))
+
+
+@perf.timed("ui.show_breakdown")
+def show_breakdown(breakdown: str):
+    """Show hanja syllable breakdown for Sino-Korean words."""
+    console.print(f"  [bright_magenta]한자 breakdown:[/] [white]{breakdown}[/]")
+
+
+@perf.timed("ui.show_example")
+def show_example(sentence: str, translation: str | None = None):
+    console.print(example_text(sentence, translation))
+    console.print()
+
+
+@perf.timed("ui.show_seen_in")
+def show_seen_in(examples: list[tuple[str, str]]):
+    """Sentences from the drill texts that use the word, with where they're from."""
+    console.print("  [bright_magenta]Seen in:[/]")
+    for sentence, where in examples:
+        console.print(f"  [white]{sentence}[/] [dim]— {where}[/]")
+    console.print()
+
+
+@perf.timed("ui.show_stats")
+def show_stats(stats: dict):
+    console.print(stats_table(stats))
+    console.print()
+
+
+@perf.timed("ui.show_forecast")
+def show_forecast(counts: list[int]):
+    """Bar chart of reviews due per day, starting today."""
+    console.print(forecast_table(counts))
+    console.print()
+
+
+@perf.timed("ui.show_retention")
+def show_retention(curve: list[tuple[str, int, float]], decks: list[tuple[str, int, float]]):
+    """Recall rate by the interval the card was scheduled at, then the decks recalled worst."""
+    console.print(retention_group(curve, decks))
+    console.print()
+
+
+@perf.timed("ui.show_hourly_accuracy")
+def show_hourly_accuracy(hours: list[tuple[int, float]]):
+    """Accuracy for each hour of the day that has reviews."""
+    console.print(hourly_table(hours))
+    console.print()
+
+
+@perf.timed("ui.show_leeches")
+def show_leeches(rows: list[tuple[str, int, int]]):
+    """Cards that keep lapsing: (label, lapses, current failure streak)."""
+    console.print(leech_table(rows))
+    console.print()
+
+
+@perf.timed("ui.show_weakest")
+def show_weakest(rows: list[tuple[str, float, int, float]]):
+    """Cards with the lowest ease: (label, accuracy, reviews, ease)."""
+    console.print(weakest_table(rows))
+    console.print()
+
+
+@perf.timed("ui.show_session_summary")
+def show_session_summary(reviewed: int, correct: int):
+    perf.discard("rated")  # the next card is in another session, after menus and idle time
+    console.print(summary_group(reviewed, correct))
+    console.print()
+
+
+def rating_prompt() -> int | None:
+    """Ask the user to self-rate after seeing the answer. Returns SRS quality."""
+    console.print(RATING_BAR)
+    while True:
+        choice = Prompt.ask("[dim]Rate[/]", default="3", console=console)
+        rating = rating_from_choice(choice)
+        if rating is not None:
+            perf.mark("rated")
+            return rating
+        if choice.lower() == "q":
+            return None
+        console.print("[red]Enter 1-4 or q to quit.[/]")
+
+
+def pause():
+    Prompt.ask("[dim]Press Enter to continue[/]", default="", console=console)
@@ -0,0 +1,233 @@
+"""Differential terminal rendering for drill sessions.
+
+The Rich UI clears the terminal and reprints everything for every card. The
+Screen frontend instead builds each screen as a list of rendered lines
+(header, card panel, answer panel, examples, rating bar, prompts) and, when
+it needs input, rewrites only the rows that differ from what is already on
+the terminal, using cursor addressing. Panel borders, the rating bar and
+other unchanged rows are never re-sent.
+
+    with screen.session():
+        vocab.run_drill(srs)
+"""
+
+import re
+import sys
+from contextlib import contextmanager
+from typing import TextIO
+
+from rich.console import Console, RenderableType
+from rich.text import Text
+
+import perf
+import rich_ui
+import ui
+
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Panel padding is mostly long runs of blanks; "erase n cells, skip n cells"
+# paints the same thing in a handful of bytes.
+_BLANK_RUN = re.compile(r" {8,}")
+
+
+def _compact(line: str) -> str:
+    return _BLANK_RUN.sub(lambda m: f"\x1b[{len(m.group())}X\x1b[{len(m.group())}C", line)
+
+
+class Screen:
+    """A ui.py frontend that redraws only changed lines between inputs."""
+
+    def __init__(self, file: TextIO | None = None, input_file: TextIO | None = None,
+                 width: int | None = None, height: int | None = None):
+        self.out = file or sys.stdout
+        self.input = input_file or sys.stdin
+        size = rich_ui.console.size
+        self.width = width or size.width
+        self.height = height or size.height
+        self.renderer = Console(
+            width=self.width,
+            force_terminal=True,
+            color_system=rich_ui.console.color_system or "standard",
+            highlight=False,
+        )
+        self.frame: list[str] = []   # the screen being composed
+        self.shown: list[str] = []   # what the terminal currently shows, row by row
+        self.stale = True            # terminal contents unknown; next flush clears
+
+    # Composition
+
+    def _add(self, renderable: RenderableType = "") -> None:
+        with self.renderer.capture() as capture:
+            self.renderer.print(renderable)
+        text = capture.get()
+        if text.endswith("\n"):
+            text = text[:-1]
+        self.frame.extend(text.split("\n"))
+
+    def _add_markup(self, markup: str) -> None:
+        self._add(Text.from_markup(markup))
+
+    def flush(self) -> None:
+        """Bring the terminal in line with the composed frame."""
+        frame = self.frame
+        out = []
+        if len(frame) >= self.height:
+            # Taller than the terminal: fall back to a plain scrolled print
+            out.append(CLEAR_SCREEN + "\n".join(frame) + "\n")
+            self.stale = True
+        else:
+            if self.stale:
+                out.append(CLEAR_SCREEN)
+                self.shown = []
+                self.stale = False
+            shown = self.shown
+            for row, line in enumerate(frame):
+                if row >= len(shown) or shown[row] != line:
+                    out.append(f"\x1b[{row + 1};1H{_compact(line)}\x1b[K")
+            out.append(f"\x1b[{len(frame) + 1};1H")
+            if len(shown) > len(frame):
+                out.append("\x1b[J")  # erase leftover rows below the frame
+            self.shown = list(frame)
+        self.out.write("".join(out))
+        self.out.flush()
+        perf.count("screen.bytes", sum(len(s.encode("utf-8")) for s in out))
+        perf.since("rated", "latency.rating_to_next_card")
+
+    def _read(self, prompt_markup: str, default: str = "") -> str:
+        """Show a prompt under the frame and read a line; the answered prompt joins the frame."""
+        self.flush()
+        with self.renderer.capture() as capture:
+            self.renderer.print(Text.from_markup(prompt_markup), end="")
+        prompt = capture.get()
+        self.out.write(prompt + "\x1b[K")
+        self.out.flush()
+        line = self.input.readline()
+        if not line:
+            raise EOFError
+        typed = line.rstrip("\r\n")
+        # The terminal now shows the prompt plus whatever was typed on that row
+        self.frame.append(prompt + typed)
+        self.shown.append(self.frame[-1])
+        return typed or default
+
+    # Frontend API (see ui.FRONTEND_API)
+
+    def clear(self):
+        self.frame = []
+
+    def banner(self):
+        self._add(rich_ui.banner_panel())
+        self._add()
+
+    def menu(self, options: list[str], notes: list[str] | None = None) -> int:
+        self._add(rich_ui.menu_table(options, notes))
+        self._add()
+        while True:
+            choice = self._read("[bright_cyan]Choose[/] [bold cyan](1)[/]: ", default="1")
+            try:
+                idx = int(choice) - 1
+                if 0 <= idx < len(options):
+                    return idx
+            except ValueError:
+                pass
+            self._add_markup("[red]Invalid choice.[/]")
+
+    def ask(self, prompt_text: str, default: str | None = None) -> str:
+        return self._read(f"[bright_cyan]{prompt_text}[/] [dim](q to quit)[/]: ", default or "")
+
+    def newline(self):
+        self._add()
+
+    def show_title(self, title: str):
+        self._add_markup(f"[bold]{title}[/bold]\n")
+
+    def show_notice(self, message: str):
+        self._add_markup(f"[dim]{message}[/dim]")
+
+    def show_header(self, category: str, position: int, total: int):
+        self._add_markup(f"[dim]{category}[/dim]  [dim]({position}/{total})[/dim]\n")
+
+    def show_instruction(self, text: str):
+        self._add_markup(f"[dim]{text}[/dim]\n")
+
+    def show_fill_in(self, prompt: str):
+        self._add_markup("[bold bright_cyan]Fill in the blank:[/bold bright_cyan]")
+        self._add_markup(f"  {prompt}\n")
+
+    def show_card_prompt(self, korean: str, hint: str | None = None):
+        self._add(rich_ui.card_panel(korean, hint))
+
+    def show_answer(self, answer: str, explanation: str | None = None):
+        self._add(rich_ui.answer_panel(answer, explanation))
+
+    def show_result(self, correct: bool, answer: str, explanation: str | None = None):
+        self._add(rich_ui.result_panel(correct, answer, explanation))
+
+    def show_breakdown(self, breakdown: str):
+        self._add_markup(f"  [bright_magenta]한자 breakdown:[/] [white]{breakdown}[/]")
+
+    def show_example(self, sentence: str, translation: str | None = None):
+        self._add(rich_ui.example_text(sentence, translation))
+        self._add()
+
+    def show_seen_in(self, examples: list[tuple[str, str]]):
+        self._add_markup("  [bright_magenta]Seen in:[/]")
+        for sentence, where in examples:
+            self._add_markup(f"  [white]{sentence}[/] [dim]— {where}[/]")
+        self._add()
+
+    def show_session_summary(self, reviewed: int, correct: int):
+        perf.discard("rated")  # the next card is in another session, after menus and idle time
+        self._add(rich_ui.summary_group(reviewed, correct))
+        self._add()
+
+    def show_stats(self, stats: dict):
+        self._add(rich_ui.stats_table(stats))
+        self._add()
+
+    def show_forecast(self, counts: list[int]):
+        self._add(rich_ui.forecast_table(counts))
+        self._add()
+
+    def show_retention(self, curve: list[tuple[str, int, float]], decks: list[tuple[str, int, float]]):
+        self._add(rich_ui.retention_group(curve, decks))
+        self._add()
+
+    def show_hourly_accuracy(self, hours: list[tuple[int, float]]):
+        self._add(rich_ui.hourly_table(hours))
+        self._add()
+
+    def show_leeches(self, rows: list[tuple[str, int, int]]):
+        self._add(rich_ui.leech_table(rows))
+        self._add()
+
+    def show_weakest(self, rows: list[tuple[str, float, int, float]]):
+        self._add(rich_ui.weakest_table(rows))
+        self._add()
+
+    def rating_prompt(self) -> int | None:
+        self._add_markup(rich_ui.RATING_BAR)
+        while True:
+            choice = self._read("[dim]Rate[/] [bold cyan](3)[/]: ", default="3")
+            rating = ui.rating_from_choice(choice)
+            if rating is not None:
+                perf.mark("rated")
+                return rating
+            if choice.lower() == "q":
+                return None
+            self._add_markup("[red]Enter 1-4 or q to quit.[/]")
+
+    def pause(self):
+        self._read("[dim]Press Enter to continue[/]: ")
+
+
+@contextmanager
+def session(**kwargs):
+    """Run the enclosed drill through a Screen, then hand the terminal back."""
+    frontend = Screen(**kwargs)
+    ui.use(frontend)
+    try:
+        yield frontend
+    finally:
+        ui.use(None)
+        rich_ui.console.clear()
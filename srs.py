@@ -1,12 +1,19 @@
 """Spaced Repetition System using a simplified SM-2 algorithm."""
 
+import bisect
+import heapq
 import json
 import os
+import random
 import time
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
+from typing import Callable, Iterable
 
-PROGRESS_FILE = Path(__file__).parent / "progress.json"
+import bundle
+import perf
+
+PROGRESS_FILE = bundle.STATE_DIR / "progress.json"
 
 # Quality ratings (0-5 scale, SM-2 standard)
 AGAIN = 0  # Complete blackout
@@ -14,6 +21,30 @@ HARD = 2   # Recalled with serious difficulty
 GOOD = 3   # Recalled with some effort
 EASY = 5   # Perfect recall, effortless
 
+DAY = 86400
+
+# Load balancing: a review interval of at least this many days may be moved
+# by up to BALANCE_TOLERANCE of its length toward the lightest nearby day.
+# Days further out always look lighter, because the reviews that will land
+# on them haven't been scheduled yet, so loads are compared against the
+# window's linear trend, and the net shift of all moves stays within
+# BALANCE_MAX_DRIFT days: balancing levels the load without stretching
+# intervals, so it neither skips reviews nor adds them.
+BALANCE_MIN_INTERVAL = 2.0
+BALANCE_TOLERANCE = 0.1
+BALANCE_MAX_DRIFT = 5
+
+# Recall model for prioritizing: SM-2 schedules a review when recall has
+# decayed to about TARGET_RETENTION, so recall after t days is
+# TARGET_RETENTION ** (t / stability), where stability is the interval scaled
+# by how easy the card has proven (ease / 2.5). That is discounted by the
+# card's smoothed accuracy, weighted by ACCURACY_WEIGHT.
+TARGET_RETENTION = 0.9
+ACCURACY_WEIGHT = 0.5
+NEW_CARD_RECALL = 0.5  # unseen cards have no history to estimate from
+
+LEARNING_DAYS = 7  # cards with a shorter interval count as learning, longer as mature
+
 
 @dataclass
 class Card:
@@ -27,15 +58,21 @@ class Card:
     total_reviews: int = 0
     correct_count: int = 0
 
+    @property
+    def partition(self) -> str:
+        """The card-id prefix naming the card's deck: "vocab:<category>"."""
+        return self.card_id.rpartition(":")[0]
+
     @property
     def accuracy(self) -> float:
         if self.total_reviews == 0:
             return 0.0
         return self.correct_count / self.total_reviews
 
-    def review(self, quality: int) -> None:
+    def review(self, quality: int, now: float | None = None) -> None:
         """Update card state after a review using SM-2."""
-        now = time.time()
+        if now is None:
+            now = time.time()
         self.last_review = now
         self.total_reviews += 1
 
@@ -61,35 +98,78 @@ class Card:
         self.ease_factor += 0.1 - (5 - quality) * (0.08 + (5 - quality) * 0.02)
         self.ease_factor = max(1.3, self.ease_factor)
 
-        self.next_review = now + self.interval_days * 86400
+        self.next_review = now + self.interval_days * DAY
+
+
+class _Partition:
+    """The cards of one deck: their due times, kept sorted, and a learning count."""
+
+    __slots__ = ("due_times", "indexed", "learning")
+
+    def __init__(self):
+        self.due_times: list[float] = []
+        self.indexed: dict[str, tuple[float, bool]] = {}  # card id -> (due time, learning) as added
+        self.learning = 0
+
+    def add(self, card: Card) -> None:
+        learning = card.interval_days < LEARNING_DAYS
+        self.indexed[card.card_id] = (card.next_review, learning)
+        bisect.insort(self.due_times, card.next_review)
+        self.learning += learning
+
+    def remove(self, card: Card) -> None:
+        due, learning = self.indexed.pop(card.card_id)
+        del self.due_times[bisect.bisect_left(self.due_times, due)]
+        self.learning -= learning
 
 
 class SRSEngine:
     """Manages a collection of SRS cards with persistence."""
 
-    def __init__(self, progress_file: Path | None = None):
+    def __init__(
+        self,
+        progress_file: Path | None = None,
+        load_balance: bool = False,
+        autosave: bool = True,
+        clock: Callable[[], float] = time.time,
+        history=None,
+    ):
         self.progress_file = progress_file or PROGRESS_FILE
+        self.clock = clock
+        self.history = history  # a history.HistoryLog that every review is appended to
+        self.load_balance = load_balance
+        self.autosave = autosave
         self.cards: dict[str, Card] = {}
+        self.revision = 0  # bumped on every review, so indexes over card state can tell they're stale
+        self._day_load: dict[int, int] | None = None  # built on first balanced review
+        self._drift = 0  # net days the balancer has moved reviews; positive is later
+        self._partitions: dict[str, _Partition] | None = None  # built on first partition_counts
         self._load()
 
+    @perf.timed("srs.load")
     def _load(self) -> None:
         if self.progress_file.exists():
             data = json.loads(self.progress_file.read_text(encoding="utf-8"))
             for card_id, card_data in data.items():
                 self.cards[card_id] = Card(**card_data)
 
+    @perf.timed("srs.save")
     def save(self) -> None:
+        perf.count("srs.saves")
         data = {cid: asdict(card) for cid, card in self.cards.items()}
         self.progress_file.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
     def get_card(self, card_id: str) -> Card:
         if card_id not in self.cards:
-            self.cards[card_id] = Card(card_id=card_id)
+            card = self.cards[card_id] = Card(card_id=card_id)
+            if self._partitions is not None:
+                self._partitions.setdefault(card.partition, _Partition()).add(card)
         return self.cards[card_id]
 
+    @perf.timed("srs.get_due_cards")
     def get_due_cards(self, card_ids: list[str]) -> list[str]:
         """Return card IDs that are due for review, sorted by priority."""
-        now = time.time()
+        now = self.clock()
         due = []
         new = []
         for cid in card_ids:
@@ -104,20 +184,179 @@ class SRSEngine:
         # New cards go after due cards
         return due + new
 
-    def record_review(self, card_id: str, quality: int) -> None:
+    @perf.timed("srs.recall_probabilities")
+    def recall_probabilities(self, card_ids: list[str], now: float | None = None) -> list[float]:
+        """Estimated chance of recalling each card right now (see TARGET_RETENTION)."""
+        if now is None:
+            now = self.clock()
+        cards = self.cards
+        out = []
+        append = out.append
+        for cid in card_ids:
+            card = cards.get(cid)
+            if card is None or card.total_reviews == 0:
+                append(NEW_CARD_RECALL)
+                continue
+            elapsed = (now - card.last_review) / DAY
+            stability = max(card.interval_days, 0.007) * card.ease_factor / 2.5
+            recall = TARGET_RETENTION ** (elapsed / stability) if elapsed > 0 else 1.0
+            accuracy = (card.correct_count + 1) / (card.total_reviews + 2)
+            append(recall * (1 - ACCURACY_WEIGHT + ACCURACY_WEIGHT * accuracy))
+        return out
+
+    @perf.timed("srs.weakest")
+    def weakest(self, card_ids: list[str], k: int, now: float | None = None) -> list[str]:
+        """The *k* cards to review first: due cards, then unseen ones, then the rest.
+
+        Within each group the cards least likely to be recalled now come
+        first; ties are broken at random. A due card always outranks new
+        material, however well it is likely to be remembered.
+        """
+        if now is None:
+            now = self.clock()
+        probs = self.recall_probabilities(card_ids, now)
+        cards = self.cards
+        groups = []
+        for cid in card_ids:
+            card = cards.get(cid)
+            if card is None or card.total_reviews == 0:
+                groups.append(1)
+            else:
+                groups.append(0 if card.next_review <= now else 2)
+        ranked = heapq.nsmallest(k, zip(groups, probs, [random.random() for _ in card_ids], card_ids))
+        return [cid for _, _, _, cid in ranked]
+
+    def record_review(self, card_id: str, quality: int, now: float | None = None,
+                      latency: float | None = None) -> None:
+        """Apply a review; *latency* is seconds from card shown to rating, for the history."""
+        if now is None:
+            now = self.clock()
         card = self.get_card(card_id)
-        card.review(quality)
-        self.save()
+        prev_interval = card.interval_days
+        part = self._partitions[card.partition] if self._partitions is not None else None
+        if part is not None:
+            part.remove(card)
+        if self.load_balance:
+            old_day = int(card.next_review // DAY)
+            card.review(quality, now)
+            self._balance(card, old_day)
+        else:
+            card.review(quality, now)
+        if part is not None:
+            part.add(card)
+        if self.history is not None:
+            self.history.append(card_id, now, quality, prev_interval, latency)
+        self.revision += 1
+        perf.count("srs.reviews")
+        if self.autosave:
+            self.save()
+
+    def replay(self, reviews: Iterable[tuple[str, int, float]]) -> tuple[int, int]:
+        """Apply historical (card_id, quality, timestamp) reviews without saving.
+
+        Reviews must be in time order per card; one at or before a card's
+        last_review is skipped, so replaying the same history twice is a
+        no-op. Returns (applied, skipped). Call save() once afterwards.
+        """
+        cards = self.cards
+        logged = [] if self.history is not None else None
+        applied = skipped = 0
+        for card_id, quality, when in reviews:
+            card = cards.get(card_id)
+            if card is None:
+                card = cards[card_id] = Card(card_id=card_id)
+            elif when <= card.last_review:
+                skipped += 1
+                continue
+            if logged is not None:
+                logged.append((card_id, when, quality, card.interval_days, None))
+            card.review(quality, when)
+            applied += 1
+        if logged:
+            self.history.append_many(logged)
+        self._day_load = None
+        self._partitions = None
+        self.revision += 1
+        perf.count("srs.reviews", applied)
+        return applied, skipped
+
+    def _balance(self, card: Card, old_day: int) -> None:
+        """Nudge a freshly scheduled card toward the lightest day within tolerance."""
+        if self._day_load is None:
+            self._day_load = {}
+            for c in self.cards.values():
+                if c is not card:
+                    day = int(c.next_review // DAY)
+                    self._day_load[day] = self._day_load.get(day, 0) + 1
+        else:
+            self._day_load[old_day] = self._day_load.get(old_day, 1) - 1
+
+        load = self._day_load
+        if card.interval_days >= BALANCE_MIN_INTERVAL:
+            spread = max(1, round(card.interval_days * BALANCE_TOLERANCE))
+            base = int(card.next_review // DAY)
+            shifts = range(-spread, spread + 1)
+            loads = [load.get(base + d, 0) for d in shifts]
+            slope = sum(d * n for d, n in zip(shifts, loads)) / sum(d * d for d in shifts)
+            # Lightest day against the trend wins, among shifts that keep the net
+            # shift within bounds; ties go to the smallest shift, earlier first
+            allowed = [d for d in shifts if abs(self._drift + d) <= BALANCE_MAX_DRIFT]
+            shift = min(allowed, key=lambda d: (loads[d + spread] - slope * d, abs(d), d))
+            self._drift += shift
+            # Only the due date moves; interval_days keeps driving SM-2 growth
+            card.next_review += shift * DAY
+
+        day = int(card.next_review // DAY)
+        load[day] = load.get(day, 0) + 1
+
+    @perf.timed("srs.partition_counts")
+    def partition_counts(self, prefix: str, now: float | None = None) -> dict:
+        """Due, learning and seen card counts for one deck, e.g. "vocab:연어 (Collocations)".
+
+        Cards are indexed by deck on first use and the index is kept current
+        by get_card() and record_review(), so this costs O(log n) per deck.
+        Cards must be created through get_card() to be counted.
+        """
+        if now is None:
+            now = self.clock()
+        if self._partitions is None:
+            self._partitions = {}
+            for card in self.cards.values():
+                self._partitions.setdefault(card.partition, _Partition()).add(card)
+        part = self._partitions.get(prefix)
+        if part is None:
+            return {"due": 0, "learning": 0, "seen": 0}
+        return {
+            "due": bisect.bisect_right(part.due_times, now),
+            "learning": part.learning,
+            "seen": len(part.indexed),
+        }
+
+    @perf.timed("srs.forecast")
+    def forecast(self, days: int = 30, now: float | None = None) -> list[int]:
+        """Count reviews due on each of the next *days* days (overdue counts as today)."""
+        if now is None:
+            now = self.clock()
+        if days <= 0:
+            return []
+        today = int(now // DAY)
+        counts = [0] * days
+        for card in self.cards.values():
+            offset = int(card.next_review // DAY) - today
+            if offset < days:
+                counts[offset if offset > 0 else 0] += 1
+        return counts
 
+    @perf.timed("srs.get_stats")
     def get_stats(self) -> dict:
-        now = time.time()
+        now = self.clock()
         total = len(self.cards)
         if total == 0:
             return {"total": 0, "due": 0, "learning": 0, "mature": 0, "accuracy": 0.0}
 
         due = sum(1 for c in self.cards.values() if c.next_review <= now)
-        learning = sum(1 for c in self.cards.values() if c.interval_days < 7)
-        mature = sum(1 for c in self.cards.values() if c.interval_days >= 7)
+        learning = sum(1 for c in self.cards.values() if c.interval_days < LEARNING_DAYS)
+        mature = sum(1 for c in self.cards.values() if c.interval_days >= LEARNING_DAYS)
         total_reviews = sum(c.total_reviews for c in self.cards.values())
         total_correct = sum(c.correct_count for c in self.cards.values())
         accuracy = total_correct / total_reviews if total_reviews > 0 else 0.0
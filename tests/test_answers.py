@@ -0,0 +1,82 @@
+"""Tests for grammar fill-in answer equivalence."""
+
+import json
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import answers
+import grammar
+
+
+def _drill(prompt, answer, full_sentence):
+    return {"prompt": prompt, "answer": answer, "full_sentence": full_sentence}
+
+
+class TestAnswers:
+    def test_normalize(self):
+        assert answers.normalize("  는 바람에 ") == "는바람에"
+        assert answers.normalize("-더니") == "더니"
+        assert answers.normalize("죽겠다.") == "죽겠다"
+
+    def test_polite_forms(self):
+        assert answers.polite_forms("전해진다") == {"전해져요", "전해집니다"}
+        assert answers.polite_forms("나타났다") == {"나타났어요", "나타났습니다"}
+        assert answers.polite_forms("불과하다") == {"불과해요", "불과합니다"}
+        assert answers.polite_forms("먹는다") == {"먹어요", "먹습니다"}
+
+    def test_polite_forms_copula_and_irregulars(self):
+        assert answers.polite_forms("이다") == {"이에요", "입니다"}
+        assert answers.polite_forms("셈이다") == {"셈이에요", "셈입니다"}
+        assert answers.polite_forms("터이다") == {"터예요", "터입니다"}
+        assert answers.polite_forms("모른다") == {"몰라요", "모릅니다"}
+        assert answers.polite_forms("듣는다") == {"들어요", "듣습니다"}
+        assert answers.polite_forms("돕는다") == {"도와요", "돕습니다"}
+        assert answers.polite_forms("어렵다") == {"어려워요", "어렵습니다"}
+        assert answers.polite_forms("믿는다") == {"믿어요", "믿습니다"}
+        assert answers.polite_forms("짓는다") == {"지어요", "짓습니다"}
+        assert answers.polite_forms("씻는다") == {"씻어요", "씻습니다"}
+        # Stems that need a lexicon are left unexpanded rather than guessed
+        for plain in ("만든다", "산다", "보이다", "의사다", "그렇다", "잣는다"):
+            assert answers.polite_forms(plain) == set()
+
+    def test_whole_word_and_merged_stem(self):
+        forms = answers.expand(_drill("Complete: 아무리 울___들 돌아오지 않는다.", "은",
+                                      "아무리 운들 돌아오지 않는다."))
+        assert {"은", "운", "운들"} <= forms
+        assert "울은들" not in forms
+        forms = answers.expand(_drill("Complete: 잠을 자___치면 옆집에서 소리가 난다.", "ㄹ라",
+                                      "잠을 잘라치면 옆집에서 소리가 난다."))
+        assert "잘라치면" in forms
+
+    def test_sentence_final_register_and_contractions(self):
+        forms = answers.expand(_drill("Complete: 이 마을에는 용이 살았다고 ___.", "전해진다",
+                                      "이 마을에는 용이 살았다고 전해진다."))
+        assert {"전해진다", "전해져요", "전해집니다"} <= forms
+        forms = answers.expand(_drill("Complete: 이 가게는 가격이 싼 ___ 품질이 별로다.", "반면에",
+                                      "이 가게는 가격이 싼 반면에 품질이 별로다."))
+        assert "반면" in forms
+        assert "반면이" not in forms
+
+    def test_is_correct_against_real_data(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(answers, "CACHE_FILE", tmp_path / "forms.json")
+        monkeypatch.setattr(answers, "_index", None)
+        for entries in grammar.load_grammar().values():
+            for entry in entries:
+                drill = entry["drill"]
+                assert answers.is_correct(drill, drill["answer"])
+                assert answers.is_correct(drill, f" {drill['answer']} ")
+                assert not answers.is_correct(drill, "전혀 다른 답")
+        assert json.loads((tmp_path / "forms.json").read_text())["key"]
+
+    def test_regrade(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(answers, "CACHE_FILE", tmp_path / "forms.json")
+        monkeypatch.setattr(answers, "_index", None)
+        data = grammar.load_grammar()
+        category = next(c for c, es in data.items() if any(e["drill"]["answer"] == "는 바람에" for e in es))
+        idx = next(i for i, e in enumerate(data[category]) if e["drill"]["answer"] == "는 바람에")
+        log = [json.dumps({"card_id": f"grammar:{category}:{idx}", "fill_answer": "는바람에",
+                           "fill_correct": False}, ensure_ascii=False)]
+        stats = answers.regrade(log, data)
+        assert stats["~는 바람에"] == {"answers": 1, "was": 0, "now": 1}
@@ -0,0 +1,48 @@
+"""Tests for the zipapp build."""
+
+import subprocess
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import answers
+import build
+import vocab
+from srs import GOOD, SRSEngine
+import xref
+
+COUNTS = (
+    "import sys; sys.path.insert(0, sys.argv[1])\n"
+    "import answers, bundle, vocab, xref\n"
+    "assert bundle.ARCHIVE is not None\n"
+    "print(len(vocab.load_vocab()), len(xref.index()), len(answers.index()))\n"
+)
+
+
+class TestBuild:
+    def test_zipapp_runs_from_the_archive(self, tmp_path):
+        app = build.build(tmp_path / "app.pyz", with_rich=False, store_over=None)
+        run = subprocess.run([sys.executable, "-c", COUNTS, str(app)], cwd=tmp_path,
+                             capture_output=True, text=True)
+        assert run.returncode == 0, run.stderr
+        expected = f"{len(vocab.load_vocab())} {len(xref.index())} {len(answers.index())}"
+        assert run.stdout.strip() == expected
+        assert not (tmp_path / ".cache").exists()  # the prebuilt indexes matched
+
+        run = subprocess.run([sys.executable, str(app), "--plain"], cwd=tmp_path, input="8\n",
+                             capture_output=True, text=True)
+        assert run.returncode == 0, run.stderr
+        assert "Korean Coach" in run.stdout
+        assert not (tmp_path / "progress.json").exists()
+
+    def test_no_rich_build_opens_view_progress(self, tmp_path):
+        app = build.build(tmp_path / "app.pyz", with_rich=False, store_over=None)
+        category = next(iter(vocab.load_vocab()))
+        SRSEngine(tmp_path / "progress.json").record_review(f"vocab:{category}:0", GOOD)
+        # -S keeps site-packages (and any Rich installed there) off the path
+        run = subprocess.run([sys.executable, "-S", str(app), "--plain"], cwd=tmp_path,
+                             input="7\n\n8\n", capture_output=True, text=True)
+        assert run.returncode == 0, run.stderr
+        assert "Upcoming Reviews" in run.stdout
+        assert "Weakest Cards" in run.stdout and vocab.load_vocab()[category][0]["korean"] in run.stdout
@@ -8,7 +8,7 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from srs import SRSEngine, Card, AGAIN, HARD, GOOD, EASY
+from srs import SRSEngine, Card, AGAIN, HARD, GOOD, EASY, DAY, BALANCE_MAX_DRIFT
 
 
 class TestCard:
@@ -119,6 +119,116 @@ class TestSRSEngine:
         stats = engine.get_stats()
         assert stats["total"] == 2
 
+    def test_forecast_counts_per_day(self):
+        engine = self._make_engine()
+        now = 1000 * DAY + 3600
+        engine.get_card("overdue").next_review = now - 5 * DAY
+        engine.get_card("today").next_review = now + 60
+        engine.get_card("in3").next_review = now + 3 * DAY
+        engine.get_card("far").next_review = now + 90 * DAY
+        assert engine.forecast(7, now=now) == [2, 0, 0, 1, 0, 0, 0]
+
+    def test_load_balance_moves_to_lighter_day(self):
+        engine = self._make_engine()
+        engine.load_balance = True
+        now = 1000 * DAY
+        card = engine.get_card("a")
+        card.repetitions = 3
+        card.interval_days = 10.0
+        # Crowd the day the card would land on (10 * 2.5 = 25 days out)
+        for i in range(5):
+            engine.get_card(f"busy{i}").next_review = now + 25 * DAY
+        engine.record_review("a", GOOD, now=now)
+        assert int(card.next_review // DAY) != 1025
+        assert abs(card.next_review - (now + card.interval_days * DAY)) <= 3 * DAY
+
+    def test_load_balance_has_no_forward_bias(self):
+        engine = self._make_engine()
+        engine.autosave = False
+        engine.load_balance = True
+        now = 1000 * DAY
+        # Load thins out further ahead, as it always does: later days look lighter
+        for offset in range(15, 36):
+            for i in range(40 - offset):
+                engine.get_card(f"busy{offset}:{i}").next_review = now + offset * DAY
+        shifts = []
+        for i in range(40):
+            card = engine.get_card(f"c{i}")
+            card.repetitions = 3
+            card.interval_days = 10.0
+            engine.record_review(card.card_id, GOOD, now=now)
+            shifts.append(round((card.next_review - now) / DAY - card.interval_days))
+        assert any(shifts)
+        assert abs(sum(shifts)) <= BALANCE_MAX_DRIFT  # moves go both ways, intervals aren't stretched
+
+    def test_recall_probability_decays_and_tracks_accuracy(self):
+        engine = self._make_engine()
+        engine.autosave = False
+        now = 1000 * DAY
+        for cid in ("solid", "shaky"):
+            engine.record_review(cid, GOOD, now=now - 20 * DAY)
+            engine.get_card(cid).interval_days = 10.0
+        engine.get_card("shaky").total_reviews = 6  # 1 of 6 correct
+        solid, shaky, new = engine.recall_probabilities(["solid", "shaky", "new"], now=now)
+        assert shaky < solid < 0.9
+        assert new == 0.5
+        assert engine.recall_probabilities(["solid"], now=now - 20 * DAY) == [1 - 0.5 + 0.5 * 2 / 3]
+
+    def test_weakest_picks_lowest_recall_first(self):
+        engine = self._make_engine()
+        engine.autosave = False
+        now = 1000 * DAY
+        engine.record_review("failed", AGAIN, now=now - DAY)
+        engine.record_review("fresh", EASY, now=now - 60)
+        ids = ["fresh", "new1", "failed", "new2"]
+        assert engine.weakest(ids, 1, now=now) == ["failed"]
+        assert engine.weakest(ids, 4, now=now)[-1] == "fresh"
+        assert set(engine.weakest(ids, 3, now=now)[1:]) == {"new1", "new2"}
+
+    def test_weakest_puts_due_cards_before_a_large_new_pool(self):
+        engine = self._make_engine()
+        engine.autosave = False
+        now = 1000 * DAY
+        due = [f"vocab:a:{i}" for i in range(200)]
+        for cid in due:
+            # Three GOOD reviews reach a 3-day interval; leave the cards ~2 days overdue
+            for ts in (now - 6 * DAY, now - 5.9 * DAY, now - 5 * DAY):
+                engine.record_review(cid, GOOD, now=ts)
+        assert all(engine.get_card(cid).next_review <= now for cid in due)
+        pool = due + [f"vocab:b:{i}" for i in range(5500)]
+        picked = engine.weakest(pool, 15, now=now)
+        assert set(picked) <= set(due)
+        # New cards fill only the slots due cards leave
+        picked = engine.weakest(due[:5] + pool[200:], 15, now=now)
+        assert set(picked[:5]) == set(due[:5]) and len(picked) == 15
+
+    def test_partition_counts_follow_reviews(self):
+        engine = self._make_engine()
+        engine.autosave = False
+        now = 1000 * DAY
+        engine.record_review("vocab:A: x:0", AGAIN, now=now - DAY)
+        engine.record_review("vocab:A: x:1", EASY, now=now - DAY)
+        assert engine.partition_counts("vocab:A: x", now) == {"due": 2, "learning": 2, "seen": 2}
+        assert engine.partition_counts("vocab:B", now) == {"due": 0, "learning": 0, "seen": 0}
+
+        # Kept current after the index exists, matching a full scan
+        engine.record_review("vocab:A: x:0", GOOD, now=now)
+        engine.record_review("vocab:B:0", GOOD, now=now)
+        for cid in ("vocab:A: x:1", "vocab:A: x:1", "vocab:A: x:1"):
+            engine.record_review(cid, EASY, now=now)
+        later = now + 2 * DAY
+        for prefix in ("vocab:A: x", "vocab:B"):
+            cards = [c for c in engine.cards.values() if c.card_id.startswith(prefix + ":")]
+            assert engine.partition_counts(prefix, later) == {
+                "due": sum(c.next_review <= later for c in cards),
+                "learning": sum(c.interval_days < 7 for c in cards),
+                "seen": len(cards),
+            }
+
+    def test_deck_notes(self):
+        from ui import deck_notes
+        assert deck_notes([(3, 0), (0, 5), (0, 0)]) == ["3 due · 5 new", "3 due", "5 new", ""]
+
 
 class TestData:
     def test_vocab_json_valid(self):
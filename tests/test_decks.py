@@ -0,0 +1,77 @@
+"""Tests for the filtered-deck query language."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import decks
+import grammar
+import vocab
+from srs import SRSEngine, AGAIN, EASY, DAY
+
+VOCAB = {
+    "연어 (Collocations)": [
+        {"korean": "결정을 내리다", "english": "to make a decision"},
+        {"korean": "양심", "english": "Conscience", "hanja": "良心"},
+    ],
+    "한자어 (Sino-Korean)": [{"korean": "심성", "english": "temperament", "hanja": "心性"}],
+}
+GRAMMAR = {"Connectors": [{"pattern": "~더니", "meaning": "and then", "explanation": "contrast"}]}
+NOW = 1000 * DAY
+
+
+@pytest.fixture
+def engine(tmp_path, monkeypatch):
+    for module, name, data in ((vocab, "vocab.json", VOCAB), (grammar, "grammar.json", GRAMMAR)):
+        (tmp_path / name).write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        monkeypatch.setattr(module, "DATA_FILE", tmp_path / name)
+        monkeypatch.setattr(module, "_cache", None)
+    engine = SRSEngine(tmp_path / "progress.json", autosave=False, clock=lambda: NOW)
+    engine.record_review("vocab:연어 (Collocations):1", AGAIN, now=NOW - DAY)
+    engine.record_review("vocab:한자어 (Sino-Korean):0", EASY, now=NOW - 60)
+    return engine
+
+
+def _select(engine, text):
+    return decks.Query(text).select(engine)
+
+
+class TestDecks:
+    def test_content_terms(self, engine):
+        assert _select(engine, "grammar") == ["grammar:Connectors:0"]
+        assert _select(engine, 'category:"연어*"') == ["vocab:연어 (Collocations):0", "vocab:연어 (Collocations):1"]
+        assert _select(engine, "category:한자어") == ["vocab:한자어 (Sino-Korean):0"]
+        assert _select(engine, "hanja:心") == ["vocab:연어 (Collocations):1", "vocab:한자어 (Sino-Korean):0"]
+        assert _select(engine, "hanja:心性") == ["vocab:한자어 (Sino-Korean):0"]
+        assert _select(engine, 'grammar text:"더니"') == ["grammar:Connectors:0"]
+        assert _select(engine, "english:conscience") == ["vocab:연어 (Collocations):1"]
+        assert _select(engine, "vocab -hanja:良") == ["vocab:연어 (Collocations):0", "vocab:한자어 (Sino-Korean):0"]
+
+    def test_state_terms_and_defaults(self, engine):
+        assert _select(engine, "ease<2.5") == ["vocab:연어 (Collocations):1"]
+        assert _select(engine, "reviews>=1 hanja:心") == ["vocab:연어 (Collocations):1", "vocab:한자어 (Sino-Korean):0"]
+        assert _select(engine, "new:yes") == ["vocab:연어 (Collocations):0", "grammar:Connectors:0"]
+        assert _select(engine, "due:yes new:no") == ["vocab:연어 (Collocations):1"]  # EASY: not due for an hour
+        assert _select(engine, "accuracy<0.5") == ["vocab:연어 (Collocations):1"]  # never-reviewed cards don't match
+        assert decks.Query("hanja:心").counts(engine) == (1, 0)
+
+    def test_state_index_follows_reviews(self, engine):
+        query = decks.Query("reviews>1")
+        assert query.select(engine) == []
+        engine.record_review("vocab:한자어 (Sino-Korean):0", EASY, now=NOW)
+        assert query.select(engine) == ["vocab:한자어 (Sino-Korean):0"]
+
+    def test_bad_queries(self, engine):
+        for text in ("colour:red", "ease<high", "due:maybe", "hanja<3", 'text:"open'):
+            with pytest.raises(ValueError):
+                decks.Query(text)
+
+    def test_saved_decks(self, tmp_path):
+        path = tmp_path / "decks.json"
+        assert decks.load_decks(path) == {}
+        decks.save_decks({"마음": "hanja:心 due:yes"}, path)
+        assert decks.load_decks(path) == {"마음": "hanja:心 due:yes"}
@@ -0,0 +1,57 @@
+"""Tests for near-duplicate detection across vocab files."""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import dedupe
+
+
+def _corpus(*entries):
+    return [("vocab.json", cat, i, {"korean": k, "english": e}) for i, (cat, k, e) in enumerate(entries)]
+
+
+class TestDedupe:
+    def test_keys_and_glosses(self):
+        assert dedupe.korean_key("서운하다 vs 아쉽다") == dedupe.korean_key("아쉽다  vs 서운하다")
+        assert dedupe.korean_key("세대 갈등") == dedupe.korean_key("세대갈등")
+        assert dedupe.glosses("Exhaustion; to deplete (resources)") == ["deplete", "exhaustion"]
+
+    def test_finds_same_word_across_categories_and_homonyms(self):
+        report = dedupe.find_duplicates(_corpus(
+            ("정신건강", "소진", "burnout; exhaustion"),
+            ("한자어", "소진", "exhaustion; depletion"),
+            ("법률", "검사", "prosecutor"),
+            ("의학", "검사", "inspection; examination"),
+            ("감정", "무섭다", "scary"),
+            ("감정", "두렵다", "scary"),
+        ))
+        pairs = {(p["a"][2], p["b"][2]): (p["reason"], p["mergeable"]) for p in report}
+        assert pairs == {
+            (0, 1): ("same headword", True),
+            (2, 3): ("same headword, different meaning", False),
+        }
+
+    def test_lsh_finds_spelling_variants_but_not_comparisons(self):
+        report = dedupe.find_duplicates(_corpus(
+            ("가족", "세대 간 갈등", "generational conflict"),
+            ("사회", "세대갈등", "generational conflict"),
+            ("뉘앙스", "항의하다 vs 이의를 제기하다", "to protest vs to raise an objection"),
+            ("격식", "이의를 제기하다", "to raise an objection"),
+        ))
+        assert [(p["a"][2], p["b"][2]) for p in report] == [(0, 1)]
+
+    def test_auto_merge_keeps_main_entries_in_place(self):
+        main = {"한자어": [{"korean": "소진", "english": "exhaustion"}]}
+        extra = {
+            "정신건강": [
+                {"korean": "소진", "english": "exhaustion; burnout", "hanja": "消盡"},
+                {"korean": "번아웃", "english": "burnout"},
+                {"korean": "번 아웃", "english": "burnout"},
+            ],
+        }
+        kept, dropped = dedupe.auto_merge(main, extra)
+        assert dropped == 2
+        assert kept == {"정신건강": [{"korean": "번아웃", "english": "burnout"}]}
+        assert main["한자어"] == [{"korean": "소진", "english": "exhaustion", "hanja": "消盡"}]
@@ -0,0 +1,144 @@
+"""Tests for the multiple-choice distractor index."""
+
+import io
+import json
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import distractors
+import history
+import plain_ui
+import ui
+import vocab
+from srs import SRSEngine
+
+DATA = {
+    "a": [
+        {"korean": "결정하다", "english": "to decide"},
+        {"korean": "결심하다", "english": "to resolve; to decide firmly"},
+        {"korean": "결정", "english": "decision", "hanja": "決定"},
+        {"korean": "결단", "english": "resolution; decisiveness", "hanja": "決斷"},
+        {"korean": "바다", "english": "sea"},
+    ],
+    "b": [
+        {"korean": "정하다", "english": "to decide"},
+        {"korean": "모순", "english": "contradiction", "hanja": "矛盾"},
+        {"korean": "사과", "english": "apple"},
+    ],
+}
+
+
+def _use_data(tmp_path, monkeypatch, data=DATA):
+    (tmp_path / "vocab.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+    monkeypatch.setattr(vocab, "DATA_FILE", tmp_path / "vocab.json")
+    monkeypatch.setattr(vocab, "_cache", None)
+    monkeypatch.setattr(distractors, "CACHE_FILE", tmp_path / "cache" / "distractors.json")
+    monkeypatch.setattr(distractors, "_index", None)
+    monkeypatch.setattr(distractors, "MAX_DF", 1.0)
+
+
+class TestDistractors:
+    def test_features(self):
+        feats = distractors.features({"korean": "결단", "english": "to decide", "hanja": "決斷"})
+        assert feats["e de"] == 1 and "e to" not in feats  # stopwords dropped
+        assert feats["k결단"] == 1 and feats["h決"] == 1
+
+    def test_neighbours_rank_similar_and_skip_same_answer(self, tmp_path, monkeypatch):
+        _use_data(tmp_path, monkeypatch)
+        neighbours = distractors.index()
+        # 결정하다 (0): same-shape predicates first; 정하다 (5) has the same answer, so is never offered
+        assert neighbours[0][0] == 1
+        assert 5 not in neighbours[0]
+        # 결정 (2) shares 決 and 결정 with 결단 (3) and the -다 words, nouns first
+        assert neighbours[2][0] == 3
+
+    def test_cache_reused_until_vocab_changes(self, tmp_path, monkeypatch):
+        _use_data(tmp_path, monkeypatch)
+        built = []
+        build = distractors.build
+        monkeypatch.setattr(distractors, "build", lambda data: built.append(1) or build(data))
+        distractors.index()
+        monkeypatch.setattr(distractors, "_index", None)
+        distractors.index()
+        assert len(built) == 1
+
+        data = {**DATA, "b": DATA["b"] + [{"korean": "배", "english": "pear"}]}
+        (tmp_path / "vocab.json").write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        stat = (tmp_path / "vocab.json").stat()
+        os.utime(tmp_path / "vocab.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert len(distractors.index()) == 9
+        assert len(built) == 2
+
+    def test_choices_are_distinct_and_topped_up(self, tmp_path, monkeypatch):
+        _use_data(tmp_path, monkeypatch)
+        monkeypatch.setattr(distractors, "build", lambda data, b=distractors.build: b(data, k=1))
+        options = distractors.choices("b", 2)  # 사과 has no similar entries at all
+        assert len(options) == 2  # only 모순 and 정하다 are left in its category
+        assert DATA["b"][2] not in options
+
+        options = distractors.choices("a", 0)
+        assert len(options) == 3
+        assert DATA["a"][0] not in options
+
+    def test_present_choice(self, tmp_path, monkeypatch):
+        _use_data(tmp_path, monkeypatch)
+        monkeypatch.setattr(vocab.random, "random", lambda: 0.0)  # Korean → English
+        out = io.StringIO()
+        ui.use(plain_ui.PlainUI(out=out, input_file=io.StringIO("5\n1\nq\n"), color=False))
+        try:
+            monkeypatch.setattr(vocab.random, "shuffle", lambda options: None)  # answer is option 1
+            assert vocab.present_choice(DATA["a"][0], "a", 0) is True
+            assert "1. to decide" in out.getvalue()
+            assert vocab.present_choice(DATA["a"][0], "a", 0) is None
+        finally:
+            ui.use(None)
+
+    def test_quiz_latency_stops_at_the_pick(self, tmp_path, monkeypatch):
+        _use_data(tmp_path, monkeypatch)
+        monkeypatch.setattr(vocab.random, "random", lambda: 0.0)
+        monkeypatch.setattr(vocab.random, "shuffle", lambda options: None)
+        now = [1e9]
+        srs = SRSEngine(tmp_path / "progress.json", clock=lambda: now[0],
+                        history=history.HistoryLog(tmp_path / "progress.history"))
+        frontend = plain_ui.PlainUI(out=io.StringIO(), input_file=io.StringIO("2\n1\n\n\n"), color=False)
+        ask, pause = frontend.ask, frontend.pause
+        frontend.ask = lambda *args: now.__setitem__(0, now[0] + 3) or ask(*args)
+        frontend.pause = lambda: now.__setitem__(0, now[0] + 30) or pause()
+        ui.use(frontend)
+        try:
+            vocab.run_drill(srs, session_size=1, multiple_choice=True)
+        finally:
+            ui.use(None)
+        reviews = srs.history.read()
+        assert reviews.card_ids == ["vocab:a:0"]
+        assert list(reviews.latency) == [3.0]  # reading the result afterwards isn't counted
+
+    def test_options_are_distinct_both_ways(self, tmp_path, monkeypatch):
+        data = {"c": [
+            {"korean": "결정하다", "english": "to decide"},
+            {"korean": "결심하다", "english": "to resolve"},
+            {"korean": "결의하다", "english": "to resolve"},
+            {"korean": "결심하다", "english": "to make up one's mind"},
+            {"korean": "결단하다", "english": "to determine"},
+            {"korean": "결론짓다", "english": "to conclude"},
+        ]}
+        _use_data(tmp_path, monkeypatch, data)
+        for _ in range(50):
+            options = [data["c"][0], *distractors.choices("c", 0)]
+            assert len(options) == 4
+            for field in ("english", "korean"):
+                assert len({distractors._answer_key(o[field]) for o in options}) == 4
+
+        for direction in (0.0, 0.9):  # Korean → English, then English → Korean
+            monkeypatch.setattr(vocab.random, "random", lambda: direction)
+            out = io.StringIO()
+            ui.use(plain_ui.PlainUI(out=out, input_file=io.StringIO("q\n"), color=False))
+            try:
+                assert vocab.present_choice(data["c"][0], "c", 0) is None
+            finally:
+                ui.use(None)
+            shown = [line[5:] for line in out.getvalue().splitlines() if line[2:5] in ("1. ", "2. ", "3. ", "4. ")]
+            assert len(shown) == len(set(shown)) == 4
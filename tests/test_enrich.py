@@ -0,0 +1,72 @@
+"""Tests for the data/notes/ enrichment stage."""
+
+import json
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import enrich
+
+
+def _setup(tmp_path, notes):
+    vocab = tmp_path / "vocab.json"
+    vocab.write_text(json.dumps({
+        "a": [{"korean": "슬쩍", "english": "sneakily"}, {"korean": "기꺼이", "english": "willingly"}],
+        "b": [{"korean": "헐", "english": "whoa", "notes": "hand-written"}],
+    }, indent=2, ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "notes").mkdir()
+    (tmp_path / "notes" / "x.json").write_text(json.dumps(notes, ensure_ascii=False), encoding="utf-8")
+    return vocab
+
+
+def _run(tmp_path, vocab, **kwargs):
+    return enrich.enrich(targets=(vocab,), notes_dir=tmp_path / "notes",
+                         state_file=tmp_path / "cache" / "enrich.json", **kwargs)
+
+
+class TestEnrich:
+    def test_applies_notes_and_fields_only_where_matched(self, tmp_path):
+        vocab = _setup(tmp_path, {
+            "a": {"슬쩍": "Related: 몰래.", "없는말": "nowhere"},
+            "b": {"헐": {"notes": "Shock.", "register": "casual"}},
+            "zz": {"헐": "no such category"},
+        })
+        summary = _run(tmp_path, vocab, jobs=2)
+        data = json.loads(vocab.read_text(encoding="utf-8"))
+        assert data["a"][0]["notes"] == "Related: 몰래."
+        assert "notes" not in data["a"][1]  # no generic fallback
+        assert data["b"][0] == {"korean": "헐", "english": "whoa", "notes": "Shock.", "register": "casual"}
+        assert summary == {"changed": 2, "missing": 2}
+
+    def test_reruns_touch_only_changed_entries(self, tmp_path):
+        vocab = _setup(tmp_path, {"a": {"슬쩍": "one", "기꺼이": "two"}})
+        assert _run(tmp_path, vocab, jobs=1)["changed"] == 2
+        mtime = vocab.stat().st_mtime_ns
+        assert _run(tmp_path, vocab, jobs=1)["changed"] == 0
+        assert vocab.stat().st_mtime_ns == mtime  # nothing changed, file not rewritten
+
+        (tmp_path / "notes" / "x.json").write_text(json.dumps({"a": {"슬쩍": "one", "기꺼이": "TWO"}}),
+                                                   encoding="utf-8")
+        assert _run(tmp_path, vocab, jobs=1)["changed"] == 1
+
+        # An entry that lost its note (e.g. re-merged) gets it back
+        data = json.loads(vocab.read_text(encoding="utf-8"))
+        del data["a"][0]["notes"]
+        vocab.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+        assert _run(tmp_path, vocab, jobs=1)["changed"] == 1
+        assert json.loads(vocab.read_text(encoding="utf-8"))["a"][0]["notes"] == "one"
+
+    def test_dry_run_writes_nothing(self, tmp_path):
+        vocab = _setup(tmp_path, {"a": {"슬쩍": "one"}})
+        before = vocab.read_text(encoding="utf-8")
+        assert _run(tmp_path, vocab, dry_run=True)["changed"] == 1
+        assert vocab.read_text(encoding="utf-8") == before
+        assert not (tmp_path / "cache").exists()
+
+    def test_shipped_notes_match_shipped_data(self):
+        annotations = enrich.load_annotations()
+        data = json.loads((enrich.DATA / "vocab.json").read_text(encoding="utf-8"))
+        for cat, notes in annotations.items():
+            changed, _, missing = enrich.enrich_category(data[cat], notes, {})
+            assert not changed and not missing
@@ -0,0 +1,49 @@
+"""Tests for the headless scripted drill runner."""
+
+import random
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import headless
+import rich_ui
+import ui
+from srs import AGAIN, GOOD
+
+
+def _script(n, rating="3"):
+    return [{"answer": "x", "fill": "y", "rating": rating} for _ in range(n)]
+
+
+class TestHeadless:
+    def test_runs_until_script_exhausted(self):
+        engine = headless.run("grammar", _script(25), start=1_000_000.0)
+        assert len(engine.reviews) == 25
+        assert all(r["quality"] == GOOD for r in engine.reviews)
+        # ui is handed back to Rich afterwards
+        assert ui.show_card_prompt is rich_ui.show_card_prompt
+
+    def test_clock_advances_per_card(self):
+        steps = [{"rating": "1", "elapsed": 30}, {"rating": "1", "elapsed": 30}]
+        engine = headless.run("vocab", steps, start=1_000_000.0)
+        times = [r["reviewed_at"] for r in engine.reviews]
+        assert times == [1_000_030.0, 1_000_060.0]
+        assert engine.reviews[0]["quality"] == AGAIN
+
+    def test_same_seed_same_cards(self):
+        a = headless.run("mixed", _script(15), seed=3, start=0.0)
+        b = headless.run("mixed", _script(15), seed=3, start=0.0)
+        assert [r["card_id"] for r in a.reviews] == [r["card_id"] for r in b.reviews]
+
+    def test_fill_in_result_recorded(self):
+        engine = headless.run("grammar", _script(10))
+        assert all(r["fill_correct"] is False for r in engine.reviews if "fill_correct" in r)
+        assert any("fill_correct" in r for r in engine.reviews)
+
+    def test_callers_rng_left_alone(self):
+        random.seed(99)
+        expected = random.random()
+        random.seed(99)
+        headless.run("vocab", _script(3), seed=1)
+        assert random.random() == expected
@@ -0,0 +1,138 @@
+"""Tests for the per-review history log and its analytics."""
+
+import math
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import headless
+import history
+import main
+import ui
+from srs import SRSEngine, AGAIN, GOOD, DAY
+
+T0 = 1000 * DAY
+
+
+class TestHistory:
+    def test_engine_appends_every_review(self, tmp_path):
+        log = history.HistoryLog(tmp_path / "progress.history")
+        engine = SRSEngine(tmp_path / "progress.json", autosave=False, history=log)
+        engine.record_review("vocab:a:0", GOOD, now=T0, latency=4.5)
+        engine.record_review("vocab:a:0", GOOD, now=T0 + 3600)
+        engine.replay([("grammar:b:1", AGAIN, T0 + 7200)])
+
+        reviews = history.HistoryLog(tmp_path / "progress.history").read()
+        assert reviews.card_ids == ["vocab:a:0", "grammar:b:1"]
+        assert list(reviews.card) == [0, 0, 1]
+        assert list(reviews.ts) == [T0, T0 + 3600, T0 + 7200]
+        assert list(reviews.rating) == [GOOD, GOOD, AGAIN]
+        assert list(reviews.prev_interval)[:2] == [0.0, 0.03999999910593033]  # float32 0.04
+        assert reviews.latency[0] == 4.5 and math.isnan(reviews.latency[1])
+        assert history.median_latency(reviews) == 4.5
+
+    def test_torn_last_row_is_dropped(self, tmp_path):
+        log = history.HistoryLog(tmp_path)
+        log.append_many([("c:0", T0, GOOD, 1.0, None), ("c:0", T0 + 1, GOOD, 1.0, None)])
+        with open(tmp_path / "ts.bin", "ab") as f:
+            f.write(b"\0" * 8)  # one column got ahead of the others
+        assert len(log.read()) == 2
+
+    def test_torn_write_is_read_and_appended_past(self, tmp_path):
+        log = history.HistoryLog(tmp_path)
+        log.append_many([("a:0", T0, GOOD, 1.0, None)])
+        # Crash mid-append: ts got a whole second row, latency 3 of its 4 bytes, cards.txt half an id
+        with open(tmp_path / "ts.bin", "ab") as f:
+            f.write(b"\0" * 8)
+        with open(tmp_path / "latency.bin", "ab") as f:
+            f.write(b"\0" * 3)
+        with open(tmp_path / "cards.txt", "a", encoding="utf-8") as f:
+            f.write("b:")
+        assert len(history.HistoryLog(tmp_path).read()) == 1
+
+        log = history.HistoryLog(tmp_path)
+        log.append_many([("b:0", T0 + 60, AGAIN, 2.0, 5.0)])
+        reviews = log.read()
+        assert reviews.card_ids == ["a:0", "b:0"]
+        assert list(reviews.ts) == [T0, T0 + 60]
+        assert list(reviews.rating) == [GOOD, AGAIN]
+        assert reviews.latency[1] == 5.0
+
+    def _reviews(self, tmp_path, rows):
+        log = history.HistoryLog(tmp_path)
+        log.append_many((cid, ts, rating, interval, None) for cid, ts, rating, interval in rows)
+        return log.read()
+
+    def test_retention_by_interval_and_category(self, tmp_path):
+        reviews = self._reviews(tmp_path, [
+            ("vocab:a:0", T0, GOOD, 0.0),        # first review: not counted
+            ("vocab:a:0", T0, GOOD, 0.5),
+            ("vocab:a:1", T0, AGAIN, 0.5),
+            ("vocab:a:0", T0, GOOD, 10.0),
+            ("grammar:b:0", T0, AGAIN, 10.0),
+        ])
+        assert history.retention(reviews) == {"all": [("<1d", 2, 0.5), ("1-3w", 2, 0.5)]}
+        assert history.retention(reviews, by_category=True) == {
+            "vocab:a": [("<1d", 2, 0.5), ("1-3w", 1, 1.0)],
+            "grammar:b": [("1-3w", 1, 0.0)],
+        }
+
+    def test_hourly_accuracy(self, tmp_path):
+        reviews = self._reviews(tmp_path, [
+            ("c:0", T0 + 9 * 3600, GOOD, 1.0),
+            ("c:0", T0 + 9 * 3600 + 60, AGAIN, 1.0),
+            ("c:0", T0 + 22 * 3600, GOOD, 1.0),
+        ])
+        hours = history.hourly_accuracy(reviews, utc_offset=0)
+        assert hours[9] == (2, 0.5) and hours[22] == (1, 1.0)
+        assert history.hourly_accuracy(reviews, utc_offset=3600)[10] == (2, 0.5)
+        assert sum(n for n, _ in hours) == 3
+
+    def test_leeches(self, tmp_path):
+        rows = [("vocab:x:0", T0 + i, AGAIN, 3.0) for i in range(4)]       # 4 lapses, still failing
+        rows += [("vocab:x:1", T0 + i, AGAIN, 3.0) for i in range(5)]
+        rows += [("vocab:x:1", T0 + 10, GOOD, 0.007)]                       # 5 lapses, recovered
+        rows += [("vocab:x:2", T0 + i, AGAIN, 0.007) for i in range(9)]    # never learned: no lapses
+        reviews = self._reviews(tmp_path, rows)
+        assert history.leeches(reviews) == [("vocab:x:1", 5, 0), ("vocab:x:0", 4, 4)]
+
+    def test_kind_latency(self, tmp_path):
+        log = history.HistoryLog(tmp_path)
+        log.append_many([("vocab:a:0", T0, GOOD, 0.0, 100.0)]
+                        + [("vocab:a:1", T0, GOOD, 0.0, s) for s in (4.0, 6.0, 8.0)]
+                        + [("grammar:b:0", T0, GOOD, 0.0, 50.0), ("grammar:b:0", T0, GOOD, 0.0, None)])
+        assert history.kind_latency(log.read(), recent=3) == {"vocab": 6.0, "grammar": 50.0}
+
+    def test_mixed_review_logs_card_latency(self, tmp_path):
+        clock = headless.ScriptClock(T0)
+        frontend = headless.ScriptedUI([{"rating": "3", "elapsed": 12} for _ in range(3)], clock)
+        log = history.HistoryLog(tmp_path / "progress.history")
+        engine = SRSEngine(tmp_path / "progress.json", autosave=False, clock=clock, history=log)
+        ui.use(frontend)
+        try:
+            main.mixed_review(engine)
+        finally:
+            ui.use(None)
+        assert list(log.read().latency) == [12.0, 12.0, 12.0]
+
+    def test_progress_history_views(self, tmp_path):
+        category = next(c for c in main.vocab.load_vocab() if ":" in c)
+        cid = main.vocab.card_id(category, 0)
+        assert main._resolve_card_label(cid) == main.vocab.load_vocab()[category][0]["korean"]
+
+        clock = headless.ScriptClock(T0)
+        frontend = headless.ScriptedUI([], clock)
+        shown = []
+        frontend.show_retention = lambda curve, decks: shown.append("retention")
+        frontend.show_hourly_accuracy = lambda hours: shown.append("hourly")
+        log = history.HistoryLog(tmp_path)
+        log.append_many([(cid, T0, GOOD, 0.0, None)])  # only first reviews: nothing to retain yet
+        ui.use(frontend)
+        try:
+            main._show_history(log.read())
+            log.append_many([(cid, T0 + DAY, GOOD, 1.0, None)])
+            main._show_history(log.read())
+        finally:
+            ui.use(None)
+        assert shown == ["hourly", "retention", "hourly"]
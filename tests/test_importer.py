@@ -0,0 +1,76 @@
+"""Tests for bulk review-history import."""
+
+import json
+import subprocess
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import history
+import importer
+from srs import SRSEngine, DAY
+
+VOCAB = {"감정": [
+    {"korean": "서운하다", "english": "to feel hurt"},
+    {"korean": "무섭다", "english": "scary"},
+    {"korean": "두렵다", "english": "scary"},
+]}
+GRAMMAR = {"연결": [{"pattern": "-더니"}]}
+T0 = 1_700_000_000
+
+
+class TestImporter:
+    def _matcher(self):
+        return importer.CardMatcher(VOCAB, GRAMMAR)
+
+    def test_matching(self):
+        matcher = self._matcher()
+        assert matcher.match("서운 하다", None) == "vocab:감정:0"
+        assert matcher.match(None, "To feel hurt") == "vocab:감정:0"
+        assert matcher.match("-더니", None) == "grammar:연결:0"
+        assert matcher.match(None, "scary") is None  # two cards share the gloss
+
+    def test_csv_import_replays_sm2_and_skips_reimports(self, tmp_path):
+        log = tmp_path / "revlog.csv"
+        log.write_text(
+            "Korean,English,Ease,Timestamp\n"
+            f"서운하다,,3,{T0}\n"
+            f"서운하다,,3,{(T0 + DAY) * 1000}\n"      # milliseconds
+            f"서운하다,,good,2023-11-17T00:00:00Z\n"  # ISO, after the first two
+            f"무섭다,,7,{T0}\n"                       # not a rating
+            f"없는말,,3,{T0}\n",
+            encoding="utf-8",
+        )
+        engine = SRSEngine(tmp_path / "progress.json", autosave=False)
+        report = importer.import_history(engine, importer.read_rows(log), self._matcher(), batch_size=2)
+        assert (report.rows, report.applied, report.invalid) == (5, 3, 1)
+        assert dict(report.unmatched) == {"없는말": 1}
+        card = engine.cards["vocab:감정:0"]
+        assert (card.total_reviews, card.repetitions, card.interval_days) == (3, 3, 3.0)
+        assert not (tmp_path / "progress.json").exists()  # saving is the caller's call
+
+        again = importer.import_history(engine, importer.read_rows(log), self._matcher())
+        assert (again.applied, again.skipped) == (0, 3)
+        assert engine.cards["vocab:감정:0"].total_reviews == 3
+
+    def test_jsonl_with_card_ids_and_sm2_scale(self, tmp_path):
+        log = tmp_path / "history.jsonl"
+        rows = [{"card_id": "grammar:연결:0", "quality": q, "reviewed_at": T0 + i} for i, q in enumerate((5, 1))]
+        log.write_text("".join(json.dumps(r) + "\n" for r in rows), encoding="utf-8")
+        engine = SRSEngine(tmp_path / "progress.json", autosave=False)
+        importer.import_history(engine, importer.read_rows(log), self._matcher(), importer.SM2)
+        card = engine.cards["grammar:연결:0"]
+        assert (card.total_reviews, card.correct_count, card.repetitions) == (2, 1, 0)
+
+    def test_cli_imports_into_the_review_log(self, tmp_path):
+        log = tmp_path / "history.jsonl"
+        rows = [{"card_id": "vocab:한자어 (Sino-Korean):0", "quality": 4, "reviewed_at": T0 + i * DAY}
+                for i in range(2)]
+        log.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows), encoding="utf-8")
+        script = Path(__file__).parent.parent / "importer.py"
+        subprocess.run([sys.executable, str(script), str(log), "--progress", str(tmp_path / "progress.json")],
+                       check=True, capture_output=True)
+        reviews = history.HistoryLog(tmp_path / "progress.history").read()
+        assert reviews.card_ids == ["vocab:한자어 (Sino-Korean):0"]
+        assert list(reviews.ts) == [T0, T0 + DAY]
@@ -0,0 +1,84 @@
+"""Tests for the hot-path instrumentation layer."""
+
+import io
+import json
+import tempfile
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import perf
+import plain_ui
+import rich_ui
+import screen
+from srs import SRSEngine, GOOD
+
+
+class TestPerf:
+    def setup_method(self):
+        perf.reset()
+
+    def teardown_method(self):
+        perf.disable()
+        perf.reset()
+
+    def test_disabled_records_nothing(self):
+        perf.disable()
+        with perf.span("x"):
+            pass
+        perf.count("y")
+        assert perf.summary()["timers"] == {}
+        assert perf.summary()["counters"] == {}
+
+    def test_timed_and_counters(self):
+        perf.enable(report=False)
+
+        @perf.timed("work")
+        def work():
+            return 42
+
+        assert work() == 42
+        assert work() == 42
+        perf.count("hits", 3)
+        summary = perf.summary()
+        assert summary["timers"]["work"]["count"] == 2
+        assert sum(summary["timers"]["work"]["histogram"].values()) == 2
+        assert summary["counters"]["hits"] == 3
+
+    def test_engine_paths_instrumented_and_report_written(self):
+        perf.enable(report=False)
+        tmp = Path(tempfile.mkdtemp())
+        engine = SRSEngine(progress_file=tmp / "progress.json")
+        engine.record_review("a", GOOD)
+        engine.get_due_cards(["a", "b"])
+        path = perf.write_report(tmp / "report.json")
+        report = json.loads(path.read_text())
+        assert {"srs.load", "srs.save", "srs.get_due_cards"} <= set(report["timers"])
+        assert report["counters"]["srs.reviews"] == 1
+
+    def test_rating_latency_stays_within_a_session(self):
+        frontends = (
+            plain_ui.PlainUI(out=io.StringIO(), input_file=io.StringIO("3\n3\n"), color=False),
+            screen.Screen(file=io.StringIO(), input_file=io.StringIO("3\n3\n"), width=60, height=40),
+        )
+        for frontend in frontends:
+            perf.reset()
+            perf.enable(report=False)
+            frontend.rating_prompt()
+            frontend.show_card_prompt("가")
+            frontend.rating_prompt()
+            frontend.show_session_summary(2, 2)
+            frontend.show_card_prompt("나")  # first card of the next session
+            if isinstance(frontend, screen.Screen):
+                frontend.flush()  # the screen is sent, and the latency taken, on the next input or flush
+            assert perf.summary()["timers"]["latency.rating_to_next_card"]["count"] == 1, frontend
+
+    def test_forecast_and_summary_timed_once_each(self):
+        perf.enable(report=False)
+        with rich_ui.console.capture():
+            rich_ui.show_forecast([3, 1, 0])
+            rich_ui.show_session_summary(2, 1)
+        timers = perf.summary()["timers"]
+        assert timers["ui.show_forecast"]["count"] == 1
+        assert timers["ui.show_session_summary"]["count"] == 1
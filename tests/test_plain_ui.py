@@ -0,0 +1,94 @@
+"""Tests for the plain ANSI UI backend."""
+
+import io
+import subprocess
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import plain_ui
+import ui
+from srs import AGAIN, GOOD
+
+ROOT = Path(__file__).parent.parent
+
+
+def _plain(answers="", color=False):
+    out = io.StringIO()
+    return plain_ui.PlainUI(out=out, input_file=io.StringIO(answers), color=color), out
+
+
+class TestPlainUI:
+    def test_implements_frontend_api(self):
+        frontend, _ = _plain()
+        assert all(callable(getattr(frontend, name)) for name in ui.FRONTEND_API)
+
+    def test_menu_and_rating_input(self):
+        frontend, out = _plain("9\n2\nx\n1\n\n")
+        assert frontend.menu(["가나다", "Grammar"], ["3 due", ""]) == 1
+        assert "Invalid choice." in out.getvalue()
+        assert "[1]  가나다   3 due" in out.getvalue()
+        assert frontend.rating_prompt() == AGAIN
+        assert frontend.rating_prompt() == GOOD  # Enter takes the default
+        try:
+            frontend.ask("Meaning")
+        except EOFError:
+            pass
+        else:
+            raise AssertionError("expected EOFError at end of input")
+
+    def test_card_rendering(self):
+        frontend, out = _plain("{literal}\n")
+        frontend.show_card_prompt("서운하다", "feeling\n{hint}")
+        frontend.show_result(False, "to feel hurt", "note")
+        frontend.show_session_summary(10, 9)
+        assert frontend.ask("Type {x}") == "{literal}"
+        text = out.getvalue()
+        assert "Type {x} (q to quit): " in text
+        assert "┃ 서운하다\n┃ feeling\n┃ {hint}\n" in text
+        assert "✗ Incorrect\n┃ to feel hurt\n┃ note\n" in text
+        assert "Accuracy  90%" in text and "Excellent." in text
+        assert "\x1b[" not in text
+
+        colored, out = _plain(color=True)
+        colored.show_card_prompt("서운하다")
+        assert "\x1b[1;97m서운하다\x1b[0m" in out.getvalue()
+
+    def test_plain_session_does_not_import_rich(self):
+        code = (
+            "import sys, io, ui, plain_ui, vocab\n"
+            "ui.set_default(plain_ui.PlainUI(out=io.StringIO(), input_file=io.StringIO('')))\n"
+            "ui.banner(); ui.show_card_prompt('가'); ui.show_session_summary(1, 1)\n"
+            "print(any(m == 'rich' or m.startswith('rich.') for m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+        assert result.stdout.strip() == "False", result.stderr
+
+    def test_progress_tables(self):
+        frontend, out = _plain()
+        frontend.show_forecast([4, 0, 2])
+        frontend.show_weakest([("서운하다 — to feel hurt", 0.5, 4, 1.3), ("{x}", 1.0, 12, 2.5)])
+        text = out.getvalue()
+        assert "  Today    4  " + "█" * 30 + "\n  +1d      0\n  +2d      2  " + "█" * 15 + "\n" in text
+        assert "  서운하다 — to feel hurt       50%        4   1.3\n" in text
+        assert "  {x}                          100%       12   2.5\n" in text
+
+    def test_plain_view_progress_does_not_import_rich(self, tmp_path):
+        code = (
+            "import sys, io, history, main, ui, plain_ui\n"
+            "from pathlib import Path\n"
+            "from srs import SRSEngine\n"
+            "out = io.StringIO()\n"
+            "ui.set_default(plain_ui.PlainUI(out=out, input_file=io.StringIO('\\n')))\n"
+            "tmp = Path(sys.argv[1])\n"
+            "srs = SRSEngine(tmp / 'progress.json', history=history.HistoryLog(tmp / 'progress.history'))\n"
+            "for i in range(6):\n"
+            "    srs.record_review('vocab:x:%d' % i, 3 if i % 2 else 0, now=1e9 + i, latency=4.0)\n"
+            "main.view_progress(srs)\n"
+            "assert 'Weakest Cards' in out.getvalue() and 'Accuracy by Hour' in out.getvalue()\n"
+            "print(any(m == 'rich' or m.startswith('rich.') for m in sys.modules))\n"
+        )
+        result = subprocess.run([sys.executable, "-c", code, str(tmp_path)], cwd=ROOT,
+                                capture_output=True, text=True)
+        assert result.stdout.strip() == "False", result.stderr
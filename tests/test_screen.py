@@ -0,0 +1,55 @@
+"""Tests for differential screen rendering."""
+
+import io
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import screen
+
+
+def _screen():
+    out = io.StringIO()
+    return screen.Screen(file=out, input_file=io.StringIO(), width=60, height=30), out
+
+
+class TestScreen:
+    def test_first_flush_clears_and_draws(self):
+        scr, out = _screen()
+        scr.show_card_prompt("모순")
+        scr.flush()
+        assert out.getvalue().startswith(screen.CLEAR_SCREEN)
+        assert "모순" in out.getvalue()
+
+    def test_unchanged_frame_emits_only_cursor(self):
+        scr, out = _screen()
+        scr.show_card_prompt("모순")
+        scr.flush()
+        out.seek(0)
+        out.truncate()
+        scr.clear()
+        scr.show_card_prompt("모순")
+        scr.flush()
+        assert out.getvalue() == f"\x1b[{len(scr.frame) + 1};1H"
+
+    def test_changed_card_rewrites_only_changed_rows(self):
+        scr, out = _screen()
+        scr.show_header("Cat", 1, 2)
+        scr.show_card_prompt("모순")
+        scr.flush()
+        out.seek(0)
+        out.truncate()
+        scr.clear()
+        scr.show_header("Cat", 2, 2)
+        scr.show_card_prompt("진단")
+        scr.flush()
+        written = out.getvalue()
+        assert "진단" in written and "(2/2)" in written
+        assert "╭" not in written  # panel borders are unchanged
+
+    def test_read_appends_answered_prompt(self):
+        scr, _ = _screen()
+        scr.input = io.StringIO("hello\n")
+        assert scr.ask("Your answer") == "hello"
+        assert scr.frame[-1].endswith("hello")
@@ -0,0 +1,65 @@
+"""Tests for time-boxed sessions."""
+
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import headless
+import history
+import main
+import timebox
+import ui
+from srs import SRSEngine
+
+
+class TestTimebox:
+    def test_estimates_follow_observed_latency(self):
+        clock = headless.ScriptClock(0.0)
+        box = timebox.Timebox(5, clock, {"vocab": 10.0})
+        assert box.estimate("grammar") == timebox.DEFAULT_SECONDS["grammar"]
+        box.observe("vocab", 20.0)
+        assert box.estimate("vocab") == 13.0
+        box.observe("vocab", 10_000.0)  # stepped away: capped
+        assert box.estimate("vocab") == 13.0 + timebox.SMOOTHING * (timebox.MAX_SECONDS - 13.0)
+
+    def test_plan_skips_cards_that_would_overrun(self):
+        clock = headless.ScriptClock(0.0)
+        box = timebox.Timebox(1, clock, {"vocab": 10.0, "grammar": 45.0})
+        assert box.plan(["vocab", "vocab", "grammar", "grammar", "vocab"]) == 3  # both grammar cards skipped
+        clock.advance(20)
+        assert box.fits("vocab") and not box.fits("grammar")
+        clock.advance(31)
+        assert box.expired()
+
+    def test_seeded_from_history(self, tmp_path):
+        log = history.HistoryLog(tmp_path / "progress.history")
+        log.append_many([("grammar:b:0", 0.0, 3, 0.0, 30.0)])
+        engine = SRSEngine(tmp_path / "progress.json", autosave=False, history=log)
+        box = timebox.Timebox.for_engine(engine, 10)
+        assert box.estimates == {"vocab": timebox.DEFAULT_SECONDS["vocab"], "grammar": 30.0}
+
+    def test_near_zero_history_is_floored(self, tmp_path):
+        log = history.HistoryLog(tmp_path / "progress.history")
+        log.append_many([("vocab:a:%d" % i, float(i), 3, 0.0, 0.01) for i in range(20)])  # scripted runs
+        engine = SRSEngine(tmp_path / "progress.json", autosave=False, history=log)
+        box = timebox.Timebox.for_engine(engine, 10)
+        assert box.estimate("vocab") == timebox.MIN_SECONDS
+        assert box.plan(["vocab"] * 5000) <= 600 / timebox.MIN_SECONDS  # not the whole pool
+        box.observe("vocab", 0.0)
+        assert box.estimate("vocab") == timebox.MIN_SECONDS
+
+    def test_timed_review_fills_the_box(self, tmp_path):
+        clock = headless.ScriptClock(1_000_000.0)
+        steps = [{"rating": "3", "elapsed": 30} for _ in range(100)]
+        frontend = headless.ScriptedUI(steps, clock)
+        engine = headless.RecordingEngine(tmp_path / "progress.json", autosave=False,
+                                          clock=clock, frontend=frontend)
+        ui.use(frontend)
+        try:
+            main.timed_review(engine, 3, kinds=("vocab",))
+        finally:
+            ui.use(None)
+        # 20s estimate at first, moving towards 30s: six cards, and a seventh would overrun
+        assert len(engine.reviews) == 6
+        assert clock.now - 1_000_000.0 == 180
@@ -0,0 +1,64 @@
+"""Tests for the vocab -> drill passage cross-reference index."""
+
+import json
+import os
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import vocab
+import xref
+
+
+class TestXref:
+    def test_headword_keys(self):
+        assert xref.headword_keys("결정하다") == [("결정", False)]
+        assert xref.headword_keys("사무치다") == [("사무치", True)]
+        assert xref.headword_keys("모순") == [("모순", False)]
+        assert xref.headword_keys("아쉽다 vs 서운하다") == [("아쉽", True), ("서운", False)]
+        assert xref.headword_keys("~(으)로 인해") == []
+        assert xref.headword_keys("가다") == []  # one-syllable stems match too much
+
+    def test_automaton_finds_overlapping_words(self):
+        automaton = xref.Automaton(["결정", "결정론", "정론"])
+        assert sorted(automaton.search("결정론자")) == [(0, "결정"), (0, "결정론"), (1, "정론")]
+
+    def test_scan_particles_and_word_starts(self):
+        keys = xref._Keys({"c": [{"korean": "사과"}, {"korean": "결정하다"}, {"korean": "사무치다"}]})
+        hits = xref.scan([
+            ("A", "사과를 먹었다. 사과나무가 있다."),
+            ("B", "그는 곧 결정했다. 미결정 상태다."),
+            ("C", "그리움이 사무쳐 왔다."),
+        ], keys)
+        assert hits == {
+            "vocab:c:0": [["사과를 먹었다.", "A"]],
+            "vocab:c:1": [["그는 곧 결정했다.", "B"]],
+        }
+
+    def test_index_rescans_only_changed_files(self, tmp_path, monkeypatch):
+        (tmp_path / "vocab.json").write_text(json.dumps({"c": [{"korean": "모순"}]}), encoding="utf-8")
+        (tmp_path / "a.json").write_text(json.dumps(["모순이 있다."]), encoding="utf-8")
+        (tmp_path / "b.json").write_text(json.dumps(["모순은 없다."]), encoding="utf-8")
+        scanned = []
+
+        def source(data):
+            scanned.append(data[0])
+            return (("src", text) for text in data)
+
+        monkeypatch.setattr(vocab, "DATA_FILE", tmp_path / "vocab.json")
+        monkeypatch.setattr(vocab, "_cache", None)
+        monkeypatch.setattr(xref, "DATA_DIR", tmp_path)
+        monkeypatch.setattr(xref, "CACHE_FILE", tmp_path / "cache" / "xref.json")
+        monkeypatch.setattr(xref, "SOURCES", {"a.json": source, "b.json": source})
+        monkeypatch.setattr(xref, "_index", None)
+
+        assert xref.seen_in("vocab:c:0", limit=5) == [("모순이 있다.", "src"), ("모순은 없다.", "src")]
+        assert len(scanned) == 2
+
+        (tmp_path / "b.json").write_text(json.dumps(["모순적인 말."]), encoding="utf-8")
+        stat = (tmp_path / "b.json").stat()
+        os.utime(tmp_path / "b.json", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        monkeypatch.setattr(xref, "_index", None)  # a fresh process: only the on-disk cache
+        assert xref.seen_in("vocab:c:0", limit=5, exclude="모순이 있다.") == [("모순적인 말.", "src")]
+        assert scanned == ["모순이 있다.", "모순은 없다.", "모순적인 말."]
@@ -0,0 +1,72 @@
+"""Time-boxed sessions: as many cards as fit in N minutes.
+
+A Timebox keeps a running estimate of how long each kind of card takes,
+from card shown to rating. It starts from the median of recent reviews in
+the history log (DEFAULT_SECONDS before any are logged) and moves towards
+every card answered this session. The session loop asks it how many of the
+queued cards still fit, skips cards whose kind no longer fits the time
+left (near the end a quick vocab card can still fit when a grammar card
+would overrun), and stops when nothing does.
+"""
+
+from typing import Callable, Iterable
+
+import history
+
+DEFAULT_SECONDS = {"vocab": 20.0, "grammar": 60.0}  # per card, until the history has some
+SMOOTHING = 0.3      # weight of each new card in the running estimate
+MIN_SECONDS = 3.0    # quicker "answers" are scripted runs or key mashing, not reading a card
+MAX_SECONDS = 300.0  # longer waits are the user stepping away, not the card
+
+
+class Timebox:
+    """*minutes* of study measured on *clock*, with per-kind seconds-per-card estimates."""
+
+    def __init__(self, minutes: float, clock: Callable[[], float],
+                 estimates: dict[str, float] | None = None):
+        self.budget = minutes * 60
+        self.clock = clock
+        self.started = clock()
+        merged = {**DEFAULT_SECONDS, **(estimates or {})}
+        self.estimates = {kind: max(seconds, MIN_SECONDS) for kind, seconds in merged.items()}
+
+    @classmethod
+    def for_engine(cls, srs, minutes: float) -> "Timebox":
+        """A timebox on the engine's clock, seeded from its history log if it has one."""
+        estimates = {}
+        if srs.history is not None:
+            estimates = history.kind_latency(srs.history.read())
+        return cls(minutes, srs.clock, estimates)
+
+    def remaining(self) -> float:
+        return self.budget - (self.clock() - self.started)
+
+    def estimate(self, kind: str) -> float:
+        return self.estimates.get(kind, max(self.estimates.values()))
+
+    def observe(self, kind: str, seconds: float) -> None:
+        """Fold one answered card's latency into its kind's estimate."""
+        estimate = self.estimate(kind)
+        seconds = min(max(seconds, MIN_SECONDS), MAX_SECONDS)
+        self.estimates[kind] = estimate + SMOOTHING * (seconds - estimate)
+
+    def fits(self, kind: str) -> bool:
+        return self.estimate(kind) <= self.remaining()
+
+    def expired(self) -> bool:
+        """True once not even the quickest kind of card fits."""
+        return min(self.estimates.values()) > self.remaining()
+
+    def plan(self, kinds: Iterable[str]) -> int:
+        """How many of the queued cards (by kind, in order) fit the time left, skipping ones that don't."""
+        left = self.remaining()
+        quickest = min(self.estimates.values())
+        planned = 0
+        for kind in kinds:
+            if left < quickest:
+                break
+            seconds = self.estimate(kind)
+            if seconds <= left:
+                left -= seconds
+                planned += 1
+        return planned
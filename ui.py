@@ -1,156 +1,94 @@
-"""Rich-based UI helpers for the Korean Coach."""
-
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.text import Text
-from rich.prompt import Prompt
-from rich import box
-
-console = Console()
-
-
-def clear():
-    console.clear()
-
-
-def banner():
-    title = Text("한국어 코치", style="bold bright_white")
-    subtitle = Text("Korean Coach — Advanced Fluency Trainer", style="dim")
-    content = Text.assemble(title, "\n", subtitle)
-    console.print(Panel(content, box=box.DOUBLE, border_style="bright_blue", padding=(1, 4)))
-    console.print()
-
-
-def menu(options: list[str]) -> int:
-    """Display a numbered menu and return the selected index (0-based)."""
-    table = Table(box=box.SIMPLE, show_header=False, padding=(0, 2))
-    table.add_column(style="bright_cyan bold", width=4)
-    table.add_column(style="white")
-    for i, option in enumerate(options, 1):
-        table.add_row(f"[{i}]", option)
-    console.print(table)
-    console.print()
-
-    while True:
-        choice = Prompt.ask("[bright_cyan]Choose[/]", default="1")
-        try:
-            idx = int(choice) - 1
-            if 0 <= idx < len(options):
-                return idx
-        except ValueError:
-            pass
-        console.print("[red]Invalid choice.[/]")
-
-
-def ask(prompt_text: str, default: str | None = None) -> str:
-    """Ask for input. Returns 'q' if user wants to quit."""
-    result = Prompt.ask(f"[bright_cyan]{prompt_text}[/] [dim](q to quit)[/]", default=default or "")
-    return result
-
-
-def show_card_prompt(korean: str, hint: str | None = None):
-    """Display a card prompt — the thing being quizzed."""
-    parts = [Text(korean, style="bold bright_white on grey23")]
-    if hint:
-        parts.append(Text(f"\n{hint}", style="dim italic"))
-    content = Text.assemble(*parts)
-    console.print(Panel(content, box=box.ROUNDED, border_style="bright_blue", padding=(1, 3)))
-
-
-def show_answer(answer: str, explanation: str | None = None):
-    """Reveal the answer (self-rated, no correct/incorrect judgment)."""
-    parts = [Text(answer, style="bold white")]
-    if explanation:
-        parts.append(Text(f"\n{explanation}", style="dim"))
-    content = Text.assemble(*parts)
-    console.print(Panel(content, box=box.ROUNDED, border_style="bright_blue", padding=(0, 2)))
-
-
-def show_result(correct: bool, answer: str, explanation: str | None = None):
-    if correct:
-        mark = Text("✓ Correct!", style="bold bright_green")
-    else:
-        mark = Text("✗ Incorrect", style="bold bright_red")
-
-    parts = [mark, Text(f"\n{answer}", style="white")]
-    if explanation:
-        parts.append(Text(f"\n{explanation}", style="dim"))
-    content = Text.assemble(*parts)
-    style = "bright_green" if correct else "bright_red"
-    console.print(Panel(content, box=box.ROUNDED, border_style=style, padding=(0, 2)))
-
-
-def show_breakdown(breakdown: str):
-    """Show hanja syllable breakdown for Sino-Korean words."""
-    console.print(f"  [bright_magenta]한자 breakdown:[/] [white]{breakdown}[/]")
-
-
-def show_example(sentence: str, translation: str | None = None):
-    parts = [Text(f"  {sentence}", style="italic bright_yellow")]
-    if translation:
-        parts.append(Text(f"\n  {translation}", style="dim"))
-    console.print(Text.assemble(*parts))
-    console.print()
-
-
-def show_stats(stats: dict):
-    table = Table(title="Progress", box=box.ROUNDED, border_style="bright_blue")
-    table.add_column("Metric", style="bright_cyan")
-    table.add_column("Value", style="white", justify="right")
-    table.add_row("Cards Seen", str(stats["total"]))
-    table.add_row("Due Now", str(stats["due"]))
-    table.add_row("Learning (<7d)", str(stats["learning"]))
-    table.add_row("Mature (≥7d)", str(stats["mature"]))
-    table.add_row("Accuracy", f"{stats['accuracy']:.0%}")
-    console.print(table)
-    console.print()
+"""UI entry points for the Korean Coach, dispatched to a swappable backend.
 
+The drill loops only call the functions named in FRONTEND_API. Those are
+bound to a backend, which is any object (or module) that provides them:
 
-def show_session_summary(reviewed: int, correct: int):
-    acc = correct / reviewed if reviewed > 0 else 0
-    if acc >= 0.9:
-        grade_style = "bold bright_green"
-        comment = "Excellent."
-    elif acc >= 0.7:
-        grade_style = "bold bright_yellow"
-        comment = "Solid, but room to sharpen."
-    elif acc >= 0.5:
-        grade_style = "bold yellow"
-        comment = "Getting there. Keep drilling."
-    else:
-        grade_style = "bold bright_red"
-        comment = "These need more work. They'll come back."
-
-    table = Table(box=box.ROUNDED, border_style="bright_blue", title="Session Complete")
-    table.add_column("", style="bright_cyan")
-    table.add_column("", justify="right")
-    table.add_row("Reviewed", str(reviewed))
-    table.add_row("Correct", str(correct))
-    table.add_row("Accuracy", Text(f"{acc:.0%}", style=grade_style))
-    console.print(table)
-    console.print(Text(f"  {comment}", style="dim italic"))
-    console.print()
-
-
-def rating_prompt() -> int | None:
-    """Ask the user to self-rate after seeing the answer. Returns SRS quality."""
+    rich_ui      panels and tables via Rich; the default
+    plain_ui     pre-formatted ANSI strings, no Rich import (--plain)
+    screen       Rich renderables with differential redraw
+    headless     scripted input, no output
+
+Rich is imported only when something actually needs it. Under the plain
+backend neither a drill session nor View Progress loads it. Everything else
+the Rich backend defines (console, card_panel, ...) is reachable as
+ui.<name> and is loaded on first use.
+"""
+
+import importlib
+
+# Everything the drill loops and View Progress call. A frontend providing these names can
+# stand in for the default via use() — see headless.py, screen.py, plain_ui.py.
+FRONTEND_API = (
+    "clear", "banner", "menu", "ask", "newline", "show_title", "show_notice",
+    "show_header", "show_instruction", "show_fill_in", "show_card_prompt",
+    "show_answer", "show_result", "show_breakdown", "show_example",
+    "show_seen_in", "show_session_summary", "rating_prompt", "pause",
+    "show_stats", "show_forecast", "show_retention", "show_hourly_accuracy",
+    "show_leeches", "show_weakest",
+)
+
+_default = None  # the backend use(None) restores; None means Rich
+
+
+def rating_from_choice(choice: str) -> int | None:
+    """Map a rating-bar key to an SRS quality; None if it isn't one."""
     from srs import AGAIN, HARD, GOOD, EASY
-    console.print(
-        "  [bright_red][1] Again[/] [dim]didn't know[/]  "
-        "[yellow][2] Hard[/] [dim]struggled[/]  "
-        "[bright_green][3] Good[/] [dim]knew it[/]  "
-        "[bright_cyan][4] Easy[/] [dim]effortless[/]"
-    )
-    while True:
-        choice = Prompt.ask("[dim]Rate[/]", default="3")
-        mapping = {"1": AGAIN, "2": HARD, "3": GOOD, "4": EASY}
-        if choice in mapping:
-            return mapping[choice]
-        if choice.lower() == "q":
-            return None
-        console.print("[red]Enter 1-4 or q to quit.[/]")
-
-
-def pause():
-    Prompt.ask("[dim]Press Enter to continue[/]", default="")
+    return {"1": AGAIN, "2": HARD, "3": GOOD, "4": EASY}.get(choice)
+
+
+# Session accuracy floors and what the summary says about them, best first
+GRADES = (
+    (0.9, "Excellent."),
+    (0.7, "Solid, but room to sharpen."),
+    (0.5, "Getting there. Keep drilling."),
+    (0.0, "These need more work. They'll come back."),
+)
+
+
+def session_grade(reviewed: int, correct: int) -> tuple[float, int]:
+    """Session accuracy and the index of its GRADES entry."""
+    acc = correct / reviewed if reviewed > 0 else 0
+    return acc, next(i for i, (floor, _) in enumerate(GRADES) if acc >= floor)
+
+
+def deck_notes(counts: list[tuple[int, int]]) -> list[str]:
+    """Menu notes for an "All" entry followed by one per deck, from (due, new) counts."""
+    def note(due: int, new: int) -> str:
+        parts = [f"{due} due"] if due else []
+        if new:
+            parts.append(f"{new} new")
+        return " · ".join(parts)
+    total = (sum(due for due, _ in counts), sum(new for _, new in counts))
+    return [note(*total)] + [note(*c) for c in counts]
+
+
+def _rich():
+    return importlib.import_module("rich_ui")
+
+
+def use(frontend=None) -> None:
+    """Route the UI functions to *frontend*, or back to the default backend when None."""
+    if frontend is None:
+        frontend = _default if _default is not None else _rich()
+    for name in FRONTEND_API:
+        globals()[name] = getattr(frontend, name)
+
+
+def set_default(frontend=None) -> None:
+    """Make *frontend* the backend use(None) returns to (None: Rich), and switch to it."""
+    global _default
+    _default = frontend
+    use(None)
+
+
+def __getattr__(name: str):
+    # Only reached for names not bound yet: the first UI call, or Rich-only helpers
+    if name in FRONTEND_API:
+        use(None)
+        return globals()[name]
+    if name.startswith("__"):
+        raise AttributeError(name)
+    try:
+        return getattr(_rich(), name)
+    except AttributeError:
+        raise AttributeError(f"module 'ui' has no attribute {name!r}") from None
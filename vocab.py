@@ -1,35 +1,54 @@
 """Vocabulary drill module."""
 
-import json
 import random
-from pathlib import Path
 
+import bundle
+import distractors
+import perf
 import ui
-from srs import SRSEngine, GOOD
+import xref
+from srs import SRSEngine, AGAIN, GOOD
 
-DATA_FILE = Path(__file__).parent / "data" / "vocab.json"
+DATA_FILE = bundle.ROOT / "data" / "vocab.json"
 
+_cache: tuple[int, dict] | None = None  # (mtime_ns, parsed data)
 
+
+@perf.timed("content.load_vocab")
 def load_vocab() -> dict[str, list[dict]]:
-    return json.loads(DATA_FILE.read_text(encoding="utf-8"))
+    """Parsed vocab.json, re-read only when the file changes. Treat as read-only."""
+    global _cache
+    mtime = bundle.mtime_ns(DATA_FILE)
+    if _cache is None or _cache[0] != mtime:
+        _cache = (mtime, bundle.load_json(DATA_FILE))
+    return _cache[1]
 
 
 def card_id(category: str, idx: int) -> str:
     return f"vocab:{category}:{idx}"
 
 
-def run_drill(srs: SRSEngine, session_size: int = 15):
-    """Run a vocabulary drill session."""
+def run_drill(srs: SRSEngine, session_size: int = 15, multiple_choice: bool = False):
+    """Run a vocabulary drill session.
+
+    With *multiple_choice* each card offers four answers, the wrong ones
+    similar entries picked by distractors.py, and is graded by the pick.
+    """
     data = load_vocab()
     categories = list(data.keys())
 
     ui.clear()
     ui.banner()
-    ui.console.print("[bold]Vocabulary Drill[/bold]\n")
+    ui.show_title("Vocabulary Quiz" if multiple_choice else "Vocabulary Drill")
 
     # Let user pick category or all
     options = ["All Categories"] + categories
-    choice = ui.menu(options)
+    now = srs.clock()
+    counts = []
+    for cat in categories:
+        deck = srs.partition_counts(f"vocab:{cat}", now)
+        counts.append((deck["due"], max(0, len(data[cat]) - deck["seen"])))
+    choice = ui.menu(options, ui.deck_notes(counts))
 
     if choice == 0:
         selected_categories = categories
@@ -37,26 +56,27 @@ def run_drill(srs: SRSEngine, session_size: int = 15):
         selected_categories = [categories[choice - 1]]
 
     # Build card pool
-    pool = []
-    for cat in selected_categories:
-        for i, entry in enumerate(data[cat]):
-            pool.append((card_id(cat, i), cat, entry))
+    with perf.span("vocab.pool"):
+        pool = []
+        for cat in selected_categories:
+            for i, entry in enumerate(data[cat]):
+                pool.append((card_id(cat, i), cat, entry))
 
-    all_ids = [cid for cid, _, _ in pool]
-    due_ids = set(srs.get_due_cards(all_ids))
+        all_ids = [cid for cid, _, _ in pool]
+        due_ids = set(srs.get_due_cards(all_ids))
 
-    # Prioritize due cards, then fill with others
-    due_pool = [item for item in pool if item[0] in due_ids]
-    random.shuffle(due_pool)
-    session_cards = due_pool[:session_size]
+        # Prioritize due cards, then fill with others
+        due_pool = [item for item in pool if item[0] in due_ids]
+        random.shuffle(due_pool)
+        session_cards = due_pool[:session_size]
 
-    if len(session_cards) < session_size:
-        rest = [item for item in pool if item[0] not in due_ids]
-        random.shuffle(rest)
-        session_cards.extend(rest[:session_size - len(session_cards)])
+        if len(session_cards) < session_size:
+            rest = [item for item in pool if item[0] not in due_ids]
+            random.shuffle(rest)
+            session_cards.extend(rest[:session_size - len(session_cards)])
 
     if not session_cards:
-        ui.console.print("[dim]No cards available.[/dim]")
+        ui.show_notice("No cards available.")
         ui.pause()
         return
 
@@ -65,51 +85,117 @@ def run_drill(srs: SRSEngine, session_size: int = 15):
 
     for cid, cat, entry in session_cards:
         ui.clear()
-        ui.console.print(f"[dim]{cat}[/dim]  [dim]({reviewed + 1}/{len(session_cards)})[/dim]\n")
-
-        korean = entry["korean"]
-        english = entry["english"]
-
-        # For "vs" comparison cards, only show Korean → English (no flip)
-        is_comparison = " vs " in korean
+        ui.show_header(cat, reviewed + 1, len(session_cards))
+        shown = srs.clock()
 
-        if is_comparison or random.random() < 0.5:
-            # Korean → English
-            ui.show_card_prompt(korean, hint=entry.get("hanja"))
-            ui.console.print("[dim]What does this mean?[/dim]\n")
-            user_answer = ui.ask("Your answer")
-            if user_answer.strip().lower() == "q":
+        if multiple_choice and " vs " not in entry["korean"]:
+            picked = present_choice(entry, cat, int(cid.rsplit(":", 1)[1]))
+            if picked is None:
                 break
-            ui.console.print()
-            ui.show_answer(english, explanation=entry.get("notes"))
+            latency = srs.clock() - shown  # up to the pick, not the time spent reading the result
+            rating = GOOD if picked else AGAIN
+            ui.pause()
         else:
-            # English → Korean
-            ui.show_card_prompt(english)
-            ui.console.print("[dim]What is this in Korean?[/dim]\n")
-            user_answer = ui.ask("Your answer")
-            if user_answer.strip().lower() == "q":
+            if not present_card(entry, cid):
                 break
-            ui.console.print()
-            ui.show_answer(korean, explanation=entry.get("notes"))
 
-        # Show hanja breakdown if available
-        if "breakdown" in entry:
-            ui.show_breakdown(entry["breakdown"])
-
-        # Show example
-        if "example" in entry:
-            ui.show_example(entry["example"], entry.get("example_en"))
-
-        # Self-rating
-        rating = ui.rating_prompt()
-        if rating is None:
-            break
+            # Self-rating
+            rating = ui.rating_prompt()
+            if rating is None:
+                break
+            latency = srs.clock() - shown
 
-        srs.record_review(cid, rating)
+        srs.record_review(cid, rating, latency=latency)
         reviewed += 1
         if rating >= GOOD:
             correct += 1
 
-    ui.console.print()
+    ui.newline()
     ui.show_session_summary(reviewed, correct)
     ui.pause()
+
+
+def present_choice(entry: dict, category: str, idx: int) -> bool | None:
+    """Quiz one vocab entry as multiple choice. Returns whether the pick was right, None if the user quit.
+
+    The result stays on screen; the caller pauses once it has timed the pick.
+    Comparison (" vs ") cards have no single answer to pick; run_drill shows those with present_card.
+    """
+    options = [entry, *distractors.choices(category, idx)]
+    random.shuffle(options)
+
+    if random.random() < 0.5:
+        # Korean → English
+        ui.show_card_prompt(entry["korean"], hint=entry.get("hanja"))
+        ui.show_instruction("What does this mean?")
+        field = "english"
+    else:
+        # English → Korean
+        ui.show_card_prompt(entry["english"])
+        ui.show_instruction("What is this in Korean?")
+        field = "korean"
+    for i, option in enumerate(options, 1):
+        ui.show_notice(f"  {i}. {option[field]}")
+    ui.newline()
+
+    while True:
+        choice = ui.ask(f"Your choice (1-{len(options)})").strip().lower()
+        if choice == "q":
+            return None
+        if choice.isdigit() and 1 <= int(choice) <= len(options):
+            break
+    picked = options[int(choice) - 1] is entry
+
+    ui.newline()
+    ui.show_result(picked, entry[field], entry.get("notes"))
+    if "breakdown" in entry:
+        ui.show_breakdown(entry["breakdown"])
+    if "example" in entry:
+        ui.show_example(entry["example"], entry.get("example_en"))
+    return picked
+
+
+def present_card(entry: dict, cid: str | None = None) -> bool:
+    """Quiz one vocab entry and reveal the answer. Returns False if the user quit.
+
+    With the card id, sentences from the drill texts that use the word are shown too.
+    """
+    korean = entry["korean"]
+    english = entry["english"]
+
+    # For "vs" comparison cards, only show Korean → English (no flip)
+    is_comparison = " vs " in korean
+
+    if is_comparison or random.random() < 0.5:
+        # Korean → English
+        ui.show_card_prompt(korean, hint=entry.get("hanja"))
+        ui.show_instruction("What does this mean?")
+        user_answer = ui.ask("Your answer")
+        if user_answer.strip().lower() == "q":
+            return False
+        ui.newline()
+        ui.show_answer(english, explanation=entry.get("notes"))
+    else:
+        # English → Korean
+        ui.show_card_prompt(english)
+        ui.show_instruction("What is this in Korean?")
+        user_answer = ui.ask("Your answer")
+        if user_answer.strip().lower() == "q":
+            return False
+        ui.newline()
+        ui.show_answer(korean, explanation=entry.get("notes"))
+
+    # Show hanja breakdown if available
+    if "breakdown" in entry:
+        ui.show_breakdown(entry["breakdown"])
+
+    # Show example
+    if "example" in entry:
+        ui.show_example(entry["example"], entry.get("example_en"))
+
+    if cid is not None:
+        examples = xref.seen_in(cid, exclude=entry.get("example"))
+        if examples:
+            ui.show_seen_in(examples)
+
+    return True
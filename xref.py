@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""Cross-reference index: where each vocab headword appears in the drill texts.
+
+Every vocab ``korean`` headword is reduced to one or more match keys (the
+noun root of a 하다/되다 verb, the stem of other verbs, the word itself for
+nouns; each side of an "A vs B" card) and all keys go into a single
+Aho-Corasick automaton. One pass over each passage of the reading, dialogue,
+error-correction and grammar-in-context drills then finds every headword at
+once. A hit only counts at the start of a word, and what follows it in that
+word must be a particle or ending the key allows — so 결정 matches 결정을
+and 결정했다 but not 결정체, and 사과 does not match inside 사과나무.
+
+The result, card id -> sentences, is cached in .cache/ with a hash per data
+file. When a drill file changes only that file is rescanned; when vocab.json
+changes every file is.
+
+    python xref.py              # precompute the cache
+    python xref.py 결정         # show where a headword appears
+"""
+
+import argparse
+import re
+from collections import deque
+from pathlib import Path
+
+import bundle
+import perf
+import vocab
+
+DATA_DIR = bundle.ROOT / "data"
+CACHE_FILE = bundle.CACHE_DIR / "xref.json"
+RULES_VERSION = 1  # bump when matching changes, to invalidate the cache
+MAX_HITS = 5       # sentences kept per card and source file
+
+# Particles (and copula forms) that may follow a noun, alone or chained: 에서도, 이라는
+PARTICLES = (
+    "이", "가", "은", "는", "을", "를", "에", "에서", "에게", "께", "한테", "의", "도", "만",
+    "으로", "로", "와", "과", "랑", "이랑", "나", "이나", "까지", "부터", "보다", "처럼", "마다",
+    "조차", "밖에", "라도", "이라도", "인", "일", "이다", "다", "이라", "라", "이라는", "라는",
+    "이라고", "라고", "이며", "며", "입니다", "이에요", "예요", "이었", "였", "고", "서",
+)
+# Verb/adjective endings a noun root takes: 결정 + 했다, 결정 + 되는, 모순 + 적인
+NOUN_DERIVATIONS = (
+    "하", "한", "할", "함", "합", "해", "했", "되", "된", "될", "됨", "됩", "돼", "됐",
+    "적", "스러", "스럽", "스런", "롭", "로운", "시키", "시킨", "시켜", "시켰",
+)
+
+_HANGUL = re.compile(r"[가-힣]")
+_WORD_TAIL = re.compile(r"[가-힣]*")
+_SENTENCE = re.compile(r"\S.*?(?:[.!?](?=\s|$)|$)")
+_PARENS = re.compile(r"\([^)]*\)")
+
+
+def headword_keys(korean: str) -> list[tuple[str, bool]]:
+    """Match keys for a headword, each with whether any ending may follow it."""
+    keys = []
+    for part in korean.split(" vs "):
+        part = " ".join(_PARENS.sub("", part).split())
+        if not part or part.startswith("~") or "/" in part:
+            continue  # grammar patterns, not words
+        if part.endswith(("하다", "되다")) and len(part) > 2:
+            key, verbal = part[:-2], False
+        elif part.endswith("다"):
+            key, verbal = part[:-1], True
+        else:
+            key, verbal = part, False
+        if len(key.replace(" ", "")) >= 2:
+            keys.append((key, verbal))
+    return keys
+
+
+def _is_particles(tail: str, depth: int = 3) -> bool:
+    if not tail:
+        return True
+    if depth == 0:
+        return False
+    return any(tail.startswith(p) and _is_particles(tail[len(p):], depth - 1) for p in PARTICLES)
+
+
+def _allowed(tail: str, verbal: bool) -> bool:
+    return verbal or tail.startswith(NOUN_DERIVATIONS) or _is_particles(tail)
+
+
+class Automaton:
+    """Aho-Corasick matcher over a fixed set of strings."""
+
+    def __init__(self, words):
+        self.goto: list[dict[str, int]] = [{}]
+        self.fail: list[int] = [0]
+        self.out: list[list[str]] = [[]]
+        for word in words:
+            state = 0
+            for ch in word:
+                nxt = self.goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][ch] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.out.append([])
+                state = nxt
+            if word not in self.out[state]:
+                self.out[state].append(word)
+
+        # Breadth-first: a state's failure link is the longest proper suffix in the trie
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self.goto[state].items():
+                queue.append(nxt)
+                f = self.fail[state]
+                while f and ch not in self.goto[f]:
+                    f = self.fail[f]
+                target = self.goto[f].get(ch, 0)
+                self.fail[nxt] = target if target != nxt else 0
+                self.out[nxt] = self.out[nxt] + self.out[self.fail[nxt]]
+
+    def search(self, text: str):
+        """Yield (start, word) for every occurrence of every word in *text*."""
+        goto, fail, out = self.goto, self.fail, self.out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for word in out[state]:
+                yield i + 1 - len(word), word
+
+
+# Drill passages, per source file: (where, text)
+
+def _reading(data):
+    for i, drill in enumerate(data, 1):
+        yield f"Reading {i}", drill["passage"]
+
+
+def _dialogue(data):
+    for drill in data:
+        for turn in drill["turns"]:
+            yield f"Dialogue: {drill['title']}", turn["line"]
+
+
+def _errors(data):
+    for drill in data:
+        yield "Error drill", drill["correct"]
+
+
+def _context(data):
+    for drill in data:
+        yield "Grammar in context", drill["passage"]
+
+
+SOURCES = {
+    "reading_drills.json": _reading,
+    "dialogue_drills.json": _dialogue,
+    "error_drills.json": _errors,
+    "grammar_context.json": _context,
+}
+
+
+class _Keys:
+    """The automaton over every vocab headword, and which cards each key stands for."""
+
+    def __init__(self, data: dict[str, list[dict]]):
+        self.cards: dict[str, list[tuple[str, bool]]] = {}
+        for cat, entries in data.items():
+            for i, entry in enumerate(entries):
+                for key, verbal in headword_keys(entry["korean"]):
+                    self.cards.setdefault(key, []).append((vocab.card_id(cat, i), verbal))
+        self.automaton = Automaton(self.cards)
+
+
+def scan(passages, keys: _Keys) -> dict[str, list[list[str]]]:
+    """Card id -> [[sentence, where], ...] for the headwords found in *passages*."""
+    hits: dict[str, list[list[str]]] = {}
+    for where, text in passages:
+        text = " ".join(text.split())
+        sentences = [(m.start(), m.group()) for m in _SENTENCE.finditer(text)]
+        for start, key in keys.automaton.search(text):
+            if start and _HANGUL.match(text[start - 1]):
+                continue  # not at the start of a word
+            tail = _WORD_TAIL.match(text, start + len(key)).group()
+            sentence = next(s for pos, s in reversed(sentences) if pos <= start)
+            for cid, verbal in keys.cards[key]:
+                if not _allowed(tail, verbal):
+                    continue
+                found = hits.setdefault(cid, [])
+                if len(found) < MAX_HITS and [sentence, where] not in found:
+                    found.append([sentence, where])
+    return hits
+
+
+def _digest(path: Path) -> str:
+    return f"v{RULES_VERSION}:{bundle.digest(path)}"
+
+
+def _fingerprint() -> tuple:
+    paths = [vocab.DATA_FILE] + [DATA_DIR / name for name in SOURCES]
+    return tuple(bundle.mtime_ns(p) if bundle.exists(p) else None for p in paths)
+
+
+_index: tuple[tuple, dict[str, list[list[str]]]] | None = None  # (file mtimes, card id -> hits)
+
+
+@perf.timed("content.xref_index")
+def index() -> dict[str, list[list[str]]]:
+    """Card id -> [[sentence, where], ...] for every vocab card seen in a drill text."""
+    global _index
+    fingerprint = _fingerprint()
+    if _index is not None and _index[0] == fingerprint:
+        return _index[1]
+
+    cached = bundle.read_cache(CACHE_FILE) or {}
+    vocab_key = _digest(vocab.DATA_FILE)
+    if cached.get("vocab") != vocab_key:
+        cached = {"vocab": vocab_key, "sources": {}}
+
+    keys = None
+    changed = False
+    for name, passages in SOURCES.items():
+        path = DATA_DIR / name
+        key = _digest(path) if bundle.exists(path) else None
+        if cached["sources"].get(name, {}).get("key") == key:
+            continue
+        if keys is None:
+            keys = _Keys(vocab.load_vocab())
+        hits = scan(passages(bundle.load_json(path)), keys) if key else {}
+        cached["sources"][name] = {"key": key, "hits": hits}
+        changed = True
+    if changed:
+        bundle.write_cache(CACHE_FILE, cached)
+
+    merged: dict[str, list[list[str]]] = {}
+    for name in SOURCES:
+        for cid, hits in cached["sources"].get(name, {}).get("hits", {}).items():
+            merged.setdefault(cid, []).extend(hits)
+    _index = (fingerprint, merged)
+    return merged
+
+
+def seen_in(card_id: str, limit: int = 2, exclude: str | None = None) -> list[tuple[str, str]]:
+    """Up to *limit* (sentence, where) pairs for a vocab card, skipping *exclude*."""
+    hits = [(s, where) for s, where in index().get(card_id, ()) if s != exclude]
+    return hits[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vocab headword -> drill passage index.")
+    parser.add_argument("word", nargs="?", help="headword to look up; omit to just build")
+    args = parser.parse_args()
+
+    hits = index()
+    if args.word is None:
+        total = sum(len(v) for v in hits.values())
+        print(f"{len(hits)} cards seen in drill texts, {total} sentences -> {CACHE_FILE}")
+        return
+
+    for cat, entries in vocab.load_vocab().items():
+        for i, entry in enumerate(entries):
+            if args.word in entry["korean"]:
+                print(f"{entry['korean']} ({cat})")
+                for sentence, where in hits.get(vocab.card_id(cat, i), []):
+                    print(f"  {sentence}  [{where}]")
+
+
+if __name__ == "__main__":
+    main()